@@ -1,32 +1,45 @@
 # pylint: disable=C0330
-import csv
-from typing import List, Tuple
+import random
+from typing import Iterable, Iterator, List, Tuple
 
 from django import forms
 from django.conf import settings
 from django.contrib import admin
 from django.db import transaction
+from django.db.models import F
 from django.db.models.query import QuerySet
-from django.http import HttpRequest, HttpResponse
-from django.template.loader import render_to_string
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+from django.template.response import TemplateResponse
+from django.urls import path
 from django.utils import timezone
-from django.utils.html import strip_tags
 from django.contrib.admin.filters import RelatedOnlyFieldListFilter
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
 from django_admin_listfilter_dropdown.filters import (
     DropdownFilter,
     ChoiceDropdownFilter,
 )
 from rangefilter.filter import DateRangeFilter
 
+from application import admission, decisions, stats
 from application.emails import send_confirmation_email
+from application.resume_book import resume_book
 from application.models import (
     Application,
+    CHECK_IN_QUEUED,
+    CHECK_IN_SENT,
+    DiscordCheckIn,
     Wave,
-    STATUS_ADMITTED,
-    STATUS_REJECTED,
     RACES,
+    GENDERS,
+    LEVEL_OF_STUDY,
+    SHIRT_SIZES,
+    STATUS_OPTIONS,
 )
-from shared.admin_functions import send_mass_html_mail
+from shared.admin_functions import EXPORT_CHUNK_SIZE, stream_csv
+from shared.paginators import LargeTablePaginator
+from shared.batch_mail import BatchMailTemplate
+from shared.outbox import enqueue_mass_html_mail
 
 
 class ApplicationAdminForm(forms.ModelForm):
@@ -39,6 +52,22 @@ class ApplicationAdminForm(forms.ModelForm):
             "status": forms.RadioSelect,
         }
 
+
+APPROVAL_EMAIL = BatchMailTemplate(
+    "application/emails/approved.html",
+    "Your Hacklahoma application has been approved!",
+    slots=["first_name", "confirmation_deadline"],
+    event_name="Hacklahoma",
+)
+
+REJECTION_EMAIL = BatchMailTemplate(
+    "application/emails/rejected.html",
+    "Regarding your Hacklahoma application",
+    slots=["first_name"],
+    event_name="Hacklahoma",
+)
+
+
 # Build the approval email from the template
 def build_approval_email(
     application: Application, confirmation_deadline: timezone.datetime
@@ -47,16 +76,11 @@ def build_approval_email(
     Creates a datatuple of (subject, message, html_message, from_email, [to_email]) indicating that a `User`'s
     application has been approved.
     """
-    subject = f"Your Hacklahoma application has been approved!"
-
-    context = {
-        "first_name": application.first_name,
-        "event_name": "Hacklahoma",
-        "confirmation_deadline": confirmation_deadline,
-    }
-    html_message = render_to_string("application/emails/approved.html", context)
-    message = strip_tags(html_message)
-    return subject, message, html_message, None, [application.user.email]
+    return APPROVAL_EMAIL.build(
+        application.user.email,
+        first_name=application.first_name,
+        confirmation_deadline=confirmation_deadline,
+    )
 
 
 def build_rejection_email(application: Application) -> Tuple[str, str, None, List[str]]:
@@ -64,63 +88,202 @@ def build_rejection_email(application: Application) -> Tuple[str, str, None, Lis
     Creates a datatuple of (subject, message, html_message, from_email, [to_email]) indicating that a `User`'s
     application has been rejected.
     """
-    subject = f"Regarding your Hacklahoma application"
+    return REJECTION_EMAIL.build(
+        application.user.email, first_name=application.first_name
+    )
 
-    context = {"first_name": application.first_name, "event_name": "Hacklahoma"}
-    html_message = render_to_string("application/emails/rejected.html", context)
-    message = strip_tags(html_message)
-    return subject, message, html_message, None, [application.user.email]
 
+def build_approval_emails(
+    applications: Iterable[Application],
+) -> Iterator[Tuple[str, Tuple[str, str, str, None, List[str]]]]:
+    """
+    Lazily yields (idempotency_key, datatuple) pairs for the approval emails of the given (already-admitted)
+    applications, so that only one rendered email is held in memory at a time.
+    """
+    for application in applications:
+        deadline = application.confirmation_deadline
+        yield (
+            "approval:%s:%s" % (application.pk, deadline.date()),
+            build_approval_email(application, deadline),
+        )
 
-def approve(_modeladmin, _request: HttpRequest, queryset: QuerySet) -> None:
+
+def build_rejection_emails(
+    applications: Iterable[Application],
+) -> Iterator[Tuple[str, Tuple[str, str, str, None, List[str]]]]:
+    """
+    Lazily yields (idempotency_key, datatuple) pairs for the rejection emails of the given applications. Keys include
+    the date of the decision, so that rejecting an application again after it was re-admitted sends a new email.
+    """
+    decided = timezone.now().date()
+    for application in applications:
+        yield (
+            "rejection:%s:%s" % (application.pk, decided),
+            build_rejection_email(application),
+        )
+
+
+def approve(
+    _modeladmin, _request: HttpRequest, queryset: QuerySet
+) -> decisions.DecisionResult:
     """
     Sets the value of the `approved` field for the selected `Application`s to `True`, creates an RSVP deadline for
-    each user based on how many days each wave gives to RSVP, and then emails all of the users to inform them that
-    their applications have been approved.
+    each user based on how many days each wave gives to RSVP, and then queues emails to all of the users to inform
+    them that their applications have been approved.
     """
-    email_tuples = []
     with transaction.atomic():
-        for application in queryset:
-            deadline = timezone.now().replace(
-                hour=23, minute=59, second=59, microsecond=0
-            ) + timezone.timedelta(application.wave.num_days_to_rsvp)
-            application.status = STATUS_ADMITTED
-            application.confirmation_deadline = deadline
-            email_tuples.append(build_approval_email(application, deadline))
-            application.save()
-    send_mass_html_mail(email_tuples)
-
-
-def reject(_modeladmin, _request: HttpRequest, queryset: QuerySet) -> None:
+        result = decisions.admit(queryset)
+        enqueue_mass_html_mail(build_approval_emails(result.applications))
+    return result
+
+
+def reject(
+    _modeladmin, _request: HttpRequest, queryset: QuerySet
+) -> decisions.DecisionResult:
+    """
+    Sets the value of the `approved` field for the selected `Application`s to `False`, and queues emails to inform
+    the users.
+    """
+    with transaction.atomic():
+        result = decisions.reject(queryset)
+        enqueue_mass_html_mail(build_rejection_emails(result.applications))
+    return result
+
+
+def approve_in_batches(pks: List) -> int:
     """
-    Sets the value of the `approved` field for the selected `Application`s to `False`
+    Approves (see `approve`) the applications with the given primary keys in a single transaction, a batch at a
+    time, so that no statement has too many parameters. Returns the number of applications approved.
     """
-    email_tuples = []
+    approved = 0
     with transaction.atomic():
-        for application in queryset:
-            application.status = STATUS_REJECTED
-            email_tuples.append(build_rejection_email(application))
-            application.save()
-    send_mass_html_mail(email_tuples)
+        for start in range(0, len(pks), decisions.UPDATE_BATCH_SIZE):
+            end = start + decisions.UPDATE_BATCH_SIZE
+            batch = pks[start:end]
+            approved += approve(
+                None, None, Application.objects.filter(pk__in=batch)
+            ).total
+    return approved
+
+
+class AdmissionPlanForm(forms.Form):
+    target = forms.IntegerField(min_value=1, label="Target headcount")
+    keep_teams = forms.BooleanField(required=False, label="Keep teams together")
+    # The seed is carried from the plan to its confirmation, so that the same applications are admitted.
+    seed = forms.IntegerField(widget=forms.HiddenInput)
+
+
+def admit_to_capacity(modeladmin, request: HttpRequest, queryset: QuerySet):
+    """
+    Admits pending applications among the selected ones until the expected headcount reaches a target (see
+    `application.admission`). The plan is shown first, and applications are only admitted once it's confirmed.
+    """
+    submitted = "plan" in request.POST or "apply" in request.POST
+    form = AdmissionPlanForm(
+        request.POST if submitted else None,
+        initial={"seed": random.randrange(2 ** 31)},
+    )
+    plan = None
+    if form.is_valid():
+        plan = admission.plan_admissions(
+            form.cleaned_data["target"],
+            candidates=queryset,
+            keep_teams=form.cleaned_data["keep_teams"],
+            seed=form.cleaned_data["seed"],
+        )
+        if "apply" in request.POST:
+            approved = approve_in_batches(plan.pks)
+            modeladmin.message_user(
+                request,
+                "Admitted %s applications, for an expected headcount of %.0f."
+                % (approved, plan.total_expected),
+            )
+            return None
+
+    context = {
+        **modeladmin.admin_site.each_context(request),
+        "opts": modeladmin.model._meta,
+        "title": "Admit to capacity",
+        "form": form,
+        "plan": admission.describe(plan) if plan else None,
+        "selected": request.POST.getlist(ACTION_CHECKBOX_NAME),
+        "select_across": request.POST.get("select_across", "0"),
+    }
+    return TemplateResponse(request, "admin/application/admission_plan.html", context)
 
 
 def resend_confirmation(_modeladmin, _request: HttpRequest, queryset: QuerySet) -> None:
     """
     Resends the confirmation email to the selected applications.
     """
-    for application in queryset:
+    for application in queryset.select_related("user"):
         send_confirmation_email(application)
 
+
+# Display labels for the values of each statistics dimension (see `ApplicationAdmin.statistics_view`).
+STATISTIC_LABELS = {
+    "gender": GENDERS,
+    "level_of_study": LEVEL_OF_STUDY,
+    "shirt_size": SHIRT_SIZES,
+    "total": [("", "All applications")],
+}
+
+STUDY_NAMES = {
+    "H": "High School",
+    "T": "Tech School",
+    "U": "Undergrad University",
+    "G": "Graduate University",
+}
+
+
+def _school_name(school_name: str, school_other: str) -> str:
+    return school_other if school_name == "Other" else school_name
+
+
 def interested_in_hacklahoma_export(_modeladmin, _request: HttpRequest, queryset: QuerySet):
     """
     Exports the emails of selected users interested in Hacklahoma
     """
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="emails.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
+    rows = (
+        queryset.filter(
+            interested_in_hacklahoma=True, school__name="University of Oklahoma"
+        )
+        .values_list(
+            "first_name",
+            "last_name",
+            "user__email",
+            "phone_number",
+            "level_of_study",
+            "school__name",
+            "school_other",
+            "graduation_year",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    return stream_csv(
+        "emails.csv",
+        (
+            [
+                first_name,
+                last_name,
+                email,
+                phone_number,
+                STUDY_NAMES.get(level_of_study),
+                _school_name(school_name, school_other),
+                graduation_year,
+            ]
+            for (
+                first_name,
+                last_name,
+                email,
+                phone_number,
+                level_of_study,
+                school_name,
+                school_other,
+                graduation_year,
+            ) in rows
+        ),
+        header=[
             "First Name",
             "Last Name",
             "E-Mail",
@@ -129,158 +292,120 @@ def interested_in_hacklahoma_export(_modeladmin, _request: HttpRequest, queryset
             "School",
             "Anticipated Graduation Year",
             "Resume"
-        ]
+        ],
     )
-    for instance in queryset:
-        instance: Application = instance
-
-        if instance.interested_in_hacklahoma == True and str(instance.school) == "University of Oklahoma":
-            school = None
-
-            if str(instance.school) == "Other":
-                school = instance.school_other
-            else:
-                school = instance.school
-
-            study_switch = {
-                "H": "High School",
-                "T": "Tech School",
-                "U": "Undergrad University",
-                "G": "Graduate University"
-            }
-
-            writer.writerow(
-                [
-                    instance.first_name,
-                    instance.last_name,
-                    instance.user.email,
-                    instance.phone_number,
-                    study_switch.get(instance.level_of_study),
-                    school,
-                    instance.graduation_year
-                ]
-            )
-
-    return response
 
 
 def export_application_emails(_modeladmin, _request: HttpRequest, queryset: QuerySet):
     """
     Exports the emails related to the selected `Application`s to a CSV file
     """
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="emails.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
+    rows = queryset.values_list(
+        "first_name",
+        "last_name",
+        "user__email",
+        "phone_number",
+        "school__name",
+        "school_other",
+        "level_of_study",
+    ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return stream_csv(
+        "emails.csv",
+        (
+            [
+                first_name,
+                last_name,
+                email,
+                phone_number,
+                _school_name(school_name, school_other),
+                STUDY_NAMES.get(level_of_study),
+            ]
+            for (
+                first_name,
+                last_name,
+                email,
+                phone_number,
+                school_name,
+                school_other,
+                level_of_study,
+            ) in rows
+        ),
+        header=[
             "First Name",
             "Last Name",
             "E-Mail",
             "Phone Number",
             "School Name",
             "Level Of Study"
-        ]
+        ],
     )
-    for instance in queryset:
-        instance: Application = instance
-        school = None
-
-        if str(instance.school) == "Other":
-            school = instance.school_other
-        else:
-            school = instance.school
-
-        study_switch = {
-            "H": "High School",
-            "T": "Tech School",
-            "U": "Undergrad University",
-            "G": "Graduate University"
-        }
 
-        writer.writerow(
-            [
-                instance.first_name,
-                instance.last_name,
-                instance.user.email,
-                instance.phone_number,
-                school,
-                study_switch.get(instance.level_of_study)
-            ]
-        )
-
-    return response
 
 def export_application_tshirts(_modeladmin, _request: HttpRequest, queryset: QuerySet):
     """
     Exports the data needed to ship out tshirts and other swag
     """
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="deets.csv"'
-
-    
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
+    rows = (
+        queryset.filter(shipping_address=True, checked_in=True)
+        .values_list(
+            "first_name",
+            "last_name",
+            "gender",
+            "gender_other",
+            "major",
+            "graduation_year",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    return stream_csv(
+        "deets.csv",
+        (
+            [
+                first_name,
+                last_name,
+                gender_other if gender == "Other" else gender,
+                major,
+                graduation_year,
+            ]
+            for (
+                first_name,
+                last_name,
+                gender,
+                gender_other,
+                major,
+                graduation_year,
+            ) in rows
+        ),
+        header=[
             "First Name",
             "Last Name",
             "Gender",
             "Major",
             "Graduation Year"
-        ]
+        ],
     )
 
-    gender = None
-
-    for instance in queryset:
-        instance: Application = instance
-
-        if str(instance.gender) == "Other":
-            gender = instance.gender_other
-        else:
-            gender = instance.gender
-
-        if instance.shipping_address == True and instance.checked_in == True:
-            writer.writerow(
-                [
-                    instance.first_name,
-                    instance.last_name,
-                    gender,
-                    instance.major,
-                    instance.graduation_year
-                ] 
-            )
-
-
-    return response
 
 def export_application_prizes(_modeladmin, _request: HttpRequest, queryset: QuerySet):
     """
     Exports the prizes 
     """
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="prizes.csv"'
-
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "First Name",
-            "Last Name",
-            "Prizes"
-        ]
+    rows = queryset.values_list("first_name", "last_name", "question3").iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    )
+    return stream_csv(
+        "prizes.csv", rows, header=["First Name", "Last Name", "Prizes"]
     )
-    for instance in queryset:
-        instance: Application = instance
 
-        writer.writerow(
-            [
-                instance.first_name,
-                instance.last_name,
-                instance.question3
-            ]
-        )
 
+def export_resume_book(_modeladmin, _request: HttpRequest, queryset: QuerySet):
+    """
+    Exports the resumes of the selected `Application`s as a ZIP file, with an index of the hackers they belong to
+    """
+    response = StreamingHttpResponse(
+        resume_book(queryset), content_type="application/zip"
+    )
+    response["Content-Disposition"] = 'attachment; filename="resumes.zip"'
     return response
 
 
@@ -393,9 +518,15 @@ class ApplicationAdmin(admin.ModelAdmin):
         ("Discord", {"fields":["discord_id","checked_in"]}),
     ]
     list_per_page = 2000
+    list_select_related = ("user", "school", "wave")
+    # Skip the unfiltered COUNT(*) shown next to filtered results, and estimate the count of very large
+    # unfiltered changelists instead of counting them.
+    show_full_result_count = False
+    paginator = LargeTablePaginator
 
     approve.short_description = "Approve Selected Applications"
     reject.short_description = "Reject Selected Applications"
+    admit_to_capacity.short_description = "Admit Selected Applications to Capacity"
     export_application_emails.short_description = (
         "Export Emails for Selected Applications"
     )
@@ -411,8 +542,20 @@ class ApplicationAdmin(admin.ModelAdmin):
     export_application_prizes.short_description = (
         "Export Application Prizes"
     )
-
-    actions = [approve, reject, export_application_emails, resend_confirmation, export_application_tshirts, interested_in_hacklahoma_export, export_application_prizes]
+    export_resume_book.short_description = (
+        "Export Resume Book of Selected Applications"
+    )
+    actions = [
+        approve,
+        reject,
+        admit_to_capacity,
+        export_application_emails,
+        resend_confirmation,
+        export_application_tshirts,
+        interested_in_hacklahoma_export,
+        export_application_prizes,
+        export_resume_book,
+    ]
 
     def has_add_permission(self, request):
         return True
@@ -420,18 +563,102 @@ class ApplicationAdmin(admin.ModelAdmin):
     def has_change_permission(self, request, obj=None):
         return True
 
-    @staticmethod
-    def user_email(obj: Application) -> str:
-        return obj.user.email
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("user", "school", "wave")
+            .annotate(
+                user_email=F("user__email"), is_walk_in=F("wave__is_walk_in_wave")
+            )
+        )
 
-    @staticmethod
-    def is_a_walk_in(obj: Application) -> bool:
-        return obj.wave.is_walk_in_wave
+    def user_email(self, obj: Application) -> str:
+        return obj.user_email
+
+    user_email.admin_order_field = "user_email"
+
+    def is_a_walk_in(self, obj: Application) -> bool:
+        return obj.is_walk_in
+
+    is_a_walk_in.admin_order_field = "is_walk_in"
+    is_a_walk_in.boolean = True
+
+    def get_urls(self):
+        info = self.model._meta.app_label, self.model._meta.model_name
+        return [
+            path(
+                "statistics/",
+                self.admin_site.admin_view(self.statistics_view),
+                name="%s_%s_statistics" % info,
+            ),
+            path(
+                "statistics.json",
+                self.admin_site.admin_view(self.statistics_json_view),
+                name="%s_%s_statistics_json" % info,
+            ),
+        ] + super().get_urls()
+
+    def statistics_view(self, request: HttpRequest) -> TemplateResponse:
+        """
+        Shows the registration statistics (see `application.stats`) as one table per dimension, with a column per
+        status.
+        """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        tables = []
+        for dimension, values in stats.statistics().items():
+            labels = dict(STATISTIC_LABELS.get(dimension, []))
+            rows = [
+                (
+                    labels.get(value, value) or "(blank)",
+                    [counts.get(status, 0) for status, _ in STATUS_OPTIONS],
+                    sum(counts.values()),
+                )
+                for value, counts in sorted(values.items())
+            ]
+            tables.append((dimension.replace("_", " ").capitalize(), rows))
+        context = {
+            **self.admin_site.each_context(request),
+            "opts": self.model._meta,
+            "title": "Registration statistics",
+            "statuses": [label for _, label in STATUS_OPTIONS],
+            "tables": tables,
+        }
+        return TemplateResponse(request, "admin/application/statistics.html", context)
+
+    def statistics_json_view(self, request: HttpRequest) -> JsonResponse:
+        """
+        Returns the registration statistics as {dimension: {value: {status: count}}}.
+        """
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        return JsonResponse(stats.statistics())
 
 
 class WaveAdmin(admin.ModelAdmin):
     list_display = ("start", "end", "is_walk_in_wave")
 
 
+def requeue_check_ins(_modeladmin, _request: HttpRequest, queryset: QuerySet) -> None:
+    """
+    Queues the selected (unsent) Discord check-ins to be sent again immediately.
+    """
+    queryset.exclude(status=CHECK_IN_SENT).update(
+        status=CHECK_IN_QUEUED, attempts=0, next_attempt_at=timezone.now()
+    )
+
+
+class DiscordCheckInAdmin(admin.ModelAdmin):
+    list_display = ("name", "discord_id", "status", "attempts", "created_at", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("discord_id", "name")
+    readonly_fields = ("created_at", "sent_at", "last_error")
+
+    requeue_check_ins.short_description = "Requeue Selected Check-Ins"
+    actions = [requeue_check_ins]
+
+
 admin.site.register(Application, ApplicationAdmin)
 admin.site.register(Wave, WaveAdmin)
+admin.site.register(DiscordCheckIn, DiscordCheckInAdmin)
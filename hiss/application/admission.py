@@ -0,0 +1,203 @@
+"""
+Capacity-aware admission. Given a target headcount, `plan_admissions` estimates how many of the hackers admitted so
+far will attend (using each wave's historical confirm/decline/expire rates), and then picks pending applications at
+random until the expected number of attendees reaches the target.
+
+Applications are picked with weighted reservoir sampling (Efraimidis and Spirakis' A-Res) in a single pass over the
+pending applications: every candidate gets a key of `random() ** (1 / weight)`, and a min-heap holds the candidates
+with the largest keys whose expected attendance covers the remaining seats. When teams are kept together, a team is a
+single candidate weighted by its number of pending members, so that every hacker has the same chance of being picked
+whether or not they're on a team.
+"""
+
+import heapq
+import random
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional
+
+from django.conf import settings
+from django.db.models import Count
+from django.db.models.query import QuerySet
+
+from application.models import (
+    Application,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_CONFIRMED,
+    STATUS_DECLINED,
+    STATUS_EXPIRED,
+    STATUS_PENDING,
+)
+
+ACCEPTED_STATUSES = (STATUS_CONFIRMED, STATUS_CHECKED_IN)
+"""Statuses of admitted hackers who said they're coming."""
+
+DECIDED_STATUSES = ACCEPTED_STATUSES + (STATUS_DECLINED, STATUS_EXPIRED)
+"""Statuses of admitted hackers who have responded to (or ignored) their admission."""
+
+YIELD_PRIOR_WEIGHT = 10
+"""
+How many decided applications the overall yield counts for when estimating a wave's yield, so that waves with little
+history don't get extreme estimates.
+"""
+
+
+class Candidate(NamedTuple):
+    key: float
+    expected: float
+    pks: List
+
+
+class AdmissionPlan(NamedTuple):
+    """
+    The applications to admit to reach `target` expected attendees. `committed` counts the hackers who already
+    confirmed or checked in, `outstanding` is the expected number of attendees among those admitted who haven't
+    responded yet, and `expected` is the expected number of attendees among `pks`. `yields` maps each wave's id to
+    its estimated yield (the fraction of admitted hackers who attend).
+    """
+
+    target: int
+    committed: int
+    outstanding: float
+    yields: Dict[int, float]
+    default_yield: float
+    pks: List
+    expected: float
+    num_pending: int
+    num_teams: int
+
+    @property
+    def total_expected(self) -> float:
+        return self.committed + self.outstanding + self.expected
+
+
+def estimate_yields(counts: Dict[int, Dict[str, int]]) -> Dict[int, float]:
+    """
+    Estimates the yield of each wave from its counts of applications per status, smoothed towards the yield of all
+    waves together (or `settings.ADMISSION_DEFAULT_YIELD` if no admitted hacker has responded yet).
+    """
+    accepted = sum(
+        by_status.get(s, 0) for by_status in counts.values() for s in ACCEPTED_STATUSES
+    )
+    decided = sum(
+        by_status.get(s, 0) for by_status in counts.values() for s in DECIDED_STATUSES
+    )
+    overall = accepted / decided if decided else settings.ADMISSION_DEFAULT_YIELD
+    yields = {None: overall}
+    for wave_id, by_status in counts.items():
+        wave_accepted = sum(by_status.get(s, 0) for s in ACCEPTED_STATUSES)
+        wave_decided = sum(by_status.get(s, 0) for s in DECIDED_STATUSES)
+        yields[wave_id] = (wave_accepted + YIELD_PRIOR_WEIGHT * overall) / (
+            wave_decided + YIELD_PRIOR_WEIGHT
+        )
+    return yields
+
+
+def plan_admissions(
+    target: int,
+    candidates: Optional[QuerySet] = None,
+    keep_teams: bool = False,
+    seed: Optional[int] = None,
+) -> AdmissionPlan:
+    """
+    Picks applications to admit so that the expected number of attendees reaches `target`. Only pending applications
+    in `candidates` (all applications by default) are considered. With `keep_teams`, the pending members of a team
+    are picked (or not) together. Passing the same `seed` for the same applications gives the same plan.
+
+    Runs two queries, regardless of the number of applications.
+    """
+    counts: Dict[int, Dict[str, int]] = defaultdict(dict)
+    for wave_id, status, count in (
+        Application.objects.values_list("wave_id", "status")
+        .annotate(count=Count("pk"))
+        .order_by()
+    ):
+        counts[wave_id][status] = count
+    yields = estimate_yields(counts)
+    default_yield = yields.pop(None)
+
+    committed = sum(
+        by_status.get(s, 0) for by_status in counts.values() for s in ACCEPTED_STATUSES
+    )
+    outstanding = sum(
+        by_status.get(STATUS_ADMITTED, 0) * yields[wave_id]
+        for wave_id, by_status in counts.items()
+    )
+    remaining = target - committed - outstanding
+
+    pending = (
+        candidates if candidates is not None else Application.objects.all()
+    ).filter(status=STATUS_PENDING)
+    # Ordered, so that the same seed assigns the same keys.
+    rows = (
+        pending.values_list("pk", "wave_id", "user__team_id").order_by("pk").iterator()
+    )
+
+    rng = random.Random(seed)
+    heap: List[Candidate] = []
+    heap_expected = 0.0
+    num_pending = 0
+
+    def offer(weight: int, expected: float, pks: List) -> None:
+        nonlocal heap_expected
+        candidate = Candidate(rng.random() ** (1 / weight), expected, pks)
+        if heap_expected < remaining:
+            heapq.heappush(heap, candidate)
+            heap_expected += expected
+        elif candidate.key > heap[0].key:
+            heapq.heappush(heap, candidate)
+            heap_expected += expected
+        else:
+            return
+        # Drop the lowest keys while the rest still cover the remaining seats.
+        while heap and heap_expected - heap[0].expected >= remaining:
+            heap_expected -= heapq.heappop(heap).expected
+
+    teams: Dict = defaultdict(list)
+    for pk, wave_id, team_id in rows:
+        num_pending += 1
+        expected = yields.get(wave_id, default_yield)
+        if keep_teams and team_id is not None:
+            teams[team_id].append((pk, expected))
+        elif remaining > 0:
+            offer(1, expected, [pk])
+    if remaining > 0:
+        for members in teams.values():
+            offer(len(members), sum(e for _, e in members), [pk for pk, _ in members])
+
+    chosen = sorted(heap, reverse=True) if remaining > 0 else []
+    return AdmissionPlan(
+        target=target,
+        committed=committed,
+        outstanding=outstanding,
+        yields=yields,
+        default_yield=default_yield,
+        pks=[pk for candidate in chosen for pk in candidate.pks],
+        expected=sum(candidate.expected for candidate in chosen),
+        num_pending=num_pending,
+        num_teams=(
+            sum(len(candidate.pks) > 1 for candidate in chosen) if keep_teams else 0
+        ),
+    )
+
+
+def describe(plan: AdmissionPlan) -> List[str]:
+    """
+    Returns a human-readable summary of the plan, one line per item.
+    """
+    lines = [
+        "Target headcount: %s" % plan.target,
+        "Already confirmed or checked in: %s" % plan.committed,
+        "Expected from admitted hackers who haven't responded: %.1f" % plan.outstanding,
+    ]
+    for wave_id, rate in sorted(plan.yields.items()):
+        lines.append("Estimated yield for wave %s: %.0f%%" % (wave_id, rate * 100))
+    lines.append("Estimated yield for new waves: %.0f%%" % (plan.default_yield * 100))
+    teams = " (including %s teams)" % plan.num_teams if plan.num_teams else ""
+    lines += [
+        "Applications to admit: %s of %s pending%s"
+        % (len(plan.pks), plan.num_pending, teams),
+        "Expected attendees from them: %.1f" % plan.expected,
+        "Expected headcount: %.1f" % plan.total_expected,
+    ]
+    return lines
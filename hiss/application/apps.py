@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ApplicationConfig(AppConfig):
     name = "application"
+
+    def ready(self):
+        # Registers the signal receivers that keep the registration statistics and status snapshots up to date.
+        # pylint: disable=W0611,C0415
+        from application import snapshots, stats  # noqa: F401
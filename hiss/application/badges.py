@@ -0,0 +1,91 @@
+"""
+Badges are the QR codes that hackers receive in their confirmation email and show at check-in. A badge encodes a
+compact, signed token (not the hacker's personal information). The `renderbadges` management command renders the PNGs
+of admitted hackers' badges ahead of time and keeps them in the database (as `BadgeQRCode`s, addressed by a hash of
+their payload). Confirming and resending emails use a pre-rendered PNG if there is one, and otherwise render it in
+memory (which takes a few milliseconds) rather than waiting on the file storage.
+"""
+
+import hashlib
+import hmac
+import uuid
+from io import BytesIO
+from typing import Iterable, Tuple, TYPE_CHECKING
+
+import pyqrcode
+from django.conf import settings
+
+from shared.badge_tokens import decode_badge_token, encode_badge_token
+
+if TYPE_CHECKING:
+    # Not imported at runtime, so that `render_badge_qr` can run in worker processes without setting up Django.
+    from application.models import Application  # pylint: disable=C0412
+
+
+def badge_signing_key() -> bytes:
+    if settings.BADGE_SIGNING_KEY:
+        return settings.BADGE_SIGNING_KEY.encode()
+    return hmac.new(
+        settings.SECRET_KEY.encode(), b"hiss.badges", hashlib.sha256
+    ).digest()
+
+
+def badge_token(application_id: uuid.UUID) -> str:
+    """
+    Returns the badge token for an application (see `shared.badge_tokens`).
+    """
+    return encode_badge_token(application_id, badge_signing_key())
+
+
+def verify_badge_token(token: str) -> uuid.UUID:
+    """
+    Returns the id of the application a badge token belongs to, raising `InvalidBadgeToken` if it isn't valid.
+    """
+    return decode_badge_token(token, badge_signing_key())
+
+
+def render_badge_qr(token: str) -> bytes:
+    """
+    Renders a badge token as a QR code PNG.
+    """
+    stream = BytesIO()
+    pyqrcode.create(token).png(stream, scale=settings.BADGE_QR_SCALE)
+    return stream.getvalue()
+
+
+def badge_qr_key(token: str) -> str:
+    payload = "%s:%s" % (settings.BADGE_QR_SCALE, token)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def store_badge_qrs(tokens_and_pngs: Iterable[Tuple[str, bytes]]) -> None:
+    """
+    Stores rendered badge QR codes, given (token, PNG) pairs. Codes that were already stored are left alone.
+    """
+    from application.models import BadgeQRCode  # pylint: disable=C0415
+
+    BadgeQRCode.objects.bulk_create(
+        [
+            BadgeQRCode(key=badge_qr_key(token), png=png)
+            for token, png in tokens_and_pngs
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def badge_qr_png(application: "Application") -> bytes:
+    """
+    Returns the QR code PNG for an application's badge: the pre-rendered one if there is one, and otherwise a freshly
+    rendered one (which isn't stored, so that the request never waits on more than one query).
+    """
+    from application.models import BadgeQRCode  # pylint: disable=C0415
+
+    token = badge_token(application.pk)
+    png = (
+        BadgeQRCode.objects.filter(key=badge_qr_key(token))
+        .values_list("png", flat=True)
+        .first()
+    )
+    if png is not None:
+        return bytes(png)
+    return render_badge_qr(token)
@@ -0,0 +1,53 @@
+"""
+A persistent queue of Discord check-ins, drained like the email outbox (see `shared.outbox`). Linking a Discord
+account queues a `DiscordCheckIn` in the same transaction, and the `sendcheckins` management command sends queued
+check-ins to the bot in batches, retrying failures with exponential backoff (see `shared.retry_queue`). Check-ins
+claimed by a worker that died before finishing its batch are claimed again once the claim is
+`DISCORD_CHECK_IN_CLAIM_TIMEOUT_MINUTES` old.
+"""
+
+from typing import Optional, Tuple
+
+from django.utils import timezone
+
+from application import discord
+from application.models import DiscordCheckIn
+from shared.retry_queue import RetryQueue
+
+queue = RetryQueue(DiscordCheckIn, "DISCORD_CHECK_IN")
+
+
+def queue_check_in(
+    discord_id: str, name: str, team_name: Optional[str] = None
+) -> DiscordCheckIn:
+    """
+    Queues a check-in to be sent to the Discord bot. Call it in the same transaction as the check-in itself.
+    """
+    return DiscordCheckIn.objects.create(
+        discord_id=discord_id, name=name, team_name=team_name
+    )
+
+
+def send_queued_check_ins(batch_size: int = 50) -> Tuple[int, int]:
+    """
+    Claims and sends one batch of due check-ins. Check-ins that fail are rescheduled with exponential backoff (or
+    marked as failed once they run out of attempts). Returns a tuple of (sent, failed).
+    """
+    now = timezone.now()
+    check_ins = queue.claim(batch_size, now)
+    if not check_ins:
+        return 0, 0
+
+    client = discord.get_client()
+    sent_pks = []
+    try:
+        for check_in in check_ins:
+            try:
+                client.check_in(check_in.discord_id, check_in.name, check_in.team_name)
+            except discord.DiscordBotError as error:
+                queue.record_failure(check_in, error, now)
+            else:
+                sent_pks.append(check_in.pk)
+    finally:
+        queue.record_sent(sent_pks)
+    return len(sent_pks), len(check_ins) - len(sent_pks)
@@ -0,0 +1,17 @@
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
+
+from application.snapshots import request_status_snapshot
+
+
+def application_status(request: HttpRequest):
+    """
+    Includes the logged-in user's status snapshot (see `application.snapshots`) as `status_snapshot`, loaded only if
+    a template uses it.
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return {}
+    return {
+        "status_snapshot": SimpleLazyObject(lambda: request_status_snapshot(request))
+    }
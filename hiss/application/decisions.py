@@ -0,0 +1,127 @@
+# pylint: disable=C0330
+"""
+Set-based admission decisions. Instead of saving each `Application` individually, decisions are applied with a handful
+of `UPDATE ... WHERE id IN (...)` statements (one per distinct confirmation deadline), which keeps the number of
+queries constant regardless of how many applications are selected. The `admitted` flag of the affected applicants'
+teams is updated in the same transaction.
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+from application import snapshots, stats
+from application.models import Application, STATUS_ADMITTED, STATUS_REJECTED
+from team.loaders import update_admitted
+
+UPDATE_BATCH_SIZE = 500
+"""The maximum number of primary keys passed to a single `UPDATE ... WHERE id IN (...)` statement."""
+
+
+class DecisionResult(NamedTuple):
+    """
+    The outcome of a bulk decision. `applications` holds the affected applications (with `wave` and `user` already
+    loaded, and `status`/`confirmation_deadline` set to their new values), and `counts` maps each application's
+    *previous* status to the number of applications that moved out of it.
+    """
+
+    status: str
+    applications: List[Application]
+    counts: Dict[str, int]
+
+    @property
+    def total(self) -> int:
+        return len(self.applications)
+
+
+def load_applications(
+    applications: Union[QuerySet, Iterable[Application]],
+) -> List[Application]:
+    """
+    Loads the given applications (and their waves and users) in a single query. Accepts either a `QuerySet` (which
+    may be sliced) or any iterable of `Application`s.
+    """
+    if isinstance(applications, QuerySet):
+        if not applications.query.can_filter():
+            pks = list(applications.values_list("pk", flat=True))
+            applications = Application.objects.filter(pk__in=pks)
+        return list(applications.select_related("wave", "user"))
+    pks = [application.pk for application in applications if application is not None]
+    return list(Application.objects.filter(pk__in=pks).select_related("wave", "user"))
+
+
+def confirmation_deadline(
+    num_days_to_rsvp: int, now: Optional[timezone.datetime] = None
+) -> timezone.datetime:
+    """
+    Returns the RSVP deadline for an application admitted at `now`: the end of today, plus the wave's number of days
+    to RSVP.
+    """
+    now = now or timezone.now()
+    end_of_today = now.replace(hour=23, minute=59, second=59, microsecond=0)
+    return end_of_today + timezone.timedelta(num_days_to_rsvp)
+
+
+def _update_in_batches(pks: List, **fields) -> int:
+    updated = 0
+    for start in range(0, len(pks), UPDATE_BATCH_SIZE):
+        end = start + UPDATE_BATCH_SIZE
+        batch = pks[start:end]
+        updated += Application.objects.filter(pk__in=batch).update(**fields)
+    return updated
+
+
+def admit(
+    applications: Union[QuerySet, Iterable[Application]],
+    now: Optional[timezone.datetime] = None,
+) -> DecisionResult:
+    """
+    Admits the given applications. Applications are grouped by wave so that every application in a wave receives
+    the same confirmation deadline, and each group is updated with a single statement per batch.
+
+    Should be called inside of a transaction.
+    """
+    loaded = load_applications(applications)
+    previous_statuses = [application.status for application in loaded]
+    counts = Counter(previous_statuses)
+
+    deadlines: Dict[int, timezone.datetime] = {}
+    pks_by_deadline: Dict[timezone.datetime, List] = defaultdict(list)
+    for application in loaded:
+        if application.wave_id not in deadlines:
+            deadlines[application.wave_id] = confirmation_deadline(
+                application.wave.num_days_to_rsvp, now
+            )
+        deadline = deadlines[application.wave_id]
+        application.status = STATUS_ADMITTED
+        application.confirmation_deadline = deadline
+        pks_by_deadline[deadline].append(application.pk)
+
+    for deadline, pks in pks_by_deadline.items():
+        _update_in_batches(pks, status=STATUS_ADMITTED, confirmation_deadline=deadline)
+    stats.record_status_change(loaded, previous_statuses)
+    snapshots.invalidate_status_snapshots(a.user_id for a in loaded)
+    update_admitted(a.user.team_id for a in loaded)
+    return DecisionResult(STATUS_ADMITTED, loaded, dict(counts))
+
+
+def reject(applications: Union[QuerySet, Iterable[Application]]) -> DecisionResult:
+    """
+    Rejects (waitlists) the given applications with a single statement per batch.
+
+    Should be called inside of a transaction.
+    """
+    loaded = load_applications(applications)
+    previous_statuses = [application.status for application in loaded]
+    counts = Counter(previous_statuses)
+    for application in loaded:
+        application.status = STATUS_REJECTED
+    _update_in_batches(
+        [application.pk for application in loaded], status=STATUS_REJECTED
+    )
+    stats.record_status_change(loaded, previous_statuses)
+    snapshots.invalidate_status_snapshots(a.user_id for a in loaded)
+    update_admitted(a.user.team_id for a in loaded)
+    return DecisionResult(STATUS_REJECTED, loaded, dict(counts))
@@ -0,0 +1,189 @@
+"""
+A client for Hacklahoma's Discord bot. Requests share a pooled connection, have strict timeouts, and are retried
+on connection errors and 5xx responses. A circuit breaker stops calling the bot for a while once it keeps failing,
+so that an unresponsive bot can't tie up every worker. Check-ins aren't sent during the request: they're queued and
+sent by a worker (see `application.checkins`), so linking a Discord account doesn't wait on the bot.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class DiscordBotError(Exception):
+    """
+    Raised when the Discord bot returns an unexpected response.
+    """
+
+
+class DiscordBotUnavailable(DiscordBotError):
+    """
+    Raised when the Discord bot can't be reached, or hasn't been reachable recently.
+    """
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures, rejecting calls for `reset_timeout` seconds. After that, a
+    single trial call is let through: if it succeeds the breaker closes again, otherwise it stays open for another
+    `reset_timeout` seconds.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Let one trial call through; others wait until it succeeds.
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class DiscordBotClient:
+    """
+    Talks to the Discord bot at `base_url`, authenticating with the registration site's credentials.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        request_user: str,
+        request_pass: str,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 5,
+        retries: int = 2,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+    ):
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.credentials = {"request_user": request_user, "request_pass": request_pass}
+        self.timeout = (connect_timeout, read_timeout)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        )
+        self.session.mount(
+            self.base_url,
+            HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=retry),
+        )
+
+    def _request(self, method: str, path: str, **json) -> requests.Response:
+        if not self.breaker.allow():
+            raise DiscordBotUnavailable("The Discord bot is temporarily unavailable.")
+        try:
+            response = self.session.request(
+                method,
+                self.base_url + path,
+                json={**json, **self.credentials},
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            self.breaker.record_failure()
+            raise DiscordBotUnavailable(str(e)) from e
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+            raise DiscordBotUnavailable(
+                "The Discord bot responded with %s." % response.status_code
+            )
+        self.breaker.record_success()
+        if not response.ok:
+            raise DiscordBotError(
+                "The Discord bot responded with %s." % response.status_code
+            )
+        return response
+
+    def user_exists(self, discord_id: str) -> bool:
+        """
+        Returns whether the given Discord user has joined the Hacklahoma server.
+        """
+        response = self._request("GET", "check_user/%s" % discord_id)
+        try:
+            return bool(response.json()["exists"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise DiscordBotError("Unexpected response from the Discord bot.") from e
+
+    def check_in(
+        self, discord_id: str, name: str, team_name: Optional[str] = None
+    ) -> None:
+        """
+        Tells the bot that a hacker has checked in, so that it can give them their roles.
+        """
+        self._request(
+            "PUT",
+            "check_in",
+            discord_id=discord_id,
+            name=name,
+            team_name=team_name,
+        )
+
+    def close(self) -> None:
+        """
+        Closes the client's connections.
+        """
+        self.session.close()
+
+
+_client: Optional[DiscordBotClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> DiscordBotClient:
+    """
+    Returns the process's Discord bot client, creating it on first use.
+    """
+    global _client  # pylint: disable=W0603
+    with _client_lock:
+        if _client is None:
+            _client = DiscordBotClient(
+                os.environ["DISCORD_BOT_URL"],
+                os.environ["REG_USERNAME"],
+                os.environ["REG_PASSWORD"],
+                connect_timeout=settings.DISCORD_BOT_CONNECT_TIMEOUT,
+                read_timeout=settings.DISCORD_BOT_READ_TIMEOUT,
+                retries=settings.DISCORD_BOT_RETRIES,
+                failure_threshold=settings.DISCORD_BOT_FAILURE_THRESHOLD,
+                reset_timeout=settings.DISCORD_BOT_RESET_TIMEOUT,
+            )
+        return _client
+
+
+def reset_client() -> None:
+    """
+    Drops the process's Discord bot client, so that the next `get_client()` creates a new one (e.g. after the bot's
+    URL changes).
+    """
+    global _client  # pylint: disable=W0603
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
@@ -1,12 +1,9 @@
-import json
-from io import BytesIO
-
-import pyqrcode
 from django.conf import settings
 from django.core import mail
 from django.template.loader import render_to_string
 from django.utils import html
 
+from application.badges import badge_qr_png
 from application.models import Application
 
 
@@ -25,7 +22,8 @@ def send_creation_email(app: Application) -> None:
 
 def send_confirmation_email(app: Application) -> None:
     """
-    Sends a confirmation email to a user, which contains their QR code as well as additional event information.
+    Sends a confirmation email to a user, which contains their QR code as well as additional event information. The QR
+    code is only rendered the first time (see `application.badges`).
     :param app: The user's application
     :type app: Application
     :return: None
@@ -39,17 +37,5 @@ def send_confirmation_email(app: Application) -> None:
         subject, msg, from_email=None, to=[app.user.email]
     )
     email.attach_alternative(html_msg, "text/html")
-
-    qr_content = json.dumps(
-        {
-            "first_name": app.first_name,
-            "last_name": app.last_name,
-            "email": app.user.email,
-            "university": app.school.name,
-        }
-    )
-    qr_code = pyqrcode.create(qr_content)
-    qr_stream = BytesIO()
-    qr_code.png(qr_stream, scale=5)
-    email.attach("code.png", qr_stream.getvalue(), "text/png")
+    email.attach("code.png", badge_qr_png(app), "image/png")
     email.send()
@@ -0,0 +1,128 @@
+"""
+Expiring admissions that weren't confirmed in time. Applications are expired with a single `UPDATE ... RETURNING`
+statement (backed by the index on `(status, confirmation_deadline)`), so an application can't be confirmed between
+being counted and being expired, and the expired applications don't have to be selected again to notify them.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from application import snapshots, stats
+from application.models import (
+    Application,
+    STATISTIC_FIELDS,
+    STATUS_ADMITTED,
+    STATUS_EXPIRED,
+)
+from shared.batch_mail import BatchMailTemplate
+from shared.outbox import enqueue_mass_html_mail
+from user.models import User
+
+EXPIRATION_EMAIL = BatchMailTemplate(
+    "application/emails/expired.html",
+    "Your Hacklahoma admission has expired",
+    slots=["first_name"],
+    event_name="Hacklahoma",
+)
+
+RETURNED_FIELDS = ("id", "user_id", "first_name") + STATISTIC_FIELDS[1:]
+
+
+class ExpiredApplication(NamedTuple):
+    pk: object
+    user_id: int
+    first_name: str
+    statistics: Tuple
+
+
+def supports_returning() -> bool:
+    """
+    Returns whether the database supports `UPDATE ... RETURNING` (PostgreSQL, and SQLite since 3.35).
+    """
+    if connection.vendor == "postgresql":
+        return True
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35)
+    return False
+
+
+def _expire_returning(now: timezone.datetime) -> List[Tuple]:
+    quote = connection.ops.quote_name
+    columns = [Application._meta.get_field(name).column for name in RETURNED_FIELDS]
+    sql = "UPDATE %s SET %s = %%s WHERE %s = %%s AND %s < %%s RETURNING %s" % (
+        quote(Application._meta.db_table),
+        quote("status"),
+        quote("status"),
+        quote("confirmation_deadline"),
+        ", ".join(quote(column) for column in columns),
+    )
+    params = [
+        STATUS_EXPIRED,
+        STATUS_ADMITTED,
+        connection.ops.adapt_datetimefield_value(now),
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    to_pk = Application._meta.pk.to_python
+    return [(to_pk(row[0]),) + tuple(row[1:]) for row in rows]
+
+
+def _expire_locking(now: timezone.datetime) -> List[Tuple]:
+    # For databases without `RETURNING`: lock the rows, then update exactly those.
+    rows = list(
+        Application.objects.filter(
+            status=STATUS_ADMITTED, confirmation_deadline__lt=now
+        )
+        .select_for_update()
+        .values_list(*RETURNED_FIELDS)
+    )
+    Application.objects.filter(pk__in=[row[0] for row in rows]).update(
+        status=STATUS_EXPIRED
+    )
+    return rows
+
+
+def build_expiration_emails(expired: List[ExpiredApplication]):
+    """
+    Lazily yields (idempotency_key, datatuple) pairs for the expiration emails of the given applications.
+    """
+    emails = dict(
+        User.objects.filter(
+            pk__in={application.user_id for application in expired}
+        ).values_list("pk", "email")
+    )
+    for application in expired:
+        yield "expiration:%s" % application.pk, EXPIRATION_EMAIL.build(
+            emails[application.user_id], first_name=application.first_name
+        )
+
+
+def expire_applications(
+    now: Optional[timezone.datetime] = None,
+) -> List[ExpiredApplication]:
+    """
+    Expires every admitted application whose confirmation deadline passed before `now`, updates the registration
+    statistics, and queues an email to each affected hacker. Returns the expired applications.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        if supports_returning():
+            rows = _expire_returning(now)
+        else:
+            rows = _expire_locking(now)
+        expired = [
+            ExpiredApplication(pk, user_id, first_name, tuple(statistics))
+            for pk, user_id, first_name, *statistics in rows
+        ]
+        if expired:
+            before = [(STATUS_ADMITTED,) + a.statistics for a in expired]
+            stats.apply_changes(
+                stats.count_keys(before),
+                stats.count_keys((STATUS_EXPIRED,) + a.statistics for a in expired),
+            )
+            snapshots.invalidate_status_snapshots(a.user_id for a in expired)
+            enqueue_mass_html_mail(build_expiration_emails(expired))
+    return expired
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from application import admission
+from application.admin import approve_in_batches
+
+
+class Command(BaseCommand):
+    help = (
+        "Admits pending applications at random until the expected headcount (based on each wave's historical yield) "
+        "reaches a target."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("target", type=int, help="The target headcount")
+        parser.add_argument(
+            "--keep-teams",
+            action="store_true",
+            help="Admit the pending members of a team together.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show the plan, without admitting anyone.",
+        )
+        parser.add_argument(
+            "--seed", type=int, help="Seed for picking applications reproducibly."
+        )
+
+    def handle(self, *args, **options):
+        plan = admission.plan_admissions(
+            options["target"], keep_teams=options["keep_teams"], seed=options["seed"]
+        )
+        for line in admission.describe(plan):
+            self.stdout.write(line)
+        if options["dry_run"]:
+            return
+        approved = approve_in_batches(plan.pks)
+        self.stdout.write(
+            self.style.SUCCESS("All %s applications successfully approved" % approved)
+        )
@@ -1,16 +1,38 @@
-from django.core.management.base import BaseCommand
-from django.utils import timezone
+import time
 
-from application.models import Application, STATUS_ADMITTED, STATUS_EXPIRED
+from django.core.management.base import BaseCommand, CommandParser
+
+from application.expiration import expire_applications
 
 
 class Command(BaseCommand):
-    def handle(self, *args, **options):
-        unconfirmed = Application.objects.filter(
-            status=STATUS_ADMITTED, confirmation_deadline__lt=timezone.now()
+    help = (
+        "Expires admitted applications whose confirmation deadline has passed, and queues an email to each of their "
+        "hackers."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep expiring applications periodically instead of exiting",
         )
-        self.stdout.write("Going to expire %s applications" % (unconfirmed.count()))
-        expired = unconfirmed.update(status=STATUS_EXPIRED)
-        self.stdout.write(
-            self.style.SUCCESS("All %s applications successfully approved" % expired)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=60,
+            help="Seconds to wait between sweeps (with --loop)",
         )
+
+    def handle(self, *args, **options):
+        while True:
+            expired = expire_applications()
+            if expired or not options["loop"]:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        "%s applications successfully expired" % len(expired)
+                    )
+                )
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
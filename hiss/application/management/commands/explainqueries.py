@@ -0,0 +1,59 @@
+from typing import Callable, List, Tuple
+
+from django.core.management.base import BaseCommand
+from django.db.models.query import QuerySet
+from django.utils import timezone
+
+from application.models import Application, STATUS_ADMITTED, STATUS_PENDING
+from user.models import User
+
+
+def hot_queries() -> List[Tuple[str, Callable[[], QuerySet]]]:
+    """
+    Returns the (description, queryset factory) of every hot lookup whose plan should use an index.
+    """
+    now = timezone.now()
+    return [
+        (
+            "Volunteer hacker lookup by email",
+            lambda: Application.objects.filter(user__email="hacker@example.com"),
+        ),
+        (
+            "User lookup by email, ignoring case",
+            lambda: User.objects.filter(email__iexact="hacker@example.com"),
+        ),
+        (
+            "Discord lookup by id",
+            lambda: Application.objects.filter(discord_id="123456789012345678"),
+        ),
+        (
+            "Expiration sweep",
+            lambda: Application.objects.filter(
+                status=STATUS_ADMITTED, confirmation_deadline__lt=now
+            ),
+        ),
+        (
+            "Admission by status",
+            lambda: Application.objects.filter(status=STATUS_PENDING),
+        ),
+        (
+            "Admin date range filter",
+            lambda: Application.objects.filter(
+                datetime_submitted__range=(now - timezone.timedelta(days=7), now)
+            ),
+        ),
+        ("Status page by user", lambda: Application.objects.filter(user_id=1)),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Shows the database's query plan for each hot lookup (e.g. to check that they use indexes after changing "
+        "migrations)."
+    )
+
+    def handle(self, *args, **options):
+        for description, queryset in hot_queries():
+            self.stdout.write(self.style.MIGRATE_HEADING(description))
+            self.stdout.write(queryset().explain())
+            self.stdout.write("")
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from application.models import Application, STATUS_OPTIONS
+from application.resume_book import RESUME_BOOK_STATUSES, resume_book
+
+
+class Command(BaseCommand):
+    help = (
+        "Writes a ZIP of the resumes of admitted, confirmed, and checked in hackers (with an index.csv describing "
+        "them) to the given file."
+    )
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument("output", help="The file to write the ZIP to")
+        parser.add_argument(
+            "--status",
+            action="append",
+            choices=[status for status, _ in STATUS_OPTIONS],
+            help="Only export applications with this status (can be repeated)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="The number of resumes to fetch from storage at a time",
+        )
+
+    def handle(self, *args, **options):
+        statuses = options["status"] or RESUME_BOOK_STATUSES
+        applications = Application.objects.filter(status__in=statuses)
+        size = 0
+        with open(options["output"], "wb") as output:
+            for chunk in resume_book(applications, workers=options["workers"]):
+                output.write(chunk)
+                size += len(chunk)
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Resume book written to %s (%s bytes)" % (options["output"], size)
+            )
+        )
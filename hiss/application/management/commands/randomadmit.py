@@ -1,27 +1,37 @@
+import random
+
 from django.core.management.base import BaseCommand, CommandParser
 
-from application.admin import approve
+from application.admin import approve_in_batches
 from application.models import Application, STATUS_PENDING
 
 
 class Command(BaseCommand):
+    help = (
+        "Admits a percentage of pending applications at random. See the admit command for admitting up to a target "
+        "headcount instead."
+    )
+
     def add_arguments(self, parser: CommandParser):
         parser.add_argument(
             "pct", type=float, help="Percentage of non-reviewed applications to admit"
         )
 
     def handle(self, *args, **options):
-        unreviewed = Application.objects.filter(status=STATUS_PENDING).order_by("?")
-        num_unreviewed = unreviewed.count()
-        num_to_approve = round(options["pct"] * num_unreviewed)
+        unreviewed = list(
+            Application.objects.filter(status=STATUS_PENDING).values_list(
+                "pk", flat=True
+            )
+        )
+        # Percentages above 1 (or below 0) admit everyone (or no one).
+        num_to_approve = min(
+            len(unreviewed), max(0, round(options["pct"] * len(unreviewed)))
+        )
         self.stdout.write(
             "Going to approve %s applications (out of %s)"
-            % (num_to_approve, num_unreviewed)
+            % (num_to_approve, len(unreviewed))
         )
-        apps_to_approve = unreviewed[:num_to_approve]
-        approve(None, None, apps_to_approve)
+        approved = approve_in_batches(random.sample(unreviewed, num_to_approve))
         self.stdout.write(
-            self.style.SUCCESS(
-                "All %s applications successfully approved" % num_to_approve
-            )
+            self.style.SUCCESS("All %s applications successfully approved" % approved)
         )
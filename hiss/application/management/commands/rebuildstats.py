@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from application import stats
+
+
+class Command(BaseCommand):
+    help = "Recomputes the registration statistics from scratch, in case they've drifted from the applications."
+
+    def handle(self, *args, **options):
+        stats.rebuild()
+        self.stdout.write(self.style.SUCCESS("Registration statistics rebuilt"))
@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from application.badges import (
+    badge_qr_key,
+    badge_token,
+    render_badge_qr,
+    store_badge_qrs,
+)
+from application.models import (
+    Application,
+    BadgeQRCode,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_CONFIRMED,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Renders the badge QR codes of admitted, confirmed, and checked in applications ahead of time, so that "
+        "confirmation emails can reuse them. Run it after admitting hackers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count(),
+            help="The number of processes to render QR codes with.",
+        )
+
+    def handle(self, *args, **options):
+        pks = Application.objects.filter(
+            status__in=[STATUS_ADMITTED, STATUS_CONFIRMED, STATUS_CHECKED_IN]
+        ).values_list("pk", flat=True)
+        tokens = [badge_token(pk) for pk in pks.iterator()]
+        stored = set(
+            BadgeQRCode.objects.filter(
+                key__in=[badge_qr_key(token) for token in tokens]
+            ).values_list("key", flat=True)
+        )
+        missing = [token for token in tokens if badge_qr_key(token) not in stored]
+        self.stdout.write(
+            "Going to render %s of %s badges" % (len(missing), len(tokens))
+        )
+
+        # Rendering is CPU-bound, so it happens in other processes. Storing happens here, because database
+        # connections can't be shared between processes.
+        with ProcessPoolExecutor(max_workers=options["processes"]) as executor:
+            pngs = executor.map(render_badge_qr, missing, chunksize=32)
+            store_badge_qrs(zip(missing, pngs))
+        self.stdout.write(
+            self.style.SUCCESS("All %s badges successfully rendered" % len(missing))
+        )
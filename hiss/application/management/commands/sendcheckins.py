@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from application.checkins import send_queued_check_ins
+
+
+class Command(BaseCommand):
+    help = "Sends queued Discord check-ins to the Discord bot."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="The number of check-ins to claim at a time",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for check-ins instead of exiting once none are due",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls when no check-ins are due (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_queued_check_ins(options["batch_size"])
+            if sent or failed:
+                self.stdout.write(
+                    "Sent %s check-ins (%s failed and will be retried or given up on)"
+                    % (sent, failed)
+                )
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS("No check-ins are due"))
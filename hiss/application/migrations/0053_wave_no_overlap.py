@@ -0,0 +1,63 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:18
+
+from django.db import migrations, models
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE application_wave ADD CONSTRAINT application_wave_no_overlap
+    EXCLUDE USING gist (tstzrange("start", "end", '[)') WITH &&)
+    """
+]
+POSTGRES_BACKWARD = [
+    "ALTER TABLE application_wave DROP CONSTRAINT application_wave_no_overlap"
+]
+
+SQLITE_OVERLAP_CHECK = """
+    WHEN EXISTS (
+        SELECT 1 FROM application_wave
+        WHERE "start" < NEW."end" AND "end" > NEW."start" AND id != NEW.id
+    )
+    BEGIN
+        SELECT RAISE(ABORT, 'application_wave_no_overlap');
+    END
+"""
+SQLITE_FORWARD = [
+    "CREATE TRIGGER application_wave_no_overlap_insert BEFORE INSERT ON application_wave"
+    + SQLITE_OVERLAP_CHECK.replace("AND id != NEW.id", ""),
+    'CREATE TRIGGER application_wave_no_overlap_update BEFORE UPDATE OF "start", "end" ON application_wave'
+    + SQLITE_OVERLAP_CHECK,
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER application_wave_no_overlap_insert",
+    "DROP TRIGGER application_wave_no_overlap_update",
+]
+
+
+def run_for_vendor(postgres_statements, sqlite_statements):
+    def run(apps, schema_editor):
+        statements = {
+            "postgresql": postgres_statements,
+            "sqlite": sqlite_statements,
+        }.get(schema_editor.connection.vendor, [])
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0052_auto_20210201_1227'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wave',
+            index=models.Index(fields=['start', 'end'], name='application_start_cc1c42_idx'),
+        ),
+        migrations.RunPython(
+            run_for_vendor(POSTGRES_FORWARD, SQLITE_FORWARD),
+            run_for_vendor(POSTGRES_BACKWARD, SQLITE_BACKWARD),
+        ),
+    ]
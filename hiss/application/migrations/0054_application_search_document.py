@@ -0,0 +1,67 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:20
+
+import unicodedata
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    """
+    CREATE INDEX application_search_document_trgm ON application_application
+    USING gin (search_document gin_trgm_ops)
+    """,
+]
+POSTGRES_BACKWARD = ["DROP INDEX IF EXISTS application_search_document_trgm"]
+
+
+def normalize_search_text(text):
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def populate_search_documents(apps, schema_editor):
+    Application = apps.get_model("application", "Application")
+    applications = Application.objects.select_related("user").order_by("pk")
+    batch = []
+    for application in applications.iterator(chunk_size=BATCH_SIZE):
+        application.search_document = normalize_search_text(
+            " ".join(
+                [application.first_name, application.last_name, application.user.email]
+            )
+        )
+        batch.append(application)
+        if len(batch) == BATCH_SIZE:
+            Application.objects.bulk_update(batch, ["search_document"])
+            batch = []
+    Application.objects.bulk_update(batch, ["search_document"])
+
+
+def run_for_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "postgresql":
+            for statement in statements:
+                schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0053_wave_no_overlap'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='search_document',
+            field=models.CharField(blank=True, default='', editable=False, max_length=800),
+        ),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+        migrations.RunPython(
+            run_for_postgres(POSTGRES_FORWARD), run_for_postgres(POSTGRES_BACKWARD)
+        ),
+    ]
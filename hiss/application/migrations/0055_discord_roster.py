@@ -0,0 +1,25 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0054_application_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='discord_id',
+            field=models.CharField(db_index=True, max_length=32, null=True),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:37
+
+from django.db import migrations, models
+from django.db.models import Count
+
+DIMENSION_FIELDS = [
+    ("total", None),
+    ("school", "school_id"),
+    ("gender", "gender"),
+    ("level_of_study", "level_of_study"),
+    ("shirt_size", "shirt_size"),
+]
+
+
+def build_statistics(apps, schema_editor):
+    Application = apps.get_model("application", "Application")
+    ApplicationStatistic = apps.get_model("application", "ApplicationStatistic")
+    statistics = []
+    for dimension, field in DIMENSION_FIELDS:
+        group_by = ["status"] + ([field] if field else [])
+        for row in Application.objects.values(*group_by).annotate(count=Count("pk")).order_by():
+            value = row.get(field) if field else ""
+            statistics.append(
+                ApplicationStatistic(
+                    dimension=dimension,
+                    value="" if value is None else str(value),
+                    status=row["status"],
+                    count=row["count"],
+                )
+            )
+    ApplicationStatistic.objects.bulk_create(statistics)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0055_discord_roster'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatistic',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=32)),
+                ('value', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('P', 'Under Review'), ('R', 'Waitlisted'), ('A', 'Admitted'), ('C', 'Confirmed'), ('X', 'Declined'), ('I', 'Checked in'), ('E', 'Expired')], max_length=1)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('dimension', 'value', 'status')},
+            },
+        ),
+        migrations.RunPython(build_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0056_applicationstatistic'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['status', 'confirmation_deadline'], name='application_status_98b01f_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:53
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def clear_duplicate_discord_ids(apps, schema_editor):
+    """
+    Unlinked applications get a NULL discord_id (so they're left out of the unique index), and a Discord account
+    that was linked to more than one application (only possible through a race) stays linked to the most recently
+    updated one.
+    """
+    Application = apps.get_model("application", "Application")
+    Application.objects.filter(discord_id="").update(discord_id=None)
+    duplicates = (
+        Application.objects.exclude(discord_id=None)
+        .values_list("discord_id", flat=True)
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    for discord_id in list(duplicates):
+        linked = Application.objects.filter(discord_id=discord_id)
+        pks = list(linked.order_by("-updated_at", "-pk").values_list("pk", flat=True))
+        linked.filter(pk__in=pks[1:]).update(discord_id=None)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0057_application_expiration_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='application',
+            name='discord_id',
+            field=models.CharField(max_length=32, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['datetime_submitted'], name='application_datetim_159202_idx'),
+        ),
+        migrations.RunPython(clear_duplicate_discord_ids, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='application',
+            constraint=models.UniqueConstraint(condition=models.Q(discord_id__isnull=False), fields=('discord_id',), name='application_unique_discord_id'),
+        ),
+    ]
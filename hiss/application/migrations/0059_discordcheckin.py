@@ -0,0 +1,35 @@
+# Generated by Django 2.2.13 on 2026-10-18 07:36
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0058_application_hot_lookups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscordCheckIn',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('discord_id', models.CharField(max_length=255)),
+                ('name', models.CharField(max_length=255)),
+                ('team_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('status', models.CharField(choices=[('Q', 'Queued'), ('S', 'Sending'), ('D', 'Sent'), ('F', 'Failed')], default='Q', max_length=1)),
+                ('claim', models.UUIDField(blank=True, editable=False, null=True)),
+                ('claimed_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='discordcheckin',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='application_status_464b0a_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 2.2.13 on 2026-10-18 07:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0059_discordcheckin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationstatistic',
+            name='shard',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterUniqueTogether(
+            name='applicationstatistic',
+            unique_together={('dimension', 'value', 'status', 'shard')},
+        ),
+    ]
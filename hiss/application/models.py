@@ -1,18 +1,66 @@
 # pylint: disable=C0330
+import bisect
+import time
+import unicodedata
 import uuid
 from typing import Optional, List, Tuple
 
 from django.conf import settings
 from django.core import exceptions
+from django.core.cache import cache
 from django.core.validators import FileExtensionValidator, RegexValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.urls import reverse_lazy
 from django.utils import timezone
 from multiselectfield import MultiSelectField
 import re
 
+from shared import retry_queue
+
+
+WAVE_SCHEDULE_CACHE_KEY = "application:wave_schedule"
+
 
 class WaveManager(models.Manager):
+    """
+    Answers `active_wave`/`next_wave` from an in-memory schedule of every wave instead of querying the database.
+
+    The schedule is stored in the shared cache (so that every worker process sees the same schedule), and each
+    process also keeps its own copy for `WAVE_SCHEDULE_LOCAL_TTL` seconds so that repeated lookups during a request
+    don't even hit the cache. Saving or deleting a `Wave` invalidates the schedule (see `invalidate_wave_schedule`).
+    """
+
+    _local_schedule: Optional[Tuple[float, List["Wave"], List[timezone.datetime]]] = None
+
+    def schedule(self) -> Tuple[List["Wave"], List[timezone.datetime]]:
+        """
+        Returns every `Wave` ordered by start, along with a parallel list of their start times for bisecting.
+        """
+        now = time.monotonic()
+        local = WaveManager._local_schedule
+        if local and local[0] > now:
+            return local[1], local[2]
+        waves = cache.get(WAVE_SCHEDULE_CACHE_KEY)
+        if waves is None:
+            waves = list(self.get_queryset().order_by("start"))
+            cache.set(
+                WAVE_SCHEDULE_CACHE_KEY, waves, settings.WAVE_SCHEDULE_CACHE_TIMEOUT
+            )
+        starts = [wave.start for wave in waves]
+        WaveManager._local_schedule = (
+            now + settings.WAVE_SCHEDULE_LOCAL_TTL,
+            waves,
+            starts,
+        )
+        return waves, starts
+
+    @staticmethod
+    def clear_schedule_cache() -> None:
+        WaveManager._local_schedule = None
+        cache.delete(WAVE_SCHEDULE_CACHE_KEY)
+
     def next_wave(
         self, start_dt: Optional[timezone.datetime] = None
     ) -> Optional["Wave"]:
@@ -22,8 +70,9 @@ class WaveManager(models.Manager):
         """
         if not start_dt:
             start_dt = timezone.now()
-        qs = self.get_queryset().filter(start__gt=start_dt).order_by("start")
-        return qs.first()
+        waves, starts = self.schedule()
+        i = bisect.bisect_right(starts, start_dt)
+        return waves[i] if i < len(waves) else None
 
     def active_wave(
         self, start_dt: Optional[timezone.datetime] = None
@@ -34,12 +83,12 @@ class WaveManager(models.Manager):
         """
         if not start_dt:
             start_dt = timezone.now()
-        qs = (
-            self.get_queryset()
-            .filter(start__lte=start_dt, end__gt=start_dt)
-            .order_by("start")
-        )
-        return qs.first()
+        waves, starts = self.schedule()
+        # Waves can't overlap, so the only candidate is the last wave that started at or before start_dt.
+        i = bisect.bisect_right(starts, start_dt) - 1
+        if i >= 0 and waves[i].end > start_dt:
+            return waves[i]
+        return None
 
 
 class Wave(models.Model):
@@ -57,19 +106,35 @@ class Wave(models.Model):
 
     objects = WaveManager()
 
+    class Meta:
+        # Overlaps are also rejected by the database itself (an exclusion constraint on PostgreSQL, triggers on
+        # SQLite), see migration 0053.
+        indexes = [models.Index(fields=["start", "end"])]
+
     def clean(self):
         super().clean()
         if self.start >= self.end:
             raise exceptions.ValidationError(
                 {"start": "Start date can't be after end date."}
             )
-        for wave in Wave.objects.exclude(pk=self.pk).all():
-            has_start_overlap = wave.start < self.start < wave.end
-            has_end_overlap = wave.start < self.end < wave.end
-            if has_start_overlap or has_end_overlap:
-                raise exceptions.ValidationError(
-                    "Cannot create wave; another wave with an overlapping time range exists."
-                )
+        overlapping_waves = Wave.objects.exclude(pk=self.pk).filter(
+            start__lt=self.end, end__gt=self.start
+        )
+        if overlapping_waves.exists():
+            raise exceptions.ValidationError(
+                "Cannot create wave; another wave with an overlapping time range exists."
+            )
+
+
+@receiver(post_save, sender=Wave)
+@receiver(post_delete, sender=Wave)
+def invalidate_wave_schedule(**_kwargs) -> None:
+    """
+    Clears the cached wave schedule whenever a `Wave` changes. The schedule is cleared again once the surrounding
+    transaction commits, in case another process re-cached the old schedule in the meantime.
+    """
+    Wave.objects.clear_schedule_cache()
+    transaction.on_commit(Wave.objects.clear_schedule_cache)
 
 
 class School(models.Model):
@@ -343,6 +408,21 @@ STATUS_OPTIONS = [
     (STATUS_EXPIRED, "Expired"),
 ]
 
+
+def normalize_search_text(text: str) -> str:
+    """
+    Normalizes text for searching: accents are stripped, case is folded, and runs of whitespace are collapsed into a
+    single space.
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+# The fields of `Application` that `ApplicationStatistic`s are kept for, starting with the status.
+STATISTIC_FIELDS = ("status", "school_id", "gender", "level_of_study", "shirt_size")
+
+
 def uuid_generator(_instance, filename: str):
     ext = filename.split(".")[-1]
     filename = "%s.%s" % (uuid.uuid4(), ext)
@@ -362,8 +442,17 @@ class Application(models.Model):
     status = models.CharField(
         choices=STATUS_OPTIONS, max_length=1, default=STATUS_PENDING
     )
+    # Unique among linked applications, see `Meta.constraints`.
     discord_id = models.CharField(max_length=32, null=True)
     checked_in = models.BooleanField(default=False)
+    # Used as the cursor of the Discord roster (see `DiscordRosterView`). Bumped for a user's applications when
+    # their team changes, since the roster includes team names.
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    # Normalized "<first name> <last name> <email>", maintained by `save()` and used by the volunteer search. Indexed
+    # with a trigram GIN index on PostgreSQL, see migration 0054.
+    search_document = models.CharField(
+        max_length=800, blank=True, default="", editable=False
+    )
     
     # ABOUT YOU
     # First Name Character Field
@@ -569,12 +658,52 @@ class Application(models.Model):
     # CONFIRMATION DEADLINE
     confirmation_deadline = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Used by the expiration sweeper (see application/expiration.py), and by any filter on status alone.
+            models.Index(fields=["status", "confirmation_deadline"]),
+            # Used by the admin's date range filter.
+            models.Index(fields=["datetime_submitted"]),
+        ]
+        constraints = [
+            # Unlinked applications have a NULL discord_id, which is left out of the index.
+            models.UniqueConstraint(
+                fields=["discord_id"],
+                condition=models.Q(discord_id__isnull=False),
+                name="application_unique_discord_id",
+            )
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the values that statistics are kept for, so that saving the application can update them (see
+        # `application.stats`).
+        if all(field in field_names for field in STATISTIC_FIELDS):
+            instance._statistics_snapshot = tuple(
+                getattr(instance, field) for field in STATISTIC_FIELDS
+            )
+        return instance
+
     def __str__(self):
         return "%s, %s - Application" % (self.last_name, self.first_name)
 
     def get_absolute_url(self):
         return reverse_lazy("application:update", args=[self.id])
 
+    def build_search_document(self) -> str:
+        return normalize_search_text(
+            " ".join([self.first_name, self.last_name, self.user.email])
+        )
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or {"first_name", "last_name"} & set(update_fields):
+            self.search_document = self.build_search_document()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_document"}
+        super().save(*args, **kwargs)
+
     # Check the formatting of the birthday
     def checkBirthday(self):
         sb = re.split('/|-', self.birthday)
@@ -606,3 +735,129 @@ class Application(models.Model):
         if not self.num_hackathons_attended.isnumeric():
             raise exceptions.ValidationError("Please enter a number for the number of hackathons.")
 
+
+class ApplicationStatistic(models.Model):
+    """
+    Part of the number of applications with a given status and a given value of one of their fields (the "dimension",
+    e.g. "shirt_size"), kept up to date incrementally by `application.stats`. The "total" dimension counts all
+    applications by status. Each count is split over `APPLICATION_STATISTIC_SHARDS` rows (the "shards"), which are
+    summed when read.
+    """
+
+    dimension = models.CharField(max_length=32)
+    value = models.CharField(max_length=255, blank=True)
+    status = models.CharField(choices=STATUS_OPTIONS, max_length=1)
+    shard = models.PositiveSmallIntegerField(default=0)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = [("dimension", "value", "status", "shard")]
+
+    def __str__(self):
+        return "%s=%s (%s, shard %s): %s" % (
+            self.dimension,
+            self.value,
+            self.status,
+            self.shard,
+            self.count,
+        )
+
+
+@receiver(post_save, sender="user.User")
+def update_search_documents(instance, update_fields=None, **_kwargs) -> None:
+    """
+    Keeps the search documents of a user's applications in sync with their email address.
+    """
+    if update_fields is not None and "email" not in update_fields:
+        return
+    for application in Application.objects.filter(user=instance):
+        application.user = instance
+        document = application.build_search_document()
+        if application.search_document != document:
+            Application.objects.filter(pk=application.pk).update(
+                search_document=document
+            )
+
+
+@receiver(post_save, sender="user.User")
+def touch_applications_of_user(instance, update_fields=None, **_kwargs) -> None:
+    """
+    Bumps `updated_at` on a user's applications when the user is saved (e.g. joining or leaving a team).
+    """
+    if update_fields is not None and "team" not in update_fields:
+        return
+    Application.objects.filter(user=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender="team.Team")
+def touch_applications_of_team(instance, created: bool = False, **_kwargs) -> None:
+    """
+    Bumps `updated_at` on the applications of a team's members when the team is saved (e.g. renamed).
+    """
+    if not created:
+        Application.objects.filter(user__team=instance).update(
+            updated_at=timezone.now()
+        )
+
+
+CHECK_IN_QUEUED = retry_queue.QUEUED
+"""Status given to a check-in that is waiting to be (re)sent to the Discord bot."""
+
+CHECK_IN_SENDING = retry_queue.SENDING
+"""Status given to a check-in that a worker has claimed and is currently sending."""
+
+CHECK_IN_SENT = retry_queue.SENT
+"""Status given to a check-in that the Discord bot has accepted."""
+
+CHECK_IN_FAILED = retry_queue.FAILED
+"""Status given to a check-in that ran out of retries."""
+
+CHECK_IN_STATUS_OPTIONS = [
+    (CHECK_IN_QUEUED, "Queued"),
+    (CHECK_IN_SENDING, "Sending"),
+    (CHECK_IN_SENT, "Sent"),
+    (CHECK_IN_FAILED, "Failed"),
+]
+
+
+class DiscordCheckIn(models.Model):
+    """
+    A check-in waiting to be sent to the Discord bot, which gives the hacker their roles. Check-ins are queued when a
+    hacker links their Discord account, and sent later by the `sendcheckins` management command (see
+    `application.checkins`), so that linking never waits on the bot and no check-in is lost while the bot is down.
+    """
+
+    discord_id = models.CharField(max_length=255)
+    name = models.CharField(max_length=255)
+    team_name = models.CharField(max_length=255, null=True, blank=True)
+
+    status = models.CharField(
+        choices=CHECK_IN_STATUS_OPTIONS, max_length=1, default=CHECK_IN_QUEUED
+    )
+    claim = models.UUIDField(null=True, blank=True, editable=False)
+    claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self):
+        return "%s (%s)" % (self.name, self.discord_id)
+
+
+class BadgeQRCode(models.Model):
+    """
+    A pre-rendered badge QR code PNG (see `application.badges`), addressed by a hash of its payload. Rendered ahead of
+    time by the `renderbadges` management command.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    png = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.key
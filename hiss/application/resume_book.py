@@ -0,0 +1,162 @@
+"""
+Resume books for sponsors: a ZIP of the resumes of a set of applications, with an `index.csv` describing each one.
+The archive is streamed as it's built, and resumes are fetched from storage a few at a time by a pool of threads, so
+neither the archive nor the whole set of resumes is ever held in memory.
+"""
+
+import csv
+import io
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from django.conf import settings
+from django.core.files.storage import Storage, default_storage
+from django.db.models.query import QuerySet
+from django.utils.text import get_valid_filename
+
+from application.models import (
+    GRAD_YEARS,
+    LEVEL_OF_STUDY,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_CONFIRMED,
+)
+from shared.admin_functions import EXPORT_CHUNK_SIZE
+from shared.zip_stream import stream_zip
+
+RESUME_BOOK_STATUSES = (STATUS_ADMITTED, STATUS_CONFIRMED, STATUS_CHECKED_IN)
+"""The statuses of the applications whose resumes go in the resume book by default."""
+
+INDEX_HEADER = [
+    "File",
+    "First Name",
+    "Last Name",
+    "E-Mail",
+    "School",
+    "Level Of Study",
+    "Anticipated Graduation Year",
+    "Major",
+]
+
+LEVEL_OF_STUDY_NAMES = dict(LEVEL_OF_STUDY)
+GRAD_YEAR_NAMES = dict(GRAD_YEARS)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def prefetch(
+    executor: ThreadPoolExecutor,
+    function: Callable[[T], R],
+    items: Iterable[T],
+    window: int,
+) -> Iterator[Tuple[T, R]]:
+    """
+    Like `executor.map`, but keeps at most `window` calls in flight, so that results (and `items`) are only
+    consumed as fast as they're used. Yields (item, result) pairs in order.
+    """
+    pending: Deque[Tuple[T, Future]] = deque()
+    for item in items:
+        pending.append((item, executor.submit(function, item)))
+        if len(pending) >= window:
+            done_item, future = pending.popleft()
+            yield done_item, future.result()
+    while pending:
+        done_item, future = pending.popleft()
+        yield done_item, future.result()
+
+
+def entry_name(pk, first_name: str, last_name: str, resume: str) -> str:
+    """
+    Names a resume's file in the archive after its hacker, e.g. "Doe_Kennedy_1a2b3c4d.pdf". The start of the
+    application's id keeps names unique.
+    """
+    extension = resume.rsplit(".", 1)[-1] if "." in resume else "pdf"
+    return get_valid_filename(
+        "%s_%s_%s.%s" % (last_name, first_name, str(pk)[:8], extension)
+    )
+
+
+def resume_book(
+    applications: QuerySet,
+    storage: Optional[Storage] = None,
+    workers: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Streams a ZIP of the resumes of the given applications, followed by an `index.csv` with a row per resume.
+    Applications without a resume, and resumes that can't be read from storage, are left out (the latter are
+    logged).
+    """
+    storage = storage or default_storage
+    workers = workers or settings.RESUME_BOOK_WORKERS
+    rows = (
+        applications.exclude(resume="")
+        .exclude(resume=None)
+        .order_by("last_name", "first_name", "pk")
+        .values_list(
+            "pk",
+            "first_name",
+            "last_name",
+            "user__email",
+            "school__name",
+            "school_other",
+            "level_of_study",
+            "graduation_year",
+            "major",
+            "resume",
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+    def read(row) -> Optional[bytes]:
+        try:
+            with storage.open(row[-1]) as file:
+                return file.read()
+        except Exception:  # pylint: disable=W0703
+            logger.exception("Failed to read resume %s", row[-1])
+            return None
+
+    index: List[List] = []
+
+    def entries() -> Iterator[Tuple[str, bytes]]:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for row, content in prefetch(executor, read, rows, window=workers * 2):
+                if content is None:
+                    continue
+                (
+                    pk,
+                    first_name,
+                    last_name,
+                    email,
+                    school,
+                    school_other,
+                    level,
+                    year,
+                    major,
+                    resume,
+                ) = row
+                name = entry_name(pk, first_name, last_name, resume)
+                index.append(
+                    [
+                        name,
+                        first_name,
+                        last_name,
+                        email,
+                        school_other if school == "Other" else school,
+                        LEVEL_OF_STUDY_NAMES.get(level, level),
+                        GRAD_YEAR_NAMES.get(year, year),
+                        major,
+                    ]
+                )
+                yield name, content
+        text = io.StringIO()
+        writer = csv.writer(text)
+        writer.writerow(INDEX_HEADER)
+        writer.writerows(index)
+        yield "index.csv", text.getvalue().encode()
+
+    return stream_zip(entries())
@@ -0,0 +1,148 @@
+"""
+Per-user snapshots of application status for the status page, which every applicant refreshes when decisions are
+released. A snapshot holds the few fields the page shows, and is kept in the shared cache for
+`STATUS_SNAPSHOT_TIMEOUT` seconds. In deployment the shared cache is a database table, so reading it costs about as
+much as the query it replaces; each process therefore also keeps its own copy of a snapshot for
+`STATUS_SNAPSHOT_LOCAL_TTL` seconds, and a refresh within that time doesn't touch the database at all.
+
+Saving or deleting an application invalidates its user's snapshot, and so do the bulk status changes in
+`application.decisions`, `application.expiration`, and `application.stats.update_status`. Invalidation drops the
+shared copy and this process's copy; other processes may show the old status until their copies expire. So that
+applicants always see their own changes, the views that change an application call `mark_status_changed`, and that
+user's requests skip the local copies until any copy made before the change has expired.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Iterable, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.http import HttpRequest
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from application.models import Application
+
+STATUS_SNAPSHOT_CACHE_KEY = "application:status-snapshot:%s"
+STATUS_CHANGED_SESSION_KEY = "status_snapshot_changed_at"
+
+
+class StatusSnapshot(NamedTuple):
+    """
+    The parts of a user's application shown on the status page. `pk` is None if the user hasn't applied.
+    """
+
+    pk: Optional[uuid.UUID] = None
+    status: Optional[str] = None
+    confirmation_deadline: Optional[timezone.datetime] = None
+
+    def get_absolute_url(self) -> str:
+        return reverse_lazy("application:update", args=[self.pk])
+
+
+# This process's copies of snapshots, as {user id: (expiry, snapshot)}. Every entry lives for the same time, so the
+# oldest entries come first and expired ones can be dropped from the front.
+_local_snapshots: "OrderedDict[int, Tuple[float, StatusSnapshot]]" = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def _local_get(user_id: int) -> Optional[StatusSnapshot]:
+    entry = _local_snapshots.get(user_id)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def _local_set(user_id: int, snapshot: StatusSnapshot) -> None:
+    now = time.monotonic()
+    with _local_lock:
+        _local_snapshots.pop(user_id, None)
+        _local_snapshots[user_id] = (now + settings.STATUS_SNAPSHOT_LOCAL_TTL, snapshot)
+        while _local_snapshots and next(iter(_local_snapshots.values()))[0] <= now:
+            _local_snapshots.popitem(last=False)
+
+
+def clear_local_snapshots() -> None:
+    with _local_lock:
+        _local_snapshots.clear()
+
+
+def status_snapshot(user_id: int, use_local: bool = True) -> StatusSnapshot:
+    """
+    Returns the snapshot of the given user's application, loading it with a single query if it isn't cached. If
+    `use_local` is False, this process's copy is skipped (and replaced with the one from the shared cache).
+    """
+    snapshot = _local_get(user_id) if use_local else None
+    if snapshot is not None:
+        return snapshot
+    key = STATUS_SNAPSHOT_CACHE_KEY % user_id
+    snapshot = cache.get(key)
+    if snapshot is None:
+        row = (
+            Application.objects.filter(user_id=user_id)
+            .values_list("pk", "status", "confirmation_deadline")
+            .first()
+        )
+        snapshot = StatusSnapshot(*row) if row else StatusSnapshot()
+        cache.set(key, snapshot, settings.STATUS_SNAPSHOT_TIMEOUT)
+    _local_set(user_id, snapshot)
+    return snapshot
+
+
+def request_status_snapshot(request: HttpRequest) -> StatusSnapshot:
+    """
+    Returns the snapshot of the logged-in user's application, fetching it at most once per request.
+    """
+    if not hasattr(request, "_status_snapshot"):
+        changed_at = request.session.get(STATUS_CHANGED_SESSION_KEY)
+        recently_changed = (
+            changed_at is not None
+            and time.time() - changed_at < settings.STATUS_SNAPSHOT_LOCAL_TTL
+        )
+        request._status_snapshot = status_snapshot(
+            request.user.id, use_local=not recently_changed
+        )
+    return request._status_snapshot
+
+
+def mark_status_changed(request: HttpRequest) -> None:
+    """
+    Records that the logged-in user just changed their application, so that their next requests skip the local
+    copies of their snapshot (which processes other than this one may still hold).
+    """
+    request.session[STATUS_CHANGED_SESSION_KEY] = time.time()
+    if hasattr(request, "_status_snapshot"):
+        del request._status_snapshot
+
+
+def invalidate_status_snapshots(user_ids: Iterable[int]) -> None:
+    """
+    Drops the cached snapshots of the given users (from the shared cache and this process). Snapshots are dropped
+    right away and again once the current transaction commits, so that a request that reads the old status in between
+    can't cache it.
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return
+    keys = [STATUS_SNAPSHOT_CACHE_KEY % user_id for user_id in user_ids]
+
+    def drop():
+        with _local_lock:
+            for user_id in user_ids:
+                _local_snapshots.pop(user_id, None)
+        cache.delete_many(keys)
+
+    drop()
+    transaction.on_commit(drop)
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_status_snapshot(instance: Application, **_kwargs) -> None:
+    invalidate_status_snapshots([instance.user_id])
@@ -0,0 +1,221 @@
+"""
+Registration statistics: the number of applications per status, broken down by school, gender, level of study, and
+shirt size. Counts are kept in `ApplicationStatistic` rows that are adjusted whenever applications change (on save and
+delete, and by the bulk status changes in `application.decisions` and elsewhere), so reading them never scans the
+applications table. `rebuild()` recomputes them from scratch, in case they ever drift.
+
+Every application change adjusts the "total" row of its status, so with a single row per count, concurrent saves would
+queue up on the same few rows. Instead, each count is split over `settings.APPLICATION_STATISTIC_SHARDS` rows: a change
+adjusts the rows of one shard chosen at random, and reads sum the shards. A shard's count can be negative (when an
+application is counted in one shard and uncounted in another); only the sum is meaningful.
+"""
+
+import random
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.query import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from application import snapshots
+from application.models import (
+    Application,
+    ApplicationStatistic,
+    School,
+    STATISTIC_FIELDS,
+)
+
+TOTAL = "total"
+DIMENSIONS = (TOTAL,) + tuple(
+    field.replace("_id", "") for field in STATISTIC_FIELDS[1:]
+)
+"""The dimensions statistics are kept for: "total", followed by one per field in `STATISTIC_FIELDS`."""
+
+StatisticKey = Tuple[str, str, str]
+Snapshot = Tuple
+
+
+def snapshot(application: Application) -> Snapshot:
+    return tuple(getattr(application, field) for field in STATISTIC_FIELDS)
+
+
+def statistic_keys(values: Snapshot) -> List[StatisticKey]:
+    """
+    Returns the (dimension, value, status) of every statistic that counts an application with the given values of
+    `STATISTIC_FIELDS`.
+    """
+    status, *fields = values
+    return [(TOTAL, "", status)] + [
+        (dimension, "" if value is None else str(value), status)
+        for dimension, value in zip(DIMENSIONS[1:], fields)
+    ]
+
+
+def count_keys(snapshots: Iterable[Snapshot]) -> Counter:
+    counts = Counter()
+    for values in snapshots:
+        counts.update(statistic_keys(values))
+    return counts
+
+
+def apply_changes(before: Counter, after: Counter) -> None:
+    """
+    Adjusts the statistics by the difference between two counts (as returned by `count_keys`). Keys that change by
+    the same amount are updated together, so a bulk change costs a handful of queries.
+    """
+    deltas = Counter(after)
+    deltas.subtract(before)
+    keys_by_delta: Dict[int, List[StatisticKey]] = defaultdict(list)
+    for key, delta in deltas.items():
+        if delta:
+            keys_by_delta[delta].append(key)
+    if not keys_by_delta:
+        return
+
+    shard = random.randrange(settings.APPLICATION_STATISTIC_SHARDS)
+    ApplicationStatistic.objects.bulk_create(
+        [
+            ApplicationStatistic(
+                dimension=dimension, value=value, status=status, shard=shard
+            )
+            for keys in keys_by_delta.values()
+            for dimension, value, status in keys
+        ],
+        ignore_conflicts=True,
+    )
+    for delta, keys in keys_by_delta.items():
+        matches = Q()
+        for dimension, value, status in keys:
+            matches |= Q(dimension=dimension, value=value, status=status)
+        ApplicationStatistic.objects.filter(matches, shard=shard).update(
+            count=F("count") + delta
+        )
+
+
+def record_status_change(
+    applications: Iterable[Application], previous_statuses: Iterable[str]
+) -> None:
+    """
+    Updates the statistics after the given applications (which already have their new status) changed from the
+    given previous statuses.
+    """
+    before, after = [], []
+    for application, previous_status in zip(applications, previous_statuses):
+        values = snapshot(application)
+        before.append((previous_status,) + values[1:])
+        after.append(values)
+        application._statistics_snapshot = values
+    apply_changes(count_keys(before), count_keys(after))
+
+
+def update_status(queryset: QuerySet, status: str) -> int:
+    """
+    Sets the status of every application in `queryset` (like `queryset.update(status=status)`), and updates the
+    statistics and status snapshots (see `application.snapshots`) to match. Returns the number of applications
+    updated.
+
+    Should be called inside of a transaction.
+    """
+    rows = list(
+        queryset.exclude(status=status)
+        .select_for_update()
+        .values_list("pk", "user_id", *STATISTIC_FIELDS)
+    )
+    if not rows:
+        return 0
+    updated = Application.objects.filter(pk__in=[row[0] for row in rows]).update(
+        status=status
+    )
+    snapshots.invalidate_status_snapshots(row[1] for row in rows)
+    before = [row[2:] for row in rows]
+    apply_changes(
+        count_keys(before), count_keys((status,) + values[1:] for values in before)
+    )
+    return updated
+
+
+def rebuild() -> None:
+    """
+    Recomputes all statistics from the applications table (into a single shard).
+    """
+    with transaction.atomic():
+        statistics = []
+        for dimension, field in zip(DIMENSIONS, (None,) + STATISTIC_FIELDS[1:]):
+            group_by = ["status"] + ([field] if field else [])
+            rows = Application.objects.values(*group_by).annotate(count=Count("pk"))
+            for row in rows.order_by():
+                value = row.get(field) if field else ""
+                statistics.append(
+                    ApplicationStatistic(
+                        dimension=dimension,
+                        value="" if value is None else str(value),
+                        status=row["status"],
+                        count=row["count"],
+                    )
+                )
+        ApplicationStatistic.objects.all().delete()
+        ApplicationStatistic.objects.bulk_create(statistics)
+
+
+def statistics() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """
+    Returns the statistics as {dimension: {value: {status: count}}}. Schools are reported by name.
+    """
+    result: Dict[str, Dict[str, Dict[str, int]]] = {
+        dimension: defaultdict(dict) for dimension in DIMENSIONS
+    }
+    rows = (
+        ApplicationStatistic.objects.values("dimension", "value", "status")
+        .annotate(total=Sum("count"))
+        .filter(total__gt=0)
+        .order_by()
+        .values_list("dimension", "value", "status", "total")
+    )
+    for dimension, value, status, count in rows:
+        if dimension in result:
+            result[dimension][value][status] = count
+
+    school_ids = [value for value in result["school"] if value]
+    names = dict(School.objects.filter(pk__in=school_ids).values_list("pk", "name"))
+    result["school"] = {
+        names.get(int(value), value) if value else "": counts
+        for value, counts in result["school"].items()
+    }
+    return {dimension: dict(values) for dimension, values in result.items()}
+
+
+@receiver(pre_save, sender=Application)
+def remember_statistics_snapshot(instance: Application, **_kwargs) -> None:
+    # Applications that weren't loaded with all of `STATISTIC_FIELDS` need their previous values fetched.
+    if instance._state.adding or hasattr(instance, "_statistics_snapshot"):
+        return
+    instance._statistics_snapshot = (
+        Application.objects.filter(pk=instance.pk)
+        .values_list(*STATISTIC_FIELDS)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Application)
+def update_statistics_on_save(
+    instance: Application, created: bool = False, **_kwargs
+) -> None:
+    previous: Optional[Snapshot] = (
+        None if created else getattr(instance, "_statistics_snapshot", None)
+    )
+    current = snapshot(instance)
+    if previous != current:
+        apply_changes(count_keys([previous] if previous else []), count_keys([current]))
+    instance._statistics_snapshot = current
+
+
+@receiver(post_delete, sender=Application)
+def update_statistics_on_delete(instance: Application, **_kwargs) -> None:
+    apply_changes(
+        count_keys([getattr(instance, "_statistics_snapshot", snapshot(instance))]),
+        Counter(),
+    )
@@ -4,3 +4,7 @@ from .admin_tests import *
 from .form_tests import *
 from .management_tests import *
 from .email_tests import *
+from .decision_tests import *
+from .discord_tests import *
+from .stats_tests import *
+from .resume_book_tests import *
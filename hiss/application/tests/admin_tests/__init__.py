@@ -1 +1,3 @@
 from .application import *
+from .exports import *
+from .changelist import *
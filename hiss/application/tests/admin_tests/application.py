@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.core import mail
+from django.core.management import call_command
 from django.urls import reverse_lazy
 from django.utils import timezone
 
@@ -58,6 +59,7 @@ class ApplicationAdminTestCase(test_case.SharedTestCase):
         self.client.post(
             change_url, {"action": "approve", admin.ACTION_CHECKBOX_NAME: [self.app.pk]}
         )
+        call_command("sendqueuedmail")
 
         self.assertEqual(len(mail.outbox), 1)
 
@@ -70,6 +72,7 @@ class ApplicationAdminTestCase(test_case.SharedTestCase):
             {"action": "reject", admin.ACTION_CHECKBOX_NAME: [self.app.pk]},
             follow=True,
         )
+        call_command("sendqueuedmail")
 
         self.assertEqual(len(mail.outbox), 1)
 
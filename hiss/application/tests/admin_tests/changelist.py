@@ -0,0 +1,50 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from application.models import Application
+from shared import test_case
+from user.models import User
+
+
+class ApplicationChangelistTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.client.force_login(self.admin)
+
+    def create_applications(self, count: int):
+        for _ in range(count):
+            user = User.objects.create_user(
+                f"hacker{User.objects.count()}@dummy.com", self.password
+            )
+            Application.objects.create(
+                **{**self.application_fields, "user": user}, wave=self.wave1
+            )
+
+    def count_changelist_queries(self, **params) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse_lazy("admin:application_application_changelist"), params
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_is_constant(self):
+        self.create_applications(2)
+        few = self.count_changelist_queries()
+
+        self.create_applications(10)
+        many = self.count_changelist_queries()
+
+        self.assertEqual(few, many)
+
+    def test_can_sort_by_annotated_columns(self):
+        self.create_applications(3)
+        # "o" indexes into list_display; column 4 is user_email
+        response = self.client.get(
+            reverse_lazy("admin:application_application_changelist"), {"o": "-4"}
+        )
+
+        emails = [app.user_email for app in response.context["cl"].result_list]
+        self.assertEqual(emails, sorted(emails, reverse=True))
@@ -0,0 +1,83 @@
+import csv
+import io
+
+from django.http import StreamingHttpResponse
+
+from application.admin import (
+    export_application_emails,
+    export_application_prizes,
+    export_application_tshirts,
+    interested_in_hacklahoma_export,
+)
+from application.models import Application, School
+from shared import test_case
+from user.models import User
+
+
+def read_csv(response: StreamingHttpResponse):
+    content = b"".join(response.streaming_content).decode()
+    return list(csv.reader(io.StringIO(content)))
+
+
+class ApplicationExportTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        other = School.objects.create(name="Other")
+        for i in range(5):
+            user = User.objects.create_user(f"hacker{i}@dummy.com", self.password)
+            Application.objects.create(
+                **{
+                    **self.application_fields,
+                    "user": user,
+                    "school": other if i == 0 else self.first_school,
+                    "school_other": "Write-in University",
+                    "shipping_address": i % 2 == 0,
+                    "checked_in": True,
+                },
+                wave=self.wave1,
+            )
+
+    def test_export_emails_streams_rows_in_one_query(self):
+        response = export_application_emails(None, None, Application.objects.all())
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        with self.assertNumQueries(1):
+            rows = read_csv(response)
+
+        self.assertEqual(rows[0][2], "E-Mail")
+        self.assertEqual(len(rows), 6)
+        self.assertCountEqual(
+            [row[2] for row in rows[1:]], [f"hacker{i}@dummy.com" for i in range(5)]
+        )
+        self.assertIn("Write-in University", [row[4] for row in rows[1:]])
+        self.assertEqual(rows[1][5], "Undergrad University")
+
+    def test_export_tshirts_filters_in_query(self):
+        with self.assertNumQueries(1):
+            rows = read_csv(
+                export_application_tshirts(None, None, Application.objects.all())
+            )
+
+        self.assertEqual(len(rows), 4)
+
+    def test_export_prizes(self):
+        rows = read_csv(
+            export_application_prizes(None, None, Application.objects.all())
+        )
+
+        self.assertEqual(rows[1], [self.first_name, self.last_name, "D"])
+
+    def test_interested_in_hacklahoma_export(self):
+        Application.objects.filter(user__email="hacker1@dummy.com").update(
+            interested_in_hacklahoma=True,
+            school=School.objects.create(name="University of Oklahoma"),
+        )
+
+        rows = read_csv(
+            interested_in_hacklahoma_export(None, None, Application.objects.all())
+        )
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][2], "hacker1@dummy.com")
+        self.assertEqual(rows[1][5], "University of Oklahoma")
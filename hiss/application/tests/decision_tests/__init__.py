@@ -0,0 +1,2 @@
+from .decisions import *
+from .admission import *
@@ -0,0 +1,151 @@
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.test import override_settings
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from application import admission
+from application.models import (
+    Application,
+    Wave,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_CONFIRMED,
+    STATUS_DECLINED,
+    STATUS_EXPIRED,
+    STATUS_PENDING,
+)
+from shared import test_case
+from shared.models import OutgoingEmail
+from team.models import Team
+from user.models import User
+
+
+class AdmissionPlanTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.past_wave = Wave.objects.create(
+            start=self.wave1.start - timezone.timedelta(days=60),
+            end=self.wave1.start - timezone.timedelta(days=30),
+            num_days_to_rsvp=5,
+        )
+        # Half of the past wave's admitted hackers came, so every wave is estimated to yield 50%.
+        past_statuses = [STATUS_CONFIRMED] * 4 + [STATUS_CHECKED_IN]
+        past_statuses += [STATUS_DECLINED] * 3 + [STATUS_EXPIRED] * 2
+        for i, status in enumerate(past_statuses):
+            self.create_application("past%s@dummy.com" % i, self.past_wave, status)
+        self.team = Team.objects.create(name="Team")
+        for i in range(20):
+            self.create_application(
+                "hacker%s@dummy.com" % i,
+                self.wave1,
+                STATUS_PENDING,
+                team=self.team if i < 4 else None,
+            )
+
+    def create_application(self, email, wave, status, team=None):
+        user = User.objects.create_user(email, self.password, team=team)
+        application = Application.objects.create(
+            **{**self.application_fields, "user": user}, wave=wave
+        )
+        Application.objects.filter(pk=application.pk).update(status=status)
+
+    def test_estimates_smoothed_yields(self):
+        yields = admission.estimate_yields(
+            {1: {STATUS_CONFIRMED: 10, STATUS_DECLINED: 10}, 2: {STATUS_PENDING: 5}}
+        )
+
+        self.assertEqual(yields, {None: 0.5, 1: 0.5, 2: 0.5})
+
+    @override_settings(ADMISSION_DEFAULT_YIELD=0.25)
+    def test_uses_default_yield_without_history(self):
+        yields = admission.estimate_yields({1: {STATUS_ADMITTED: 10}})
+
+        self.assertEqual(yields, {None: 0.25, 1: 0.25})
+
+    def test_plan_fills_remaining_seats(self):
+        # 5 hackers are coming, so 10 more admissions are expected to bring 5 more.
+        with self.assertNumQueries(2):
+            plan = admission.plan_admissions(10, seed=1)
+
+        self.assertEqual(plan.committed, 5)
+        self.assertEqual(len(plan.pks), 10)
+        self.assertEqual(plan.expected, 5)
+        self.assertEqual(plan.num_pending, 20)
+        self.assertEqual(
+            Application.objects.filter(pk__in=plan.pks, status=STATUS_PENDING).count(),
+            10,
+        )
+
+    def test_plan_accounts_for_outstanding_admissions(self):
+        Application.objects.filter(
+            pk__in=list(
+                Application.objects.filter(status=STATUS_PENDING).values_list(
+                    "pk", flat=True
+                )[:4]
+            )
+        ).update(status=STATUS_ADMITTED)
+
+        plan = admission.plan_admissions(10, seed=1)
+
+        self.assertEqual(plan.outstanding, 2)
+        self.assertEqual(len(plan.pks), 6)
+
+    def test_plan_is_reproducible_with_a_seed(self):
+        self.assertEqual(
+            admission.plan_admissions(10, seed=7).pks,
+            admission.plan_admissions(10, seed=7).pks,
+        )
+
+    def test_plan_admits_nobody_once_target_is_met(self):
+        plan = admission.plan_admissions(5)
+
+        self.assertEqual(plan.pks, [])
+
+    def test_plan_keeps_teams_together(self):
+        team_pks = set(
+            Application.objects.filter(user__team=self.team).values_list(
+                "pk", flat=True
+            )
+        )
+        for seed in range(10):
+            plan = admission.plan_admissions(10, keep_teams=True, seed=seed)
+            picked = team_pks & set(plan.pks)
+            self.assertIn(picked, [set(), team_pks])
+            self.assertEqual(plan.num_teams, 1 if picked else 0)
+            self.assertGreaterEqual(plan.total_expected, 10)
+
+    def test_plan_only_considers_candidates(self):
+        candidates = Application.objects.filter(user__team=self.team)
+
+        plan = admission.plan_admissions(10, candidates=candidates, seed=1)
+
+        self.assertEqual(set(plan.pks), set(candidates.values_list("pk", flat=True)))
+
+    def test_admin_action_shows_plan_before_admitting(self):
+        self.client.force_login(self.admin)
+        url = reverse_lazy("admin:application_application_changelist")
+        data = {
+            "action": "admit_to_capacity",
+            "select_across": "1",
+            ACTION_CHECKBOX_NAME: [Application.objects.first().pk],
+        }
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Applications to admit")
+
+        response = self.client.post(
+            url, {**data, "target": 10, "seed": 3, "plan": "Show plan"}
+        )
+        self.assertContains(response, "Applications to admit: 10 of 20 pending")
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 0)
+
+        planned = set(admission.plan_admissions(10, seed=3).pks)
+        response = self.client.post(
+            url, {**data, "target": 10, "seed": 3, "apply": "Admit"}
+        )
+        self.assertEqual(response.status_code, 302)
+        admitted = Application.objects.filter(status=STATUS_ADMITTED)
+        self.assertEqual(set(admitted.values_list("pk", flat=True)), planned)
+        self.assertEqual(OutgoingEmail.objects.count(), 10)
@@ -0,0 +1,102 @@
+from unittest import mock
+
+from django.core import mail
+from django.utils import timezone
+
+from application import decisions
+from application.admin import approve, reject
+from application.models import (
+    Application,
+    Wave,
+    STATUS_ADMITTED,
+    STATUS_PENDING,
+    STATUS_REJECTED,
+)
+from shared import test_case
+from shared.models import OutgoingEmail
+from user.models import User
+
+
+class BulkDecisionTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.wave2 = Wave.objects.create(
+            start=self.wave1.end,
+            end=self.wave1.end + timezone.timedelta(days=5),
+            num_days_to_rsvp=3,
+        )
+        for i in range(6):
+            user = User.objects.create_user(f"hacker{i}@dummy.com", self.password)
+            Application.objects.create(
+                **{**self.application_fields, "user": user},
+                wave=self.wave1 if i % 2 else self.wave2,
+            )
+
+    def test_admit_sets_status_and_per_wave_deadline(self):
+        now = timezone.now()
+        decisions.admit(Application.objects.all(), now=now)
+
+        for app in Application.objects.select_related("wave"):
+            self.assertEqual(app.status, STATUS_ADMITTED)
+            self.assertEqual(
+                app.confirmation_deadline,
+                decisions.confirmation_deadline(app.wave.num_days_to_rsvp, now),
+            )
+
+    def test_admit_uses_constant_number_of_queries(self):
+        # One SELECT, one UPDATE per wave, and three queries to adjust the statistics
+        with self.assertNumQueries(6):
+            decisions.admit(Application.objects.all())
+
+    def test_admit_returns_previous_status_counts(self):
+        Application.objects.filter(pk=Application.objects.first().pk).update(
+            status=STATUS_REJECTED
+        )
+
+        result = decisions.admit(Application.objects.all())
+
+        self.assertEqual(result.total, 6)
+        self.assertEqual(result.counts, {STATUS_PENDING: 5, STATUS_REJECTED: 1})
+
+    def test_admit_accepts_sliced_querysets(self):
+        decisions.admit(Application.objects.order_by("?")[:2])
+
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 2)
+
+    def test_admit_accepts_lists_of_applications(self):
+        apps = list(Application.objects.all()[:3])
+
+        result = decisions.admit(apps)
+
+        self.assertEqual(result.total, 3)
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 3)
+
+    def test_reject_uses_single_update(self):
+        # One SELECT, one UPDATE, and three queries to adjust the statistics
+        with self.assertNumQueries(5):
+            result = decisions.reject(Application.objects.all())
+
+        self.assertEqual(result.counts, {STATUS_PENDING: 6})
+        self.assertEqual(Application.objects.filter(status=STATUS_REJECTED).count(), 6)
+
+    def test_approve_action_only_enqueues_emails(self):
+        approve(None, None, Application.objects.all())
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutgoingEmail.objects.count(), 6)
+
+    def test_approving_twice_in_a_day_queues_one_email(self):
+        approve(None, None, Application.objects.all())
+        approve(None, None, Application.objects.all())
+
+        self.assertEqual(OutgoingEmail.objects.count(), 6)
+
+    def test_rejecting_again_on_a_later_day_queues_another_email(self):
+        reject(None, None, Application.objects.all())
+        Application.objects.update(status=STATUS_ADMITTED)
+        tomorrow = timezone.now() + timezone.timedelta(days=1)
+        with mock.patch("django.utils.timezone.now", return_value=tomorrow):
+            reject(None, None, Application.objects.all())
+
+        self.assertEqual(OutgoingEmail.objects.count(), 12)
@@ -0,0 +1,105 @@
+import os
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from application import discord
+from application.checkins import queue_check_in, send_queued_check_ins
+from application.models import (
+    CHECK_IN_FAILED,
+    CHECK_IN_QUEUED,
+    CHECK_IN_SENDING,
+    CHECK_IN_SENT,
+    DiscordCheckIn,
+)
+from application.tests.discord_tests.fake_bot import FakeDiscordBot
+from shared import test_case
+
+
+class DiscordCheckInQueueTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.bot = FakeDiscordBot().__enter__()
+        self.addCleanup(self.bot.__exit__)
+        environ = mock.patch.dict(
+            os.environ,
+            {
+                "DISCORD_BOT_URL": self.bot.url,
+                "REG_USERNAME": "Test",
+                "REG_PASSWORD": "Test",
+            },
+        )
+        environ.start()
+        self.addCleanup(environ.stop)
+        discord.reset_client()
+        self.addCleanup(discord.reset_client)
+
+    def test_sends_queued_check_ins(self):
+        queue_check_in("1234", "Kennedy Doe", "Snakes")
+
+        self.assertEqual(send_queued_check_ins(), (1, 0))
+
+        self.assertEqual(self.bot.check_ins[0]["discord_id"], "1234")
+        self.assertEqual(self.bot.check_ins[0]["team_name"], "Snakes")
+        check_in = DiscordCheckIn.objects.get()
+        self.assertEqual(check_in.status, CHECK_IN_SENT)
+        self.assertIsNotNone(check_in.sent_at)
+        # Sent check-ins are never resent.
+        self.assertEqual(send_queued_check_ins(), (0, 0))
+
+    def test_unavailable_bot_is_retried_with_backoff(self):
+        queue_check_in("1234", "Kennedy Doe")
+        self.bot.status = 503
+
+        self.assertEqual(send_queued_check_ins(), (0, 1))
+
+        check_in = DiscordCheckIn.objects.get()
+        self.assertEqual(check_in.status, CHECK_IN_QUEUED)
+        self.assertEqual(check_in.attempts, 1)
+        self.assertIn("503", check_in.last_error)
+        self.assertGreater(check_in.next_attempt_at, timezone.now())
+        # Not due yet, so nothing is sent.
+        self.bot.status = None
+        self.assertEqual(send_queued_check_ins(), (0, 0))
+
+        DiscordCheckIn.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(send_queued_check_ins(), (1, 0))
+        self.assertEqual(len(self.bot.check_ins), 1)
+
+    @override_settings(DISCORD_CHECK_IN_MAX_ATTEMPTS=1)
+    def test_gives_up_after_max_attempts(self):
+        queue_check_in("1234", "Kennedy Doe")
+        self.bot.status = 503
+
+        send_queued_check_ins()
+
+        self.assertEqual(DiscordCheckIn.objects.get().status, CHECK_IN_FAILED)
+
+    def test_stale_claims_are_reclaimed(self):
+        stale = queue_check_in("1234", "Kennedy Doe")
+        fresh = queue_check_in("5678", "Kris Doh")
+        now = timezone.now()
+        DiscordCheckIn.objects.filter(pk=stale.pk).update(
+            status=CHECK_IN_SENDING, claimed_at=now - timezone.timedelta(minutes=6)
+        )
+        DiscordCheckIn.objects.filter(pk=fresh.pk).update(
+            status=CHECK_IN_SENDING, claimed_at=now
+        )
+
+        self.assertEqual(send_queued_check_ins(), (1, 0))
+
+        self.assertEqual(self.bot.check_ins[0]["discord_id"], "1234")
+        fresh.refresh_from_db()
+        self.assertEqual(fresh.status, CHECK_IN_SENDING)
+
+    def test_command_sends_every_due_check_in(self):
+        for i in range(5):
+            queue_check_in(str(i), "Hacker %s" % i)
+
+        call_command("sendcheckins", "--batch-size", "2", stdout=StringIO())
+
+        self.assertEqual(len(self.bot.check_ins), 5)
+        self.assertFalse(DiscordCheckIn.objects.exclude(status=CHECK_IN_SENT).exists())
@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from application.discord import (
+    DiscordBotClient,
+    DiscordBotError,
+    DiscordBotUnavailable,
+)
+from application.tests.discord_tests.fake_bot import FakeDiscordBot
+
+
+class DiscordBotClientTestCase(TestCase):
+    def setUp(self):
+        self.bot = FakeDiscordBot().__enter__()
+        self.addCleanup(self.bot.__exit__)
+        self.client = DiscordBotClient(
+            self.bot.url,
+            "Test",
+            "Test",
+            connect_timeout=0.5,
+            read_timeout=0.5,
+            retries=0,
+            failure_threshold=2,
+            reset_timeout=60,
+        )
+        self.addCleanup(self.client.close)
+
+    def test_user_exists(self):
+        self.bot.members.add("1234")
+        self.assertTrue(self.client.user_exists("1234"))
+        self.assertFalse(self.client.user_exists("5678"))
+
+    def test_check_in_sends_check_in(self):
+        self.client.check_in("1234", "Kennedy Doe", "Team")
+
+        self.assertEqual(
+            self.bot.check_ins,
+            [
+                {
+                    "discord_id": "1234",
+                    "name": "Kennedy Doe",
+                    "team_name": "Team",
+                    "request_user": "Test",
+                    "request_pass": "Test",
+                }
+            ],
+        )
+
+    def test_slow_bot_times_out(self):
+        self.bot.delay = 1
+        with self.assertRaises(DiscordBotUnavailable):
+            self.client.user_exists("1234")
+
+    def test_wrong_credentials_raise(self):
+        client = DiscordBotClient(self.bot.url, "Test", "wrong", retries=0)
+        self.addCleanup(client.close)
+        with self.assertRaises(DiscordBotError):
+            client.user_exists("1234")
+
+    def test_circuit_opens_after_repeated_failures(self):
+        self.bot.status = 503
+        for _ in range(2):
+            with self.assertRaises(DiscordBotUnavailable):
+                self.client.user_exists("1234")
+        requests_made = self.bot.requests
+
+        self.bot.status = None
+        with self.assertRaises(DiscordBotUnavailable):
+            self.client.user_exists("1234")
+        self.assertEqual(self.bot.requests, requests_made)
+
+    def test_circuit_closes_after_successful_trial(self):
+        self.bot.status = 503
+        for _ in range(2):
+            with self.assertRaises(DiscordBotUnavailable):
+                self.client.user_exists("1234")
+
+        self.bot.status = None
+        self.client.breaker.reset_timeout = 0
+        self.assertFalse(self.client.user_exists("1234"))
+        self.assertIsNone(self.client.breaker.opened_at)
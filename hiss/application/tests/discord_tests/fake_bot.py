@@ -0,0 +1,83 @@
+"""
+A fake Discord bot server for tests, listening on a random local port.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients that time out close their connection before the (slow) response is written.
+        pass
+
+
+class FakeDiscordBot:
+    """
+    Serves the bot's `check_user/<discord_id>` and `check_in` endpoints. `members` holds the Discord ids that have
+    joined the server, and `check_ins` records the bodies of check-in requests. Setting `delay` makes every response
+    slow, and setting `status` makes every response fail with that status code.
+    """
+
+    def __init__(self, request_user: str = "Test", request_pass: str = "Test"):
+        self.credentials = {"request_user": request_user, "request_pass": request_pass}
+        self.members: Set[str] = set()
+        self.check_ins: List[Dict] = []
+        self.requests = 0
+        self.delay = 0.0
+        self.status: Optional[int] = None
+        self.server = QuietHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return "http://127.0.0.1:%s/" % self.server.server_address[1]
+
+    def __enter__(self) -> "FakeDiscordBot":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        bot = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_args):
+                pass
+
+            def _respond(self, status: int, body: Optional[Dict] = None):
+                payload = json.dumps(body or {}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _handle(self):
+                bot.requests += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                time.sleep(bot.delay)
+                if bot.status is not None:
+                    return self._respond(bot.status)
+                if any(body.get(k) != v for k, v in bot.credentials.items()):
+                    return self._respond(403)
+                if self.command == "GET" and self.path.startswith("/check_user/"):
+                    discord_id = self.path.split("/check_user/", 1)[1]
+                    return self._respond(200, {"exists": discord_id in bot.members})
+                if self.command == "PUT" and self.path == "/check_in":
+                    bot.check_ins.append(body)
+                    return self._respond(200)
+                return self._respond(404)
+
+            do_GET = _handle
+            do_PUT = _handle
+
+        return Handler
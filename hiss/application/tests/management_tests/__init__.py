@@ -1,2 +1,5 @@
 from .expire import *
 from .randomadmit import *
+from .renderbadges import *
+from .admit import *
+from .explainqueries import *
@@ -0,0 +1,32 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from application.models import Application, STATUS_ADMITTED
+from shared import test_case
+from user.models import User
+
+
+class AdmitManagementCommandTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        for i in range(6):
+            user = User.objects.create_user("hacker%s@dummy.com" % i, self.password)
+            Application.objects.create(
+                **{**self.application_fields, "user": user}, wave=self.wave1
+            )
+
+    def test_dry_run_admits_nobody(self):
+        out = StringIO()
+
+        call_command("admit", "3", "--dry-run", stdout=out)
+
+        self.assertIn("Applications to admit: 5 of 6 pending", out.getvalue())
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 0)
+
+    def test_admits_to_target(self):
+        # Without any history, admitted hackers are expected to attend at the default yield of 60%.
+        call_command("admit", "3", stdout=StringIO())
+
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 5)
@@ -1,10 +1,19 @@
 from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
 from django.core.management import call_command
 from django.utils import timezone
 
-from application.models import Application, STATUS_EXPIRED, STATUS_ADMITTED
+from application import expiration
+from application.models import (
+    Application,
+    STATUS_ADMITTED,
+    STATUS_CONFIRMED,
+    STATUS_EXPIRED,
+)
 from shared import test_case
+from shared.models import OutgoingEmail
 
 
 class ExpireManagementCommandTestCase(test_case.SharedTestCase):
@@ -28,3 +37,74 @@ class ExpireManagementCommandTestCase(test_case.SharedTestCase):
         call_command("expire")
 
         self.assertEqual(Application.objects.filter(status=STATUS_EXPIRED).count(), 1)
+
+
+class ExpirationTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        yesterday = timezone.now() - timedelta(days=1)
+        self.late = Application.objects.create(
+            **self.application_fields, wave=self.wave1
+        )
+        self.on_time = Application.objects.create(
+            **{**self.application_fields, "user": self.user2}, wave=self.wave1
+        )
+        self.confirmed = Application.objects.create(
+            **{**self.application_fields, "user": self.admin}, wave=self.wave1
+        )
+        Application.objects.filter(pk=self.late.pk).update(
+            status=STATUS_ADMITTED, confirmation_deadline=yesterday
+        )
+        Application.objects.filter(pk=self.on_time.pk).update(
+            status=STATUS_ADMITTED,
+            confirmation_deadline=timezone.now() + timedelta(days=1),
+        )
+        Application.objects.filter(pk=self.confirmed.pk).update(
+            status=STATUS_CONFIRMED, confirmation_deadline=yesterday
+        )
+
+    def assertOnlyLateApplicationExpired(self, expired):
+        self.assertEqual([application.pk for application in expired], [self.late.pk])
+        self.assertEqual(
+            list(
+                Application.objects.filter(status=STATUS_EXPIRED).values_list(
+                    "pk", flat=True
+                )
+            ),
+            [self.late.pk],
+        )
+
+    def test_expires_and_notifies_late_applications(self):
+        expired = expiration.expire_applications()
+
+        self.assertOnlyLateApplicationExpired(expired)
+        self.assertEqual(
+            list(OutgoingEmail.objects.values_list("recipients", flat=True)),
+            [self.email],
+        )
+
+    def test_expires_without_returning(self):
+        with mock.patch.object(expiration, "supports_returning", return_value=False):
+            expired = expiration.expire_applications()
+
+        self.assertOnlyLateApplicationExpired(expired)
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+
+    def test_expiring_again_does_nothing(self):
+        expiration.expire_applications()
+
+        self.assertEqual(expiration.expire_applications(), [])
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+
+    def test_loop_keeps_sweeping(self):
+        sleep = mock.patch(
+            "application.management.commands.expire.time.sleep",
+            side_effect=[None, KeyboardInterrupt],
+        )
+        out = StringIO()
+
+        with sleep, self.assertRaises(KeyboardInterrupt):
+            call_command("expire", "--loop", stdout=out)
+
+        self.assertEqual(out.getvalue(), "1 applications successfully expired\n")
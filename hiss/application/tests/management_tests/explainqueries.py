@@ -0,0 +1,14 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from shared import test_case
+
+
+class ExplainQueriesManagementCommandTestCase(test_case.SharedTestCase):
+    def test_shows_a_plan_per_hot_query(self):
+        out = StringIO()
+
+        call_command("explainqueries", stdout=out)
+
+        self.assertIn("Expiration sweep", out.getvalue())
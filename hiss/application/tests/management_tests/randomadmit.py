@@ -1,4 +1,5 @@
 from datetime import timedelta
+from io import StringIO
 
 from django.core.management import call_command
 from django.utils import timezone
@@ -28,3 +29,11 @@ class ExpireManagementCommandTestCase(test_case.SharedTestCase):
         call_command("randomadmit", ".5")
 
         self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 1)
+
+    def test_admits_everyone_above_one_hundred_percent(self):
+        self.create_active_wave()
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+
+        call_command("randomadmit", "1.5", stdout=StringIO())
+
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 1)
@@ -0,0 +1,31 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from application.badges import badge_qr_key, badge_token
+from application.models import (
+    Application,
+    BadgeQRCode,
+    STATUS_CONFIRMED,
+    STATUS_PENDING,
+)
+from shared import test_case
+
+
+class RenderBadgesManagementCommandTestCase(test_case.SharedTestCase):
+    def test_renders_badges_of_confirmed_apps(self):
+        self.create_active_wave()
+        confirmed = Application.objects.create(
+            **self.application_fields, wave=self.wave1, status=STATUS_CONFIRMED
+        )
+        pending = Application.objects.create(
+            **{**self.application_fields, "user": self.user2},
+            wave=self.wave1,
+            status=STATUS_PENDING
+        )
+
+        call_command("renderbadges", processes=1, stdout=StringIO())
+
+        stored = BadgeQRCode.objects.values_list("key", flat=True)
+        self.assertEqual(list(stored), [badge_qr_key(badge_token(confirmed.pk))])
+        self.assertNotIn(badge_qr_key(badge_token(pending.pk)), stored)
@@ -1,2 +1,3 @@
 from .application import *
 from .wave import *
+from .badge import *
@@ -1,3 +1,5 @@
+from django.db import IntegrityError, transaction
+
 from application.models import Application
 from shared import test_case
 
@@ -8,3 +10,14 @@ class ApplicationModelTestCase(test_case.SharedTestCase):
         application = Application(**self.application_fields, wave=self.wave1)
         application.save()
         self.assertNotEqual(self.resume_file_name, application.resume.name)
+
+    def test_discord_id_is_unique_when_linked(self):
+        self.create_active_wave()
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+        Application.objects.create(
+            **{**self.application_fields, "user": self.user2}, wave=self.wave1
+        )
+
+        Application.objects.filter(user=self.user).update(discord_id="1234")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Application.objects.filter(user=self.user2).update(discord_id="1234")
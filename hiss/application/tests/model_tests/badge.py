@@ -0,0 +1,44 @@
+import uuid
+
+from application.badges import (
+    badge_qr_key,
+    badge_qr_png,
+    badge_token,
+    store_badge_qrs,
+)
+from application.models import Application, BadgeQRCode, STATUS_CONFIRMED
+from shared import test_case
+
+
+class BadgeTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.app = Application.objects.create(
+            **self.application_fields, wave=self.wave1, status=STATUS_CONFIRMED
+        )
+
+    def test_token_is_compact_and_alphanumeric(self):
+        token = badge_token(self.app.pk)
+        self.assertLessEqual(len(token), 44)
+        self.assertTrue(token.isalnum() and token.isupper())
+        self.assertNotIn(self.app.user.email.upper(), token)
+
+    def test_tokens_differ_between_applications(self):
+        self.assertNotEqual(badge_token(self.app.pk), badge_token(uuid.uuid4()))
+        self.assertEqual(badge_token(self.app.pk), badge_token(self.app.pk))
+
+    def test_qr_code_is_rendered_in_memory_without_storing(self):
+        with self.assertNumQueries(1):
+            png = badge_qr_png(self.app)
+
+        self.assertTrue(png.startswith(b"\x89PNG"))
+        self.assertFalse(BadgeQRCode.objects.exists())
+
+    def test_uses_pre_rendered_qr_code(self):
+        token = badge_token(self.app.pk)
+        store_badge_qrs([(token, b"pre-rendered")])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(badge_qr_png(self.app), b"pre-rendered")
+        self.assertTrue(BadgeQRCode.objects.filter(key=badge_qr_key(token)).exists())
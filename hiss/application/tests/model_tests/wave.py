@@ -1,5 +1,6 @@
 import pytz
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from application.models import Wave
@@ -48,6 +49,51 @@ class WaveManagerTestCase(test_case.SharedTestCase):
 
         self.assertEqual(Wave.objects.next_wave(), future_wave)
 
+    def test_schedule_is_cached(self):
+        Wave.objects.create(
+            start=timezone.now() - timezone.timedelta(days=5),
+            end=timezone.now() + timezone.timedelta(days=5),
+            num_days_to_rsvp=5,
+        )
+        Wave.objects.active_wave()
+
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(Wave.objects.active_wave())
+            self.assertIsNone(Wave.objects.next_wave())
+
+    def test_saving_a_wave_invalidates_schedule(self):
+        self.assertIsNone(Wave.objects.active_wave())
+
+        curr_wave = Wave.objects.create(
+            start=timezone.now() - timezone.timedelta(days=5),
+            end=timezone.now() + timezone.timedelta(days=5),
+            num_days_to_rsvp=5,
+        )
+        self.assertEqual(Wave.objects.active_wave(), curr_wave)
+
+        curr_wave.delete()
+        self.assertIsNone(Wave.objects.active_wave())
+
+    def test_finds_waves_between_and_after_other_waves(self):
+        now = timezone.now()
+        waves = [
+            Wave.objects.create(
+                start=now + timezone.timedelta(days=i * 10),
+                end=now + timezone.timedelta(days=i * 10 + 5),
+                num_days_to_rsvp=5,
+            )
+            for i in range(5)
+        ]
+
+        gap = now + timezone.timedelta(days=17)
+        self.assertIsNone(Wave.objects.active_wave(gap))
+        self.assertEqual(Wave.objects.next_wave(gap), waves[2])
+        self.assertEqual(
+            Wave.objects.active_wave(now + timezone.timedelta(days=21)), waves[2]
+        )
+        self.assertIsNone(Wave.objects.active_wave(now + timezone.timedelta(days=45)))
+        self.assertIsNone(Wave.objects.next_wave(now + timezone.timedelta(days=45)))
+
 
 class WaveModelTestCase(test_case.SharedTestCase):
     def setUp(self):
@@ -80,3 +126,47 @@ class WaveModelTestCase(test_case.SharedTestCase):
         self.wave2.save()
         self.wave2.refresh_from_db()
         self.assertEqual(new_end, self.wave2.end)
+
+    def test_cant_create_wave_containing_another_wave(self):
+        bad_wave = Wave(
+            start=self.wave2_start - timezone.timedelta(days=1),
+            end=self.wave2_end + timezone.timedelta(days=1),
+            num_days_to_rsvp=5,
+        )
+        with self.assertRaises(ValidationError):
+            bad_wave.full_clean()
+
+    def test_can_create_adjacent_waves(self):
+        before = Wave(
+            start=self.wave2_start - timezone.timedelta(days=5),
+            end=self.wave2_start,
+            num_days_to_rsvp=5,
+        )
+        before.full_clean()
+        before.save()
+        after = Wave(
+            start=self.wave2_end,
+            end=self.wave2_end + timezone.timedelta(days=5),
+            num_days_to_rsvp=5,
+        )
+        after.full_clean()
+        after.save()
+        self.assertEqual(Wave.objects.count(), 3)
+
+    def test_database_rejects_overlapping_waves(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Wave.objects.create(
+                start=self.wave2_start + timezone.timedelta(days=1),
+                end=self.wave2_end + timezone.timedelta(days=1),
+                num_days_to_rsvp=5,
+            )
+
+    def test_database_rejects_moving_a_wave_into_another(self):
+        other = Wave.objects.create(
+            start=self.wave2_end,
+            end=self.wave2_end + timezone.timedelta(days=5),
+            num_days_to_rsvp=5,
+        )
+        other.start = self.wave2_end - timezone.timedelta(days=1)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            other.save()
@@ -0,0 +1 @@
+from .resume_books import *
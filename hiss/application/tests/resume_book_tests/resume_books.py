@@ -0,0 +1,131 @@
+import csv
+import io
+import zipfile
+from io import StringIO
+
+from django.contrib import admin
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse_lazy
+
+from application.models import (
+    Application,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_PENDING,
+)
+from application.resume_book import INDEX_HEADER, entry_name, resume_book
+from shared import test_case
+from user.models import User
+
+
+def read_zip(chunks) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+
+def read_index(archive: zipfile.ZipFile):
+    return list(csv.reader(io.StringIO(archive.read("index.csv").decode())))
+
+
+class ResumeBookTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.apps = []
+        for i in range(5):
+            user = User.objects.create_user(f"hacker{i}@dummy.com", self.password)
+            self.apps.append(
+                Application.objects.create(
+                    **{
+                        **self.application_fields,
+                        "user": user,
+                        "last_name": f"Doe{i}",
+                        "resume": SimpleUploadedFile("resume.pdf", b"resume %d" % i),
+                    },
+                    wave=self.wave1,
+                    status=STATUS_CHECKED_IN if i % 2 else STATUS_ADMITTED,
+                )
+            )
+
+    def test_archive_contains_resumes_and_index(self):
+        archive = read_zip(resume_book(Application.objects.all(), workers=2))
+
+        self.assertEqual(len(archive.namelist()), 6)
+        self.assertEqual(archive.namelist()[-1], "index.csv")
+        for i, app in enumerate(self.apps):
+            name = entry_name(app.pk, app.first_name, app.last_name, app.resume.name)
+            self.assertEqual(archive.read(name), b"resume %d" % i)
+
+        rows = read_index(archive)
+        self.assertEqual(rows[0], INDEX_HEADER)
+        self.assertEqual([row[0] for row in rows[1:]], archive.namelist()[:-1])
+        self.assertEqual(rows[1][2], "Doe0")
+        self.assertEqual(rows[1][3], "hacker0@dummy.com")
+        self.assertEqual(rows[1][4], self.first_school.name)
+        self.assertEqual(rows[1][5], "Undergrad university")
+
+    def test_entry_names_come_from_application(self):
+        app = self.apps[0]
+
+        name = entry_name(app.pk, "Kennedy Ann", "Doe", app.resume.name)
+
+        self.assertEqual(name, "Doe_Kennedy_Ann_%s.pdf" % str(app.pk)[:8])
+
+    def test_applications_without_resumes_are_skipped(self):
+        Application.objects.filter(pk=self.apps[0].pk).update(resume="")
+
+        archive = read_zip(resume_book(Application.objects.all()))
+
+        self.assertEqual(len(read_index(archive)), 5)
+
+    def test_missing_files_are_skipped(self):
+        default_storage.delete(self.apps[0].resume.name)
+
+        with self.assertLogs("application.resume_book", "ERROR"):
+            archive = read_zip(resume_book(Application.objects.all()))
+
+        self.assertEqual(len(archive.namelist()), 5)
+        self.assertNotIn("Doe0", [row[2] for row in read_index(archive)])
+
+    def test_resumes_are_fetched_in_one_query(self):
+        with self.assertNumQueries(1):
+            read_zip(resume_book(Application.objects.all()))
+
+    def test_admin_action_streams_zip(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.post(
+            reverse_lazy("admin:application_application_changelist"),
+            {
+                "action": "export_resume_book",
+                admin.ACTION_CHECKBOX_NAME: [self.apps[0].pk, self.apps[1].pk],
+            },
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertIn("resumes.zip", response["Content-Disposition"])
+        archive = read_zip(response.streaming_content)
+        self.assertEqual(len(read_index(archive)), 3)
+
+    def test_management_command_writes_admitted_resumes(self):
+        Application.objects.filter(pk=self.apps[0].pk).update(status=STATUS_PENDING)
+        path = test_case.TEST_RESUME_DIR + "/book.zip"
+
+        call_command("exportresumes", path, stdout=StringIO())
+
+        with open(path, "rb") as file:
+            archive = read_zip([file.read()])
+        self.assertEqual(len(read_index(archive)), 5)
+
+    def test_management_command_filters_by_status(self):
+        path = test_case.TEST_RESUME_DIR + "/book.zip"
+
+        call_command(
+            "exportresumes", path, status=[STATUS_CHECKED_IN], stdout=StringIO()
+        )
+
+        with open(path, "rb") as file:
+            archive = read_zip([file.read()])
+        self.assertEqual(len(read_index(archive)), 3)
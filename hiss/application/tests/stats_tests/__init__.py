@@ -0,0 +1 @@
+from .stats import *
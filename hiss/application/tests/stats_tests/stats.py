@@ -0,0 +1,145 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from application import decisions, stats
+from application.models import (
+    Application,
+    ApplicationStatistic,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_EXPIRED,
+    STATUS_PENDING,
+)
+from shared import test_case
+
+
+class RegistrationStatisticsTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.app = Application.objects.create(
+            **self.application_fields, wave=self.wave1
+        )
+        self.app2 = Application.objects.create(
+            **{**self.application_fields, "user": self.user2, "shirt_size": "M"},
+            wave=self.wave1,
+        )
+
+    def assertMatchesRebuild(self):
+        incremental = stats.statistics()
+        stats.rebuild()
+        self.assertEqual(incremental, stats.statistics())
+
+    def test_counts_new_applications(self):
+        statistics = stats.statistics()
+        self.assertEqual(statistics["total"], {"": {STATUS_PENDING: 2}})
+        self.assertEqual(
+            statistics["school"], {self.first_school.name: {STATUS_PENDING: 2}}
+        )
+        self.assertEqual(statistics["shirt_size"]["M"], {STATUS_PENDING: 1})
+        self.assertMatchesRebuild()
+
+    def test_tracks_saves_and_deletes(self):
+        self.app.status = STATUS_CHECKED_IN
+        self.app.save()
+        self.app2.shirt_size = "L"
+        self.app2.save()
+        Application.objects.get(pk=self.app2.pk).delete()
+
+        statistics = stats.statistics()
+        self.assertEqual(statistics["total"], {"": {STATUS_CHECKED_IN: 1}})
+        self.assertNotIn("M", statistics["shirt_size"])
+        self.assertNotIn("L", statistics["shirt_size"])
+        self.assertMatchesRebuild()
+
+    def test_tracks_saves_of_partially_loaded_applications(self):
+        app = Application.objects.only("pk", "user").get(pk=self.app.pk)
+        app.status = STATUS_ADMITTED
+        app.save()
+
+        self.assertEqual(
+            stats.statistics()["total"], {"": {STATUS_ADMITTED: 1, STATUS_PENDING: 1}}
+        )
+        self.assertMatchesRebuild()
+
+    def test_tracks_bulk_decisions(self):
+        decisions.admit(Application.objects.all())
+
+        self.assertEqual(stats.statistics()["total"], {"": {STATUS_ADMITTED: 2}})
+        self.assertMatchesRebuild()
+
+    def test_tracks_expiring(self):
+        Application.objects.filter(pk=self.app.pk).update(
+            status=STATUS_ADMITTED,
+            confirmation_deadline=timezone.now() - timedelta(days=1),
+        )
+        stats.rebuild()
+
+        call_command("expire", stdout=StringIO())
+
+        self.assertEqual(
+            stats.statistics()["total"], {"": {STATUS_EXPIRED: 1, STATUS_PENDING: 1}}
+        )
+        self.assertMatchesRebuild()
+
+    def shard_count(self, status: str, shard: int) -> int:
+        row = ApplicationStatistic.objects.filter(
+            dimension="total", status=status, shard=shard
+        ).first()
+        return row.count if row else 0
+
+    @override_settings(APPLICATION_STATISTIC_SHARDS=4)
+    def test_sums_shards(self):
+        # The applications created in setUp were counted in random shards.
+        pending = self.shard_count(STATUS_PENDING, 3)
+        with mock.patch("random.randrange", return_value=3):
+            self.app.status = STATUS_ADMITTED
+            self.app.save()
+
+        self.assertEqual(self.shard_count(STATUS_PENDING, 3), pending - 1)
+        self.assertEqual(
+            stats.statistics()["total"], {"": {STATUS_ADMITTED: 1, STATUS_PENDING: 1}}
+        )
+        self.assertMatchesRebuild()
+
+    def test_reads_do_not_scan_applications(self):
+        # One query for the statistics, and one for the names of the schools.
+        with self.assertNumQueries(2):
+            stats.statistics()
+
+    def test_rebuild_repairs_drift(self):
+        Application.objects.filter(pk=self.app.pk).update(status=STATUS_ADMITTED)
+
+        call_command("rebuildstats", stdout=StringIO())
+
+        self.assertEqual(
+            stats.statistics()["total"], {"": {STATUS_ADMITTED: 1, STATUS_PENDING: 1}}
+        )
+
+    def test_admin_dashboard_and_json(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(
+            reverse_lazy("admin:application_application_statistics")
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, self.first_school.name)
+
+        response = self.client.get(
+            reverse_lazy("admin:application_application_statistics_json")
+        )
+        self.assertEqual(response.json()["total"], {"": {STATUS_PENDING: 2}})
+
+    def test_admin_dashboard_requires_staff(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse_lazy("admin:application_application_statistics_json")
+        )
+        self.assertEqual(response.status_code, 302)
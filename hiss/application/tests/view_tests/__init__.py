@@ -2,3 +2,5 @@ from .create import *
 from .update import *
 from .confirm import *
 from .decline import *
+from .discord_link import *
+from .discord_roster import *
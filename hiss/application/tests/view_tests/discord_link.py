@@ -0,0 +1,86 @@
+import os
+from unittest import mock
+
+from django.urls import reverse_lazy
+
+from application import discord
+from application.checkins import send_queued_check_ins
+from application.models import Application, STATUS_CONFIRMED
+from application.tests.discord_tests.fake_bot import FakeDiscordBot
+from shared import test_case
+from team.models import Team
+
+
+class DiscordViewsTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.bot = FakeDiscordBot().__enter__()
+        self.addCleanup(self.bot.__exit__)
+        environ = mock.patch.dict(
+            os.environ,
+            {
+                "DISCORD_BOT_URL": self.bot.url,
+                "REG_USERNAME": "Test",
+                "REG_PASSWORD": "Test",
+            },
+        )
+        environ.start()
+        self.addCleanup(environ.stop)
+        discord.reset_client()
+        self.addCleanup(discord.reset_client)
+
+        self.create_active_wave()
+        self.app = Application.objects.create(
+            **self.application_fields, wave=self.wave1, status=STATUS_CONFIRMED
+        )
+        self.client.force_login(self.user)
+
+    def test_check_id_redirects_to_link_for_members(self):
+        self.bot.members.add("1234")
+
+        response = self.client.get(reverse_lazy("application:check_id", args=["1234"]))
+
+        self.assertRedirects(
+            response,
+            reverse_lazy("application:link_discord", args=["1234"]),
+            fetch_redirect_response=False,
+        )
+
+    def test_check_id_rejects_non_members(self):
+        response = self.client.get(reverse_lazy("application:check_id", args=["1234"]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"not found within server", response.content)
+
+    def test_check_id_reports_unavailable_bot(self):
+        self.bot.status = 500
+
+        response = self.client.get(reverse_lazy("application:check_id", args=["1234"]))
+
+        self.assertEqual(response.status_code, 503)
+
+    def test_link_checks_in_with_team(self):
+        team = Team.objects.create(name="Snakes")
+        self.user.team = team
+        self.user.save()
+
+        response = self.client.get(
+            reverse_lazy("application:link_discord", args=["1234"])
+        )
+        # Check-ins are only queued during the request.
+        self.assertEqual(len(self.bot.check_ins), 0)
+        send_queued_check_ins()
+
+        self.assertRedirects(
+            response,
+            reverse_lazy("application:discord_success"),
+            fetch_redirect_response=False,
+        )
+        self.app.refresh_from_db()
+        self.assertEqual(self.app.discord_id, "1234")
+        self.assertTrue(self.app.checked_in)
+        self.assertEqual(len(self.bot.check_ins), 1)
+        self.assertEqual(self.bot.check_ins[0]["team_name"], "Snakes")
+        self.assertEqual(
+            self.bot.check_ins[0]["name"], f"{self.first_name} {self.last_name}"
+        )
@@ -0,0 +1,117 @@
+import os
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from application.models import Application
+from shared import test_case
+from team.models import Team
+
+
+@mock.patch.dict(os.environ, {"REG_USERNAME": "Test", "REG_PASSWORD": "Test"})
+class DiscordRosterViewTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.team = Team.objects.create(name="Snakes")
+        self.user.team = self.team
+        self.user.save()
+        self.app = Application.objects.create(
+            **self.application_fields, wave=self.wave1, discord_id="1234"
+        )
+        Application.objects.create(
+            **{**self.application_fields, "user": self.user2}, wave=self.wave1
+        )
+
+    def get_roster(self, **params):
+        return self.client.get(
+            reverse_lazy("application:discord_roster"),
+            {"request_user": "Test", "request_pass": "Test", **params},
+        )
+
+    def test_requires_credentials(self):
+        response = self.client.get(
+            reverse_lazy("application:discord_roster"),
+            {"request_user": "Test", "request_pass": "wrong"},
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_lists_linked_hackers_in_one_query(self):
+        # One query checks for changes, and one lists the hackers.
+        with self.assertNumQueries(2):
+            response = self.get_roster()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["hackers"],
+            [
+                {
+                    "discord_id": "1234",
+                    "name": f"{self.first_name} {self.last_name}",
+                    "team_name": "Snakes",
+                }
+            ],
+        )
+
+    def test_returns_not_modified_for_matching_etag(self):
+        etag = self.get_roster()["ETag"]
+
+        response = self.client.get(
+            reverse_lazy("application:discord_roster"),
+            {"request_user": "Test", "request_pass": "Test"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+
+        self.team.name = "Pythons"
+        self.team.save()
+        response = self.client.get(
+            reverse_lazy("application:discord_roster"),
+            {"request_user": "Test", "request_pass": "Test"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["hackers"][0]["team_name"], "Pythons")
+
+    def age_applications(self, **delta):
+        Application.objects.update(
+            updated_at=timezone.now() - timezone.timedelta(**delta)
+        )
+
+    def test_only_returns_changes_since_cursor(self):
+        self.age_applications(hours=1)
+        cursor = self.get_roster().json()["cursor"]
+
+        self.assertEqual(self.get_roster(updated_since=cursor).json()["hackers"], [])
+
+        self.app.discord_id = "5678"
+        self.app.save()
+        response = self.get_roster(updated_since=cursor)
+        self.assertEqual(
+            [hacker["discord_id"] for hacker in response.json()["hackers"]], ["5678"]
+        )
+        self.assertGreater(response.json()["cursor"], cursor)
+
+    @override_settings(DISCORD_ROSTER_CURSOR_OVERLAP_SECONDS=60)
+    def test_returns_late_commits_within_overlap(self):
+        cursor = self.get_roster().json()["cursor"]
+        self.assertLess(
+            parse_datetime(cursor), timezone.now() - timezone.timedelta(seconds=59)
+        )
+
+        # A change saved before the one the cursor was built from, but committed after it.
+        late = Application.objects.get(user=self.user2)
+        late.discord_id = "5678"
+        late.save()
+        Application.objects.filter(pk=late.pk).update(
+            updated_at=timezone.now() - timezone.timedelta(seconds=5)
+        )
+
+        response = self.get_roster(updated_since=cursor)
+        self.assertCountEqual(
+            [hacker["discord_id"] for hacker in response.json()["hackers"]],
+            ["1234", "5678"],
+        )
@@ -11,6 +11,7 @@ urlpatterns = [
     path("check_id/<str:discord_id>/", views.CheckDiscordIdView.as_view(), name="check_id"),
     path("link_discord/<str:discord_id>/", views.LinkDiscordView.as_view(), name="link_discord"),
     path("discord_data/", views.DiscordDataView.as_view(), name="discord_data"),
+    path("discord_roster/", views.DiscordRosterView.as_view(), name="discord_roster"),
     path("discord_success/", views.DiscordSuccessView.as_view(), name="discord_success")
 ]
     
\ No newline at end of file
@@ -2,20 +2,27 @@
 Application views
 """
 
+import hashlib
 import os
-import requests
+from typing import Optional
 
 from django import views
+from django.conf import settings
 from django.contrib.auth import mixins
 from django.core.exceptions import PermissionDenied
-from django.db.models import QuerySet
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views import generic
 
 from user.models import User
 from team.models import Team
+from application import checkins, discord
 from application.emails import send_confirmation_email, send_creation_email
 from application.forms import ApplicationModelForm
 from application.models import (
@@ -25,6 +32,7 @@ from application.models import (
     STATUS_DECLINED,
     STATUS_ADMITTED,
 )
+from application.snapshots import mark_status_changed
 
 
 class CreateApplicationView(mixins.LoginRequiredMixin, generic.CreateView):
@@ -50,6 +58,7 @@ class CreateApplicationView(mixins.LoginRequiredMixin, generic.CreateView):
         application.user = self.request.user
         application.wave = Wave.objects.active_wave()
         application.save()
+        mark_status_changed(self.request)
         send_creation_email(application)
         return redirect(self.success_url)
 
@@ -103,6 +112,7 @@ class ConfirmApplicationView(mixins.LoginRequiredMixin, views.View):
             )
         app.status = STATUS_CONFIRMED
         app.save()
+        mark_status_changed(request)
         send_confirmation_email(app)
         return redirect(reverse_lazy("status"))
 
@@ -128,6 +138,7 @@ class DeclineApplicationView(mixins.LoginRequiredMixin, views.View):
             )
         app.status = STATUS_DECLINED
         app.save()
+        mark_status_changed(request)
         return redirect(reverse_lazy("status"))
 
 class CheckDiscordIdView(mixins.LoginRequiredMixin, views.View):
@@ -143,8 +154,6 @@ class CheckDiscordIdView(mixins.LoginRequiredMixin, views.View):
 
         app: Application = Application.objects.get(user_id=self.request.user.id)
         discord_id = kwargs.get('discord_id')
-        request_user = os.environ['REG_USERNAME']
-        request_pass = os.environ['REG_PASSWORD'] 
 
         if app is not None:
             # Check to see if the application was declined
@@ -162,66 +171,53 @@ class CheckDiscordIdView(mixins.LoginRequiredMixin, views.View):
                 else:
                     try:
                         # Ping the bot asking for the specified user
-                        r = requests.get(
-                            f"{os.environ['DISCORD_BOT_URL']}check_user/{discord_id}",
-                            json={
-                                "request_user": request_user,
-                                "request_pass": request_pass
-                            }
+                        exists = discord.get_client().user_exists(discord_id)
+                    except discord.DiscordBotError:
+                        return HttpResponse(
+                            "We couldn't reach the Hacklahoma Discord bot. Please try again in a few minutes.",
+                            status=503,
                         )
 
-                        if(r.json()['exists']):
-                            return redirect(reverse_lazy("application:link_discord", kwargs={'discord_id': discord_id}))
-                        else:
-                            return HttpRequest("Discord account not found within server. Please make sure you have already joined the Hacklahoma discord server.")
-                    except requests.ConnectionError as e:
-                        # handle the exception
-                        return HttpResponse(e)
+                    if exists:
+                        return redirect(reverse_lazy("application:link_discord", kwargs={'discord_id': discord_id}))
+                    else:
+                        return HttpResponse(
+                            "Discord account not found within server. Please make sure you have already joined the "
+                            "Hacklahoma discord server."
+                        )
         else:
             return redirect(reverse_lazy("status"))
 
 
 class LinkDiscordView(mixins.LoginRequiredMixin, views.View):
     """
-    Gets the Application and then updates the discord_id, and checked_in
+    Gets the Application and then updates the discord_id, and checked_in. The check-in is queued for the Discord bot
+    in the same transaction, and sent by a worker (see `application.checkins`), so this doesn't wait on the bot.
     """
 
     def get(self, request: HttpRequest, *args, **kwargs):
-        app: Application = Application.objects.get(user_id=self.request.user.id)
+        app: Application = Application.objects.select_related("user__team").get(
+            user_id=self.request.user.id
+        )
         discord_id = kwargs.get('discord_id')
-        request_user = os.environ['REG_USERNAME']
-        request_pass = os.environ['REG_PASSWORD'] 
 
         if app:
             app.discord_id = discord_id
             app.checked_in = True
-            app.save()
-
-            user: User = User.objects.get(id=app.user_id)
-
-            if user.team_id:
-                team = Team.objects.get(id=user.team_id)
-
-                requests.put(
-                    f"{os.environ['DISCORD_BOT_URL']}check_in",
-                    json={
-                        "discord_id": discord_id,
-                        "name": f"{app.first_name} {app.last_name}",
-                        "team_name": team.name,
-                        "request_user": request_user,
-                        "request_pass": request_pass
-                    }
-                )
-            else:
-                requests.put(
-                    f"{os.environ['DISCORD_BOT_URL']}check_in",
-                    json={
-                        "discord_id": discord_id,
-                        "name": f"{app.first_name} {app.last_name}",
-                        "team_name": None,
-                        "request_user": request_user,
-                        "request_pass": request_pass
-                    }
+            team: Optional[Team] = app.user.team
+            try:
+                with transaction.atomic():
+                    app.save()
+                    checkins.queue_check_in(
+                        discord_id,
+                        f"{app.first_name} {app.last_name}",
+                        team.name if team else None,
+                    )
+            except IntegrityError:
+                # Another application linked this Discord account since it was checked.
+                return HttpResponse(
+                    "Discord account already linked. If you think this is an error please contact a Hacklahoma team "
+                    "member through the Hacklahoma Discord or through team@hacklahoma.org."
                 )
 
             return redirect(reverse_lazy("application:discord_success"))
@@ -273,4 +269,57 @@ class DiscordDataView(views.View):
                     'team_name': None
                 }
             
-            return JsonResponse(data)
\ No newline at end of file
+            return JsonResponse(data)
+
+
+class DiscordRosterView(views.View):
+    """
+    Returns every hacker with a linked Discord account (their discord_id, name, and team name) with a single query,
+    for the Discord bot to sync its roster. Passing the "cursor" of a previous response as "updated_since" only
+    returns the hackers that changed since then. Responses carry an ETag, and a request whose If-None-Match matches
+    gets an empty 304 response.
+
+    `updated_at` is set when a row is saved, not when its transaction commits, so a change can become visible after
+    changes with later timestamps. The cursor therefore never moves past `DISCORD_ROSTER_CURSOR_OVERLAP_SECONDS` ago:
+    hackers who changed within that window are returned again by the next request, rather than skipped forever.
+    """
+
+    def get(self, request: HttpRequest, *_args, **_kwargs):
+        request_user = request.GET.get('request_user')
+        request_pass = request.GET.get('request_pass')
+        if not (os.environ['REG_USERNAME'] == request_user and os.environ['REG_PASSWORD'] == request_pass):
+            return HttpResponse('Access Denied', status=403)
+
+        linked = Application.objects.exclude(discord_id__isnull=True).exclude(discord_id="")
+        updated_since = request.GET.get('updated_since')
+        if updated_since:
+            cursor = parse_datetime(updated_since)
+            if cursor is None:
+                return HttpResponse('Invalid updated_since.', status=400)
+            if timezone.is_naive(cursor):
+                cursor = timezone.make_aware(cursor)
+            linked = linked.filter(updated_at__gt=cursor)
+
+        summary = linked.aggregate(count=Count('pk'), latest=Max('updated_at'))
+        etag = '"%s"' % hashlib.sha256(
+            ('%s:%s:%s' % (summary['count'], summary['latest'], updated_since)).encode()
+        ).hexdigest()[:32]
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        hackers = [
+            {'discord_id': discord_id, 'name': f"{first_name} {last_name}", 'team_name': team_name}
+            for discord_id, first_name, last_name, team_name in linked.values_list(
+                'discord_id', 'first_name', 'last_name', 'user__team__name'
+            )
+        ]
+        latest = summary['latest']
+        if latest:
+            overlap = timezone.timedelta(seconds=settings.DISCORD_ROSTER_CURSOR_OVERLAP_SECONDS)
+            latest = min(latest, timezone.now() - overlap)
+        response = JsonResponse(
+            {'hackers': hackers, 'cursor': latest.isoformat() if latest else updated_since}
+        )
+        response['ETag'] = etag
+        return response
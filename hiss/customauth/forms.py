@@ -22,6 +22,9 @@ class SignupForm(auth_forms.UserCreationForm):
 
     def clean_email(self):
         data = self.cleaned_data['email']
+        # Older accounts may have mixed-case emails, which the database also treats as taken.
+        if User.objects.filter(email__iexact=data).exists():
+            raise ValidationError("A user with that email already exists.")
         return data.lower()
 
     class Meta:
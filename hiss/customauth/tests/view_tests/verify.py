@@ -31,6 +31,14 @@ class EmailVerificationTestCase(test_case.SharedTestCase):
         user = User.objects.get(email=self.email)
         self.assertFalse(user.is_active)
 
+    def test_signup_rejects_email_taken_in_another_case(self):
+        User.objects.create_user("Hacker@tamu.edu", self.password)
+
+        response = self.client.post(reverse_lazy("customauth:signup"), self.fields)
+
+        self.assertContains(response, "A user with that email already exists.")
+        self.assertEqual(User.objects.count(), 1)
+
     def test_signup_sends_email(self):
         self.client.post(reverse_lazy("customauth:signup"), self.fields)
 
@@ -54,6 +54,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "shared.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -80,6 +81,7 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
                 "shared.context_processors.customization",
+                "application.context_processors.application_status",
             ]
         },
     }
@@ -124,6 +126,93 @@ AUTH_USER_MODEL = "user.User"
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
 DATABASES = {"default": dj_database_url.config(conn_max_age=600)}
 
+# Caching. Deployments with more than one worker process should point this at a shared backend (see
+# deployment.py).
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+# The wave schedule (see application.models.WaveManager) is kept in the cache for WAVE_SCHEDULE_CACHE_TIMEOUT
+# seconds, and in each process's memory for WAVE_SCHEDULE_LOCAL_TTL seconds.
+WAVE_SCHEDULE_CACHE_TIMEOUT = 60 * 60
+WAVE_SCHEDULE_LOCAL_TTL = 5
+
+# Each user's application status is cached for the status page for STATUS_SNAPSHOT_TIMEOUT seconds, and in each
+# process's memory for STATUS_SNAPSHOT_LOCAL_TTL seconds (see application/snapshots.py). Changing an application
+# invalidates its snapshot right away in the cache and in the process that made the change.
+STATUS_SNAPSHOT_TIMEOUT = 30
+STATUS_SNAPSHOT_LOCAL_TTL = 5
+
+# Volunteer API tokens and group memberships are kept in each process's memory for this many seconds (see
+# volunteer/authentication.py). Changes made in the same process take effect immediately.
+VOLUNTEER_AUTH_CACHE_TTL = 60
+
+# Admin changelists over unfiltered tables with more rows than this use PostgreSQL's row estimate instead of
+# COUNT(*) (see shared/paginators.py).
+APPROXIMATE_COUNT_THRESHOLD = 100000
+
+# Email outbox (see shared/outbox.py). Queued emails are sent by `manage.py sendqueuedmail` (the worker process in
+# deployment). If OUTBOX_EMAIL_BACKEND is None, EMAIL_BACKEND is used. Emails claimed by a worker that hasn't finished
+# sending them within OUTBOX_CLAIM_TIMEOUT_MINUTES are claimed again.
+OUTBOX_EMAIL_BACKEND = None
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_BASE_SECONDS = 60
+OUTBOX_CLAIM_TIMEOUT_MINUTES = 15
+
+# Capacity-aware admission (see application/admission.py). Until some admitted hackers have confirmed, declined, or
+# let their admission expire, this fraction of admitted hackers is expected to attend.
+ADMISSION_DEFAULT_YIELD = 0.6
+
+# Staged uploads (see shared/storage.py). When DEFAULT_FILE_STORAGE is "shared.storage.StagedStorage", uploaded files
+# are saved to the database and later pushed to STAGED_STORAGE_REMOTE by `manage.py uploadstaged` (the worker process in
+# deployment), using STAGED_UPLOAD_WORKERS threads. Failed uploads are retried after STAGED_UPLOAD_RETRY_BASE_SECONDS,
+# doubling each time, up to STAGED_UPLOAD_MAX_ATTEMPTS tries. Files claimed by an uploader that hasn't finished
+# uploading them within STAGED_UPLOAD_CLAIM_TIMEOUT_MINUTES are claimed again.
+STAGED_STORAGE_REMOTE = "django.core.files.storage.FileSystemStorage"
+STAGED_UPLOAD_WORKERS = 4
+STAGED_UPLOAD_MAX_ATTEMPTS = 10
+STAGED_UPLOAD_RETRY_BASE_SECONDS = 30
+STAGED_UPLOAD_CLAIM_TIMEOUT_MINUTES = 5
+
+# Request metrics (see shared/metrics.py). When REQUEST_METRICS_ENABLED is set, the wall time, query count, and database
+# time of the last REQUEST_METRICS_WINDOW requests to each view are kept (and shown to staff at /metrics/), and requests
+# slower than REQUEST_METRICS_SLOW_SECONDS are logged.
+REQUEST_METRICS_ENABLED = bool(os.getenv("REQUEST_METRICS_ENABLED"))
+REQUEST_METRICS_WINDOW = 1000
+REQUEST_METRICS_SLOW_SECONDS = 1.0
+
+# Resume books (see application/resume_book.py) fetch this many resumes from storage at a time.
+RESUME_BOOK_WORKERS = 8
+
+# Badge QR codes (see application/badges.py). The server signs and verifies badge tokens with BADGE_SIGNING_KEY, which
+# must not be given to scanners (it can also sign badges). If it isn't set, a key derived from SECRET_KEY is used. QR
+# codes pre-rendered by `manage.py renderbadges` are kept in the database.
+BADGE_SIGNING_KEY = os.environ.get("BADGE_SIGNING_KEY")
+BADGE_QR_SCALE = 5
+
+# Discord bot client (see application/discord.py). Timeouts are in seconds. After DISCORD_BOT_FAILURE_THRESHOLD
+# consecutive failures, the bot isn't called again for DISCORD_BOT_RESET_TIMEOUT seconds.
+DISCORD_BOT_CONNECT_TIMEOUT = 3.05
+DISCORD_BOT_READ_TIMEOUT = 5
+DISCORD_BOT_RETRIES = 2
+DISCORD_BOT_FAILURE_THRESHOLD = 5
+DISCORD_BOT_RESET_TIMEOUT = 30
+
+# Discord check-ins (see application/checkins.py) are queued and sent by `manage.py sendcheckins` (the worker process in
+# deployment). Failed check-ins are retried after DISCORD_CHECK_IN_RETRY_BASE_SECONDS, doubling each time, up to
+# DISCORD_CHECK_IN_MAX_ATTEMPTS tries (about 8.5 hours with these values). Check-ins claimed by a worker that hasn't
+# finished sending them within DISCORD_CHECK_IN_CLAIM_TIMEOUT_MINUTES are claimed again.
+DISCORD_CHECK_IN_MAX_ATTEMPTS = 10
+DISCORD_CHECK_IN_RETRY_BASE_SECONDS = 30
+DISCORD_CHECK_IN_CLAIM_TIMEOUT_MINUTES = 5
+
+# The Discord roster (see DiscordRosterView) returns hackers changed within the last
+# DISCORD_ROSTER_CURSOR_OVERLAP_SECONDS again on the next request, so that changes committed after changes with later
+# timestamps aren't skipped. Should be longer than any transaction that saves an application.
+DISCORD_ROSTER_CURSOR_OVERLAP_SECONDS = 60
+
+# The number of rows each registration statistic is split over (see application/stats.py), so that concurrent
+# application saves rarely wait on each other to update the "total" counts.
+APPLICATION_STATISTIC_SHARDS = 8
+
 CORS_ORIGIN_WHITELIST = [
     "https://volunteer.hacklahoma.org",
     "https://hacklahoma.github.io",
@@ -29,6 +29,14 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Share the cache between gunicorn workers. The table is created by `manage.py createcachetable`.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "hiss_cache",
+    }
+}
+
 # Email Configuration Global Settings
 ANYMAIL = {
     "MAILGUN_API_KEY": os.getenv("MAILGUN_API_KEY"),
@@ -39,7 +47,9 @@ DEFAULT_FROM_EMAIL = "team@hacklahoma.org (Hacklahoma Team)"
 # MEDIA_ROOT = "/resumes"
 # MEDIA_URL = "https://register.hacklahoma.org/resumes/"
 
-# Storing media (resumes) to dropbox
-DEFAULT_FILE_STORAGE = "storages.backends.dropbox.DropBoxStorage"
+# Storing media (resumes) to dropbox. Uploads are staged in the database and pushed to Dropbox by the worker process
+# (`manage.py uploadstaged --loop`), so that applicants don't wait on Dropbox.
+DEFAULT_FILE_STORAGE = "shared.storage.StagedStorage"
+STAGED_STORAGE_REMOTE = "storages.backends.dropbox.DropBoxStorage"
 DROPBOX_OAUTH2_TOKEN = os.getenv("DROPBOX_TOKEN")
 DROPBOX_ROOT_PATH = "/resumes-2021"
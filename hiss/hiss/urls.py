@@ -21,6 +21,9 @@ from django.contrib import admin
 from django.urls import path, include
 from django.views.generic.base import RedirectView
 
+from shared.metrics import metrics_view
+from shared.storage import staged_file_view
+
 
 def healthcheck(request):
     return http.HttpResponse("")
@@ -31,6 +34,8 @@ urlpatterns = [
     path("accounts/", include("customauth.urls")),
     path("application/", include("application.urls", namespace="application")),
     path("healthy/", healthcheck),
+    path("metrics/", metrics_view, name="metrics"),
+    path("staged/<path:name>", staged_file_view, name="staged_file"),
     url(r"^$", RedirectView.as_view(pattern_name="customauth:login")),
     path("status/", include("status.urls")),
     path("team/", include("team.urls")),
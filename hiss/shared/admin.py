@@ -0,0 +1,35 @@
+from django.contrib import admin
+from django.db.models.query import QuerySet
+from django.http import HttpRequest
+from django.utils import timezone
+
+from shared.models import OutgoingEmail, OUTBOX_QUEUED, OUTBOX_SENT
+
+
+def requeue_emails(_modeladmin, _request: HttpRequest, queryset: QuerySet) -> None:
+    """
+    Puts the selected (unsent) emails back in the outbox so they are retried immediately.
+    """
+    queryset.exclude(status=OUTBOX_SENT).update(
+        status=OUTBOX_QUEUED, attempts=0, next_attempt_at=timezone.now()
+    )
+
+
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "recipients",
+        "status",
+        "attempts",
+        "created_at",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("idempotency_key", "recipients")
+    readonly_fields = ("idempotency_key", "created_at", "sent_at", "last_error")
+
+    requeue_emails.short_description = "Requeue Selected Emails"
+    actions = [requeue_emails]
+
+
+admin.site.register(OutgoingEmail, OutgoingEmailAdmin)
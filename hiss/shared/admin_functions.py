@@ -1,4 +1,41 @@
+import csv
+from typing import Iterable, Sequence
+
 from django.core.mail import get_connection, EmailMultiAlternatives
+from django.http import StreamingHttpResponse
+
+EXPORT_CHUNK_SIZE = 2000
+"""The number of rows fetched from the database at a time when streaming an export."""
+
+
+class Echo:
+    """
+    A file-like object that returns whatever is written to it instead of buffering it, so that `csv.writer` can be
+    used to produce rows one at a time (see https://docs.djangoproject.com/en/2.2/howto/outputting-csv/).
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(
+    filename: str, rows: Iterable[Sequence], header: Sequence = None
+) -> StreamingHttpResponse:
+    """
+    Returns a `StreamingHttpResponse` that writes `rows` (preceded by `header`, if given) as a CSV attachment.
+    Rows are written as they are produced, so memory use stays flat regardless of the size of the export.
+    """
+    writer = csv.writer(Echo())
+
+    def generate():
+        if header:
+            yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(generate(), content_type="text/csv")
+    response["Content-Disposition"] = 'attachment; filename="%s"' % filename
+    return response
 
 
 def send_mass_html_mail(
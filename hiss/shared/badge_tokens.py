@@ -0,0 +1,57 @@
+"""
+Encoding and verification of badge tokens, the signed payloads of the QR codes hackers show at check-in.
+
+A token is a version byte and an application's UUID, followed by a truncated HMAC-SHA256 signature of both, encoded
+as unpadded base 32. The server rejects forged or garbled codes before looking anything up in the database.
+
+Tokens are signed with a symmetric key, so anyone who can verify them can also forge them. Offline verification is
+therefore not supported: the signing key must never be given to scanners, which send the badges they scan to the
+server (see `volunteer.views` and `volunteer.sync`) to be verified there.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import uuid
+
+BADGE_TOKEN_VERSION = 1
+SIGNATURE_LENGTH = 10
+"""The number of bytes of the HMAC-SHA256 signature kept in a token."""
+TOKEN_LENGTH = 1 + 16 + SIGNATURE_LENGTH
+
+
+class InvalidBadgeToken(ValueError):
+    """
+    Raised when a badge token is garbled, has an unknown version, or wasn't signed with the expected key.
+    """
+
+
+def _sign(key: bytes, body: bytes) -> bytes:
+    return hmac.new(key, body, hashlib.sha256).digest()[:SIGNATURE_LENGTH]
+
+
+def encode_badge_token(application_id: uuid.UUID, key: bytes) -> str:
+    body = bytes([BADGE_TOKEN_VERSION]) + application_id.bytes
+    token = base64.b32encode(body + _sign(key, body))
+    return token.decode().rstrip("=")
+
+
+def decode_badge_token(token: str, key: bytes) -> uuid.UUID:
+    """
+    Verifies a badge token and returns the id of the application it belongs to. Raises `InvalidBadgeToken` if the
+    token isn't valid.
+    """
+    token = token.strip().upper()
+    try:
+        raw = base64.b32decode(token + "=" * (-len(token) % 8))
+    except (binascii.Error, ValueError):
+        raise InvalidBadgeToken("Badge token is not valid base 32.")
+    if len(raw) != TOKEN_LENGTH:
+        raise InvalidBadgeToken("Badge token has the wrong length.")
+    body, signature = raw[:-SIGNATURE_LENGTH], raw[-SIGNATURE_LENGTH:]
+    if body[0] != BADGE_TOKEN_VERSION:
+        raise InvalidBadgeToken("Unknown badge token version %s." % body[0])
+    if not hmac.compare_digest(signature, _sign(key, body)):
+        raise InvalidBadgeToken("Badge token signature does not match.")
+    return uuid.UUID(bytes=body[1:])
@@ -0,0 +1,71 @@
+import re
+from typing import Dict, List, Sequence, Tuple
+
+from django.template import Context
+from django.template.base import render_value_in_context
+from django.template.loader import get_template
+from django.utils.functional import cached_property
+from django.utils.html import strip_tags
+
+SLOT_PATTERN = re.compile(r"__hiss_slot_(\w+?)__")
+
+
+def _split(skeleton: str) -> List[str]:
+    """
+    Splits a rendered skeleton into alternating literal text and slot names (literal, slot, literal, ...).
+    """
+    return SLOT_PATTERN.split(skeleton)
+
+
+class BatchMailTemplate:
+    """
+    An email template that is rendered once and then filled in for each recipient.
+
+    Rendering a Django template (and stripping its tags for the plain-text version) for every recipient of a mass
+    email is slow. Instead, the template is rendered a single time with placeholders for the per-recipient `slots`,
+    and the resulting HTML and plain-text skeletons are cached. Building an email for a recipient is then just a
+    matter of joining the skeleton with the recipient's (escaped) values.
+
+    Slots must only be used as plain `{{ variable }}` substitutions in the template (not in tags or filters).
+    """
+
+    def __init__(
+        self, template_name: str, subject: str, slots: Sequence[str], **context
+    ):
+        self.template_name = template_name
+        self.subject = subject
+        self.slots = tuple(slots)
+        self.context = context
+
+    @cached_property
+    def skeletons(self) -> Tuple[List[str], List[str]]:
+        template = get_template(self.template_name)
+        context = {
+            **self.context,
+            **{slot: "__hiss_slot_%s__" % slot for slot in self.slots},
+        }
+        html_skeleton = template.render(context)
+        return _split(html_skeleton), _split(strip_tags(html_skeleton))
+
+    def _fill(self, skeleton: List[str], values: Dict[str, str]) -> str:
+        parts = skeleton[:]
+        parts[1::2] = [values[slot] for slot in skeleton[1::2]]
+        return "".join(parts)
+
+    def build(self, recipient: str, **values) -> Tuple[str, str, str, None, List[str]]:
+        """
+        Creates a datatuple of (subject, message, html_message, from_email, [to_email]) for a single recipient.
+        """
+        context = Context(autoescape=True)
+        rendered = {
+            slot: str(render_value_in_context(values[slot], context))
+            for slot in self.slots
+        }
+        html_skeleton, text_skeleton = self.skeletons
+        return (
+            self.subject,
+            self._fill(text_skeleton, rendered),
+            self._fill(html_skeleton, rendered),
+            None,
+            [recipient],
+        )
@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from shared.outbox import send_queued_mail
+
+
+class Command(BaseCommand):
+    help = "Sends emails waiting in the outbox."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="The number of emails to send over a single connection",
+        )
+        parser.add_argument(
+            "--backend",
+            default=None,
+            help="Dotted path of the email backend to send with (e.g. "
+            "django.core.mail.backends.filebased.EmailBackend). Defaults to OUTBOX_EMAIL_BACKEND, then EMAIL_BACKEND",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox instead of exiting once it is empty",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls of an empty outbox (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            sent, failed = send_queued_mail(options["batch_size"], options["backend"])
+            if sent or failed:
+                self.stdout.write(
+                    "Sent %s emails (%s failed and will be retried or given up on)"
+                    % (sent, failed)
+                )
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS("The outbox is empty"))
@@ -0,0 +1,48 @@
+import time
+
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandParser
+
+from shared.storage import StagedStorage, upload_staged
+
+
+class Command(BaseCommand):
+    help = "Pushes files staged on local disk (e.g. resumes) to the remote storage."
+
+    def add_arguments(self, parser: CommandParser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="The number of files to upload at once. Defaults to STAGED_UPLOAD_WORKERS",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for staged files instead of exiting once none are due",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Seconds to wait between polls when no files are due (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        if not isinstance(default_storage, StagedStorage):
+            self.stdout.write(
+                "The default storage isn't staged, so there's nothing to upload"
+            )
+            return
+        while True:
+            uploaded, failed = upload_staged(default_storage, options["workers"])
+            if uploaded or failed:
+                self.stdout.write(
+                    "Uploaded %s files (%s failed and will be retried or given up on)"
+                    % (uploaded, failed)
+                )
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS("No staged files are due"))
@@ -0,0 +1,171 @@
+"""
+Per-view request metrics. When `settings.REQUEST_METRICS_ENABLED` is set, `RequestMetricsMiddleware` measures every
+request's wall time, number of database queries, and time spent in the database, and keeps the last
+`REQUEST_METRICS_WINDOW` measurements of each URL name. Requests slower than `REQUEST_METRICS_SLOW_SECONDS` are logged
+as a line of JSON. Staff can see the p50/p95/p99 of each URL name at `metrics_view`.
+
+Measurements are kept in memory, so each worker process reports on the requests it served. When the setting is off,
+the middleware removes itself from the stack when Django starts, so it costs nothing per request.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from typing import Deque, Dict, List, NamedTuple, Sequence
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse, JsonResponse
+
+logger = logging.getLogger(__name__)
+
+UNRESOLVED = "<unresolved>"
+"""The name requests that don't match a URL pattern (e.g. 404s) are recorded under."""
+
+PERCENTILES = (50, 95, 99)
+
+
+class Sample(NamedTuple):
+    wall_time: float
+    queries: int
+    db_time: float
+
+
+class QueryTimer:
+    """
+    A database execute wrapper (see `connection.execute_wrapper`) that counts queries and the time spent running them.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """
+    Returns the `percent`th percentile of sorted `values` (by the nearest-rank method).
+    """
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+
+class RequestMetrics:
+    """
+    The most recent samples of each URL name, in rolling windows of `settings.REQUEST_METRICS_WINDOW`. Safe to use
+    from several threads.
+    """
+
+    def __init__(self):
+        self._samples: Dict[str, Deque[Sample]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, sample: Sample) -> None:
+        with self._lock:
+            window = self._samples.get(name)
+            if window is None:
+                window = self._samples[name] = deque(
+                    maxlen=settings.REQUEST_METRICS_WINDOW
+                )
+            window.append(sample)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Returns {url name: {"count": n, "wall_ms": {"p50": ..., ...}, "queries": {...}, "db_ms": {...}}}.
+        """
+        with self._lock:
+            samples = {name: list(window) for name, window in self._samples.items()}
+        return {name: _summarize(window) for name, window in sorted(samples.items())}
+
+
+def _percentiles(values: List[float], scale: float = 1) -> Dict[str, float]:
+    values = sorted(values)
+    return {
+        "p%s" % percent: round(percentile(values, percent) * scale, 2)
+        for percent in PERCENTILES
+    }
+
+
+def _summarize(samples: List[Sample]) -> Dict:
+    return {
+        "count": len(samples),
+        "wall_ms": _percentiles([s.wall_time for s in samples], 1000),
+        "queries": _percentiles([s.queries for s in samples]),
+        "db_ms": _percentiles([s.db_time for s in samples], 1000),
+    }
+
+
+request_metrics = RequestMetrics()
+
+
+class RequestMetricsMiddleware:
+    """
+    Records the metrics of every request in `request_metrics`. Should be first in `MIDDLEWARE`, so that the time
+    spent in other middleware is included.
+    """
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        sample = Sample(time.perf_counter() - start, timer.queries, timer.db_time)
+
+        match = getattr(request, "resolver_match", None)
+        name = match.view_name if match else UNRESOLVED
+        request_metrics.record(name, sample)
+        if sample.wall_time >= settings.REQUEST_METRICS_SLOW_SECONDS:
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "slow_request",
+                        "view": name,
+                        "method": request.method,
+                        "path": request.path,
+                        "status": response.status_code,
+                        "wall_ms": round(sample.wall_time * 1000, 2),
+                        "queries": sample.queries,
+                        "db_ms": round(sample.db_time * 1000, 2),
+                    },
+                    sort_keys=True,
+                )
+            )
+        return response
+
+
+@staff_member_required
+def metrics_view(_request: HttpRequest) -> JsonResponse:
+    """
+    Returns the rolling percentiles of each URL name served by this process (see `RequestMetrics.summary`).
+    """
+    return JsonResponse(
+        {
+            "enabled": settings.REQUEST_METRICS_ENABLED,
+            "pid": os.getpid(),
+            "views": request_metrics.summary(),
+        }
+    )
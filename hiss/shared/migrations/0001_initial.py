@@ -0,0 +1,38 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:11
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=255, unique=True)),
+                ('subject', models.TextField()),
+                ('text_body', models.TextField()),
+                ('html_body', models.TextField(blank=True)),
+                ('from_email', models.CharField(blank=True, max_length=255, null=True)),
+                ('recipients', models.TextField(help_text='One recipient per line.')),
+                ('status', models.CharField(choices=[('Q', 'Queued'), ('S', 'Sending'), ('D', 'Sent'), ('F', 'Failed')], default='Q', max_length=1)),
+                ('claim', models.UUIDField(blank=True, editable=False, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='outgoingemail',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='shared_outg_status_54431e_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 2.2.13 on 2026-10-18 08:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shared', '0002_outgoingemail_claimed_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StagedFile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('content', models.BinaryField()),
+                ('status', models.CharField(choices=[('Q', 'Queued'), ('S', 'Sending'), ('D', 'Sent'), ('F', 'Failed')], default='Q', max_length=1)),
+                ('claim', models.UUIDField(blank=True, editable=False, null=True)),
+                ('claimed_at', models.DateTimeField(blank=True, editable=False, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='stagedfile',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='shared_stag_status_148bce_idx'),
+        ),
+    ]
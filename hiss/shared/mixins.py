@@ -35,7 +35,7 @@ class UserHasNoTeamMixin(mixins.UserPassesTestMixin):
             return False
 
         # Ensure user doesn't have a team
-        if user.team is not None:
+        if user.team_id is not None:
             return False
         return True
 
@@ -57,6 +57,6 @@ class UserHasTeamMixin(mixins.UserPassesTestMixin):
             return False
 
         # Ensure the user is already on a team
-        if user.team is None:
+        if user.team_id is None:
             return False
         return True
@@ -0,0 +1,85 @@
+from django.db import models
+from django.utils import timezone
+
+from shared import retry_queue
+
+OUTBOX_QUEUED = retry_queue.QUEUED
+"""Status given to an email that is waiting to be (re)sent."""
+
+OUTBOX_SENDING = retry_queue.SENDING
+"""Status given to an email that a worker has claimed and is currently sending."""
+
+OUTBOX_SENT = retry_queue.SENT
+"""Status given to an email that has been handed off to the email backend."""
+
+OUTBOX_FAILED = retry_queue.FAILED
+"""Status given to an email that ran out of retries."""
+
+OUTBOX_STATUS_OPTIONS = [
+    (OUTBOX_QUEUED, "Queued"),
+    (OUTBOX_SENDING, "Sending"),
+    (OUTBOX_SENT, "Sent"),
+    (OUTBOX_FAILED, "Failed"),
+]
+
+
+class OutgoingEmail(models.Model):
+    """
+    An email waiting in the outbox. Emails are enqueued during a request and sent later by the `sendqueuedmail`
+    management command, so that slow email providers never hold up a web worker.
+    """
+
+    idempotency_key = models.CharField(max_length=255, unique=True)
+    subject = models.TextField()
+    text_body = models.TextField()
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255, null=True, blank=True)
+    recipients = models.TextField(help_text="One recipient per line.")
+
+    status = models.CharField(
+        choices=OUTBOX_STATUS_OPTIONS, max_length=1, default=OUTBOX_QUEUED
+    )
+    claim = models.UUIDField(null=True, blank=True, editable=False)
+    claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self):
+        return "%s - %s" % (self.recipients.replace("\n", ", "), self.subject)
+
+    @property
+    def recipient_list(self):
+        return [r for r in self.recipients.split("\n") if r]
+
+
+class StagedFile(models.Model):
+    """
+    An uploaded file (e.g. a resume) that hasn't been copied to the remote storage yet. Files are staged here during
+    the request by `shared.storage.StagedStorage`, and uploaded (and then deleted) by the `uploadstaged` management
+    command, so that applicants never wait on the remote storage.
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    content = models.BinaryField()
+
+    status = models.CharField(
+        choices=retry_queue.STATUS_OPTIONS, max_length=1, default=retry_queue.QUEUED
+    )
+    claim = models.UUIDField(null=True, blank=True, editable=False)
+    claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "next_attempt_at"])]
+
+    def __str__(self):
+        return self.name
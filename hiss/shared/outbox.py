@@ -0,0 +1,107 @@
+"""
+A persistent outbox for bulk emails. Callers enqueue messages (keyed by an idempotency key, so the same message is
+never queued twice), and the `sendqueuedmail` management command drains the outbox in batches over a single
+backend connection, retrying failures with exponential backoff (see `shared.retry_queue`). Emails claimed by a worker
+that died before finishing its batch are claimed again once the claim is `OUTBOX_CLAIM_TIMEOUT_MINUTES` old (so they
+may be sent twice, but are never lost).
+"""
+
+from itertools import islice
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.mail import get_connection, EmailMultiAlternatives
+from django.utils import timezone
+
+from shared.models import OutgoingEmail
+from shared.retry_queue import RetryQueue
+
+ENQUEUE_BATCH_SIZE = 500
+
+queue = RetryQueue(OutgoingEmail, "OUTBOX")
+
+
+def _chunks(iterable: Iterable, size: int):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def enqueue_mass_html_mail(keyed_datatuple: Iterable[Tuple[str, tuple]]) -> int:
+    """
+    Given an iterable of (idempotency_key, (subject, text_content, html_content, from_email, recipient_list)),
+    adds each message to the outbox unless a message with the same key was already enqueued. The iterable is
+    consumed in batches, so generators are never fully materialized. Returns the number of newly-enqueued messages.
+    """
+    enqueued = 0
+    for chunk in _chunks(keyed_datatuple, ENQUEUE_BATCH_SIZE):
+        keys = [key for key, _ in chunk]
+        existing = set(
+            OutgoingEmail.objects.filter(idempotency_key__in=keys).values_list(
+                "idempotency_key", flat=True
+            )
+        )
+        emails = {}
+        for key, (subject, text, html, from_email, recipients) in chunk:
+            if key in existing or key in emails:
+                continue
+            emails[key] = OutgoingEmail(
+                idempotency_key=key,
+                subject=subject,
+                text_body=text,
+                html_body=html or "",
+                from_email=from_email,
+                recipients="\n".join(recipients),
+            )
+        # ignore_conflicts guards against a concurrent request enqueueing the same key between the two queries.
+        OutgoingEmail.objects.bulk_create(emails.values(), ignore_conflicts=True)
+        enqueued += len(emails)
+    return enqueued
+
+
+def send_queued_mail(
+    batch_size: int = 100, backend: Optional[str] = None
+) -> Tuple[int, int]:
+    """
+    Claims and sends one batch of due emails over a single backend connection. Emails that fail are rescheduled with
+    exponential backoff (or marked as failed once they run out of attempts). Returns a tuple of (sent, failed).
+    """
+    backend = backend or settings.OUTBOX_EMAIL_BACKEND
+    now = timezone.now()
+    emails = queue.claim(batch_size, now)
+    if not emails:
+        return 0, 0
+
+    connection = get_connection(backend)
+    sent_pks = []
+    try:
+        connection.open()
+    except Exception as error:  # pylint: disable=W0703
+        for email in emails:
+            queue.record_failure(email, error, now)
+        return 0, len(emails)
+
+    try:
+        for email in emails:
+            message = EmailMultiAlternatives(
+                email.subject,
+                email.text_body,
+                email.from_email,
+                email.recipient_list,
+                connection=connection,
+            )
+            if email.html_body:
+                message.attach_alternative(email.html_body, "text/html")
+            try:
+                message.send()
+            except Exception as error:  # pylint: disable=W0703
+                queue.record_failure(email, error, now)
+            else:
+                sent_pks.append(email.pk)
+    finally:
+        connection.close()
+        queue.record_sent(sent_pks)
+    return len(sent_pks), len(emails) - len(sent_pks)
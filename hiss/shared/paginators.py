@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models.query import QuerySet
+from django.utils.functional import cached_property
+
+
+class LargeTablePaginator(Paginator):
+    """
+    A paginator that avoids running `COUNT(*)` over very large tables. On PostgreSQL, if the queryset is unfiltered,
+    the planner's row estimate (from `pg_class.reltuples`) is used as the count once it exceeds
+    `APPROXIMATE_COUNT_THRESHOLD`. Filtered querysets, small tables and other databases are counted exactly.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = self._estimate(queryset)
+            if (
+                estimate is not None
+                and estimate >= settings.APPROXIMATE_COUNT_THRESHOLD
+            ):
+                return estimate
+        return super().count
+
+    @staticmethod
+    def _estimate(queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return int(row[0]) if row else None
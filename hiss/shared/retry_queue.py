@@ -0,0 +1,88 @@
+"""
+Claiming and retrying the rows of a persistent work queue, shared by the email outbox (see `shared.outbox`) and the
+Discord check-in queue (see `application.checkins`). A queue's rows have a `status` (queued, sending, sent, or failed),
+a `claim` and `claimed_at` naming the worker that's sending them, and `attempts`, `next_attempt_at`, and `last_error`
+fields (and `sent_at`, for queues that keep sent rows).
+
+Workers claim due rows in batches, moving them to "sending". Rows that fail are queued again with exponential backoff
+until they run out of attempts, and rows claimed by a worker that died before finishing its batch are claimed again
+once the claim is stale (so they may be sent twice, but are never lost).
+"""
+
+import uuid
+from typing import Iterable, List, Type
+
+from django.conf import settings
+from django.db import models
+from django.db.models import F, Q
+from django.utils import timezone
+
+QUEUED = "Q"
+SENDING = "S"
+SENT = "D"
+FAILED = "F"
+
+STATUS_OPTIONS = [
+    (QUEUED, "Queued"),
+    (SENDING, "Sending"),
+    (SENT, "Sent"),
+    (FAILED, "Failed"),
+]
+
+
+class RetryQueue:
+    """
+    The rows of `model`, retried according to the settings named `<prefix>_MAX_ATTEMPTS`,
+    `<prefix>_RETRY_BASE_SECONDS`, and `<prefix>_CLAIM_TIMEOUT_MINUTES`.
+    """
+
+    def __init__(self, model: Type[models.Model], settings_prefix: str):
+        self.model = model
+        self.settings_prefix = settings_prefix
+
+    def _setting(self, name: str):
+        return getattr(settings, "%s_%s" % (self.settings_prefix, name))
+
+    def retry_delay(self, attempts: int) -> timezone.timedelta:
+        """Returns how long to wait before retrying a row that has failed `attempts` times."""
+        base = self._setting("RETRY_BASE_SECONDS")
+        return timezone.timedelta(seconds=base * 2 ** max(attempts - 1, 0))
+
+    def claim(self, batch_size: int, now: timezone.datetime) -> List[models.Model]:
+        """
+        Atomically claims up to `batch_size` due rows for this worker. Claimed rows are moved to `SENDING`, so no
+        other worker will pick them up again until the claim goes stale.
+        """
+        stale = now - timezone.timedelta(minutes=self._setting("CLAIM_TIMEOUT_MINUTES"))
+        claimable = Q(status=QUEUED, next_attempt_at__lte=now) | Q(
+            status=SENDING, claimed_at__lt=stale
+        )
+        due = list(
+            self.model.objects.filter(claimable)
+            .order_by("next_attempt_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        claim = uuid.uuid4()
+        # The condition is repeated, so that a row claimed by another worker in the meantime isn't claimed twice.
+        self.model.objects.filter(claimable, pk__in=due).update(
+            status=SENDING, claim=claim, claimed_at=now
+        )
+        return list(self.model.objects.filter(claim=claim).order_by("pk"))
+
+    def record_failure(self, row: models.Model, error: Exception, now) -> None:
+        """
+        Queues `row` to be retried after `retry_delay`, or marks it as failed once it has run out of attempts.
+        """
+        attempts = row.attempts + 1
+        gave_up = attempts >= self._setting("MAX_ATTEMPTS")
+        self.model.objects.filter(pk=row.pk).update(
+            status=FAILED if gave_up else QUEUED,
+            attempts=F("attempts") + 1,
+            next_attempt_at=now + self.retry_delay(attempts),
+            last_error=repr(error),
+        )
+
+    def record_sent(self, pks: Iterable) -> None:
+        self.model.objects.filter(pk__in=pks).update(
+            status=SENT, sent_at=timezone.now(), attempts=F("attempts") + 1
+        )
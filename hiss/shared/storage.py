@@ -0,0 +1,164 @@
+"""
+Staged file storage. Uploads (e.g. resumes) are saved to the database (as `shared.models.StagedFile`s) during the
+request, and pushed to the remote storage (Dropbox in deployment) later by the `uploadstaged` management command, so
+that applicants never wait on the remote storage. Until a file has been uploaded, it's read from the database, and
+linked to through `staged_file_view`.
+
+Uploads that fail are retried with exponential backoff (see `shared.retry_queue`), and files claimed by an uploader
+that died before finishing are claimed again once the claim is `STAGED_UPLOAD_CLAIM_TIMEOUT_MINUTES` old.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, get_storage_class
+from django.http import Http404, HttpRequest, HttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+
+from shared.models import StagedFile
+from shared.retry_queue import RetryQueue
+
+logger = logging.getLogger(__name__)
+
+queue = RetryQueue(StagedFile, "STAGED_UPLOAD")
+
+
+def _staged_content(name: str) -> Optional[bytes]:
+    staged = StagedFile.objects.filter(name=name).values_list("content", flat=True)
+    content = staged.first()
+    return None if content is None else bytes(content)
+
+
+@deconstructible
+class StagedStorage(Storage):
+    """
+    Saves files to the database, and reads them from there until `upload_staged` has moved them to the storage named
+    by `settings.STAGED_STORAGE_REMOTE`.
+    """
+
+    def __init__(self, remote: str = None):
+        self._remote = remote
+
+    @cached_property
+    def remote(self) -> Storage:
+        return get_storage_class(self._remote or settings.STAGED_STORAGE_REMOTE)()
+
+    def _save(self, name: str, content) -> str:
+        StagedFile.objects.create(name=name, content=b"".join(content.chunks()))
+        return name
+
+    def _open(self, name: str, mode: str = "rb"):
+        content = _staged_content(name)
+        if content is None:
+            # Already uploaded (possibly just now).
+            return self.remote.open(name, mode)
+        return ContentFile(content, name=name)
+
+    def get_available_name(self, name: str, max_length: int = None) -> str:
+        # Only staged files are checked, so that saving never waits on the remote storage. Uploaded files get unique
+        # names anyway (see `application.models.uuid_generator`).
+        directory, file_name = os.path.split(name)
+        root, extension = os.path.splitext(file_name)
+        while self.is_staged(name):
+            name = os.path.join(
+                directory, "%s_%s%s" % (root, get_random_string(7), extension)
+            )
+        return name
+
+    def is_staged(self, name: str) -> bool:
+        return StagedFile.objects.filter(name=name).exists()
+
+    def exists(self, name: str) -> bool:
+        return self.is_staged(name) or self.remote.exists(name)
+
+    def delete(self, name: str) -> None:
+        StagedFile.objects.filter(name=name).delete()
+        self.remote.delete(name)
+
+    def size(self, name: str) -> int:
+        content = _staged_content(name)
+        if content is None:
+            return self.remote.size(name)
+        return len(content)
+
+    def url(self, name: str) -> str:
+        # The remote storage may not be able to link to a file it doesn't have yet.
+        if self.is_staged(name):
+            return reverse("staged_file", args=[name])
+        return self.remote.url(name)
+
+    def listdir(self, path: str) -> Tuple[List[str], List[str]]:
+        return self.remote.listdir(path)
+
+    def upload(self, name: str, content: bytes) -> None:
+        """
+        Copies a staged file to the remote storage (unless it's already there). Doesn't touch the database, so that
+        it can be called from other threads.
+        """
+        if self.remote.exists(name):
+            return
+        saved = self.remote.save(name, ContentFile(content))
+        if saved != name:
+            # Someone else uploaded a file with the same name in the meantime. Keep both.
+            logger.error("Staged file %s was uploaded as %s", name, saved)
+
+
+def _upload(storage: StagedStorage, staged: StagedFile) -> Optional[Exception]:
+    try:
+        storage.upload(staged.name, bytes(staged.content))
+        return None
+    except Exception as error:  # pylint: disable=W0703
+        return error
+
+
+def upload_staged(
+    storage: StagedStorage, workers: int = None, batch_size: int = None
+) -> Tuple[int, int]:
+    """
+    Claims a batch of due staged files and uploads them with a pool of `workers` threads. Uploaded files are removed
+    from the database, and files that fail are rescheduled with exponential backoff (or marked as failed once they
+    run out of attempts, in which case they're still read from the database). Returns the number of files uploaded
+    and the number that failed.
+    """
+    workers = workers or settings.STAGED_UPLOAD_WORKERS
+    now = timezone.now()
+    staged_files = queue.claim(batch_size or workers * 2, now)
+    if not staged_files:
+        return 0, 0
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        errors = list(
+            executor.map(lambda staged: _upload(storage, staged), staged_files)
+        )
+    uploaded = []
+    for staged, error in zip(staged_files, errors):
+        if error is None:
+            uploaded.append(staged.pk)
+        else:
+            logger.warning("Failed to upload staged file %s: %r", staged.name, error)
+            queue.record_failure(staged, error, now)
+    StagedFile.objects.filter(pk__in=uploaded).delete()
+    return len(uploaded), len(staged_files) - len(uploaded)
+
+
+@staff_member_required
+def staged_file_view(_request: HttpRequest, name: str) -> HttpResponse:
+    """
+    Serves a file that hasn't been uploaded to the remote storage yet.
+    """
+    content = _staged_content(name)
+    if content is None:
+        raise Http404
+    response = HttpResponse(content, content_type="application/octet-stream")
+    filename = os.path.basename(name)
+    response["Content-Disposition"] = 'attachment; filename="%s"' % filename
+    return response
@@ -1,11 +1,14 @@
 from django import test
+from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
 from django.utils import timezone
 
 from application import models as application_models
 from application.models import Wave, School
+from application.snapshots import clear_local_snapshots
 from user.models import User
+from volunteer.authentication import clear_auth_cache
 
 TEST_RESUME_DIR = "test_resume_dir"
 
@@ -15,6 +18,12 @@ class SharedTestCase(test.TestCase):
     """A shared test case that provides utility functions for testing code easily."""
 
     def setUp(self) -> None:
+        # Cached data (e.g. the wave schedule) isn't rolled back between tests like the database is.
+        cache.clear()
+        Wave.objects.clear_schedule_cache()
+        clear_auth_cache()
+        clear_local_snapshots()
+
         self.email = "email@dummy.com"
         self.password = "password"
         self.first_name = "Kennedy"
@@ -48,21 +57,30 @@ class SharedTestCase(test.TestCase):
         self.application_fields = {
             "first_name": self.first_name,
             "last_name": self.last_name,
-            "shirt_size": application_models.WOMENS_XXS,
+            "school_email": "kennedy@dummy.edu",
+            "phone_number": "4055550123",
+            "birthday": "01/01/2000",
+            "shirt_size": application_models.UNISEX_XXS,
             "major": "Computer Science",
             "school": self.first_school,
             "gender": application_models.FEMALE,
-            "classification": application_models.FRESHMAN,
-            "grad_year": timezone.now().year + 1,
-            "num_hackathons_attended": application_models.HACKATHONS_0,
+            "pronouns": "She/Her",
+            "level_of_study": application_models.UNDERGRAD_UNIVERSITY,
+            "graduation_year": application_models.GRAD_YEAR_1,
+            "num_hackathons_attended": "0",
             "user": self.user,
             "race": [application_models.NO_ANSWER],
-            "extra_links": "A",
+            "where_did_you_hear": [application_models.FRIEND],
+            "social_links": "A",
             "question1": "B",
             "question2": "C",
             "question3": "D",
-            "is_adult": True,
+            "shipping_address": False,
+            "interested_in_hacklahoma": False,
+            "mlh_authorize": False,
+            "liability_waiver": True,
             "agree_to_coc": True,
+            "photo_release": True,
             **self.resume_file_data,
         }
 
@@ -0,0 +1,7 @@
+from .badge_token_tests import *
+from .batch_mail_tests import *
+from .outbox_tests import *
+from .storage_tests import *
+from .zip_stream_tests import *
+from .metrics_tests import *
+from .settings_tests import *
@@ -0,0 +1 @@
+from .badge_tokens import *
@@ -0,0 +1,46 @@
+import base64
+import uuid
+from unittest import TestCase
+
+from shared.badge_tokens import (
+    InvalidBadgeToken,
+    decode_badge_token,
+    encode_badge_token,
+)
+
+KEY = b"badge signing key"
+
+
+class BadgeTokenTestCase(TestCase):
+    def setUp(self):
+        self.application_id = uuid.uuid4()
+        self.token = encode_badge_token(self.application_id, KEY)
+
+    def test_round_trips(self):
+        self.assertEqual(decode_badge_token(self.token, KEY), self.application_id)
+
+    def test_accepts_lowercase_and_whitespace(self):
+        token = " %s\n" % self.token.lower()
+        self.assertEqual(decode_badge_token(token, KEY), self.application_id)
+
+    def test_rejects_other_keys(self):
+        with self.assertRaises(InvalidBadgeToken):
+            decode_badge_token(self.token, b"another key")
+
+    def test_rejects_garbled_tokens(self):
+        flipped = "A" if self.token[5] != "A" else "B"
+        for token in [
+            "",
+            "not base 32!",
+            self.token[:-4],
+            self.token[:5] + flipped + self.token[6:],
+        ]:
+            with self.assertRaises(InvalidBadgeToken, msg=token):
+                decode_badge_token(token, KEY)
+
+    def test_rejects_unknown_versions(self):
+        raw = bytearray(base64.b32decode(self.token + "=" * (-len(self.token) % 8)))
+        raw[0] = 2
+        token = base64.b32encode(bytes(raw)).decode().rstrip("=")
+        with self.assertRaisesRegex(InvalidBadgeToken, "version"):
+            decode_badge_token(token, KEY)
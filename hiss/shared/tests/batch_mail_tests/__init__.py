@@ -0,0 +1 @@
+from .batch_mail import *
@@ -0,0 +1,50 @@
+from unittest import mock
+
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
+
+from application.admin import APPROVAL_EMAIL, REJECTION_EMAIL
+from shared import test_case
+from shared.batch_mail import BatchMailTemplate
+
+
+class BatchMailTemplateTestCase(test_case.SharedTestCase):
+    def assertMatchesRenderedTemplate(self, template: BatchMailTemplate, **values):
+        html = render_to_string(template.template_name, {**template.context, **values})
+        subject, message, html_message, from_email, to = template.build(
+            self.email, **values
+        )
+
+        self.assertEqual(html_message, html)
+        self.assertEqual(message, strip_tags(html))
+        self.assertEqual(
+            (subject, from_email, to), (template.subject, None, [self.email])
+        )
+
+    def test_matches_approval_template(self):
+        self.assertMatchesRenderedTemplate(
+            APPROVAL_EMAIL, first_name="Kennedy", confirmation_deadline=timezone.now()
+        )
+
+    def test_matches_rejection_template(self):
+        self.assertMatchesRenderedTemplate(REJECTION_EMAIL, first_name="Kennedy")
+
+    def test_escapes_values(self):
+        self.assertMatchesRenderedTemplate(
+            REJECTION_EMAIL, first_name="<b>O'Brien & co</b>"
+        )
+
+    def test_template_is_rendered_once(self):
+        template = BatchMailTemplate(
+            "application/emails/rejected.html", "Subject", slots=["first_name"]
+        )
+
+        with mock.patch(
+            "shared.batch_mail.strip_tags", wraps=strip_tags
+        ) as mock_strip_tags:
+            for name in ["A", "B", "C"]:
+                _, message, *_ = template.build(self.email, first_name=name)
+                self.assertIn(name, message)
+
+        self.assertEqual(mock_strip_tags.call_count, 1)
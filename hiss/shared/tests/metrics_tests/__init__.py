@@ -0,0 +1 @@
+from .request_metrics import *
@@ -0,0 +1,112 @@
+import json
+
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from application.models import Application
+from shared import test_case
+from shared.metrics import (
+    RequestMetrics,
+    Sample,
+    UNRESOLVED,
+    percentile,
+    request_metrics,
+)
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True)
+class RequestMetricsMiddlewareTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        request_metrics.clear()
+        self.create_active_wave()
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+        self.client.force_login(self.user)
+
+    def test_records_view_queries_and_times(self):
+        for _ in range(3):
+            self.client.get(reverse_lazy("status"))
+
+        summary = request_metrics.summary()["status"]
+
+        self.assertEqual(summary["count"], 3)
+        self.assertGreater(summary["queries"]["p50"], 0)
+        self.assertGreater(summary["wall_ms"]["p99"], 0)
+        self.assertGreaterEqual(summary["wall_ms"]["p50"], summary["db_ms"]["p50"])
+
+    def test_records_admin_changelist(self):
+        self.client.force_login(self.admin)
+
+        self.client.get(reverse_lazy("admin:application_application_changelist"))
+
+        self.assertIn(
+            "admin:application_application_changelist", request_metrics.summary()
+        )
+
+    def test_records_unresolved_requests(self):
+        self.client.get("/no-such-page/")
+
+        self.assertEqual(request_metrics.summary()[UNRESOLVED]["count"], 1)
+
+    def test_logs_slow_requests_as_json(self):
+        with self.settings(REQUEST_METRICS_SLOW_SECONDS=0):
+            with self.assertLogs("shared.metrics", "WARNING") as logs:
+                self.client.get(reverse_lazy("status"))
+
+        line = json.loads(logs.records[0].getMessage())
+        self.assertEqual(line["event"], "slow_request")
+        self.assertEqual(line["view"], "status")
+        self.assertEqual(line["status"], 200)
+        self.assertGreater(line["queries"], 0)
+
+    def test_fast_requests_are_not_logged(self):
+        with self.assertRaises(AssertionError):
+            with self.assertLogs("shared.metrics", "WARNING"):
+                self.client.get(reverse_lazy("status"))
+
+    def test_metrics_view_shows_percentiles_to_staff(self):
+        self.client.get(reverse_lazy("status"))
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse_lazy("metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()["enabled"])
+        self.assertEqual(
+            set(response.json()["views"]["status"]["wall_ms"]), {"p50", "p95", "p99"}
+        )
+
+    def test_metrics_view_is_staff_only(self):
+        response = self.client.get(reverse_lazy("metrics"))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(str(reverse_lazy("admin:login")), response.url)
+
+
+class RequestMetricsTestCase(test_case.SharedTestCase):
+    def test_disabled_middleware_records_nothing(self):
+        request_metrics.clear()
+        self.client.force_login(self.user)
+
+        self.client.get(reverse_lazy("status"))
+
+        self.assertEqual(request_metrics.summary(), {})
+
+    def test_percentiles_use_nearest_rank(self):
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+
+    def test_windows_keep_most_recent_samples(self):
+        metrics = RequestMetrics()
+        with self.settings(REQUEST_METRICS_WINDOW=10):
+            for i in range(100):
+                metrics.record("view", Sample(i / 1000, i, 0))
+
+        summary = metrics.summary()["view"]
+        self.assertEqual(summary["count"], 10)
+        self.assertEqual(summary["queries"]["p50"], 94)
+        self.assertEqual(summary["wall_ms"]["p99"], 99)
@@ -0,0 +1,120 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from shared import outbox
+from shared import test_case
+from shared.models import (
+    OutgoingEmail,
+    OUTBOX_FAILED,
+    OUTBOX_QUEUED,
+    OUTBOX_SENDING,
+    OUTBOX_SENT,
+)
+
+
+def build_email(recipient):
+    return "Subject", "Text", "<p>Text</p>", None, [recipient]
+
+
+class OutboxTestCase(test_case.SharedTestCase):
+    def test_enqueue_does_not_send(self):
+        outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutgoingEmail.objects.get().status, OUTBOX_QUEUED)
+
+    def test_enqueue_is_idempotent(self):
+        enqueued = outbox.enqueue_mass_html_mail(
+            [("key", build_email(self.email)), ("key", build_email(self.email))]
+        )
+        enqueued += outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+
+        self.assertEqual(enqueued, 1)
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+
+    def test_enqueue_consumes_generators(self):
+        emails = ((str(i), build_email(self.email)) for i in range(1200))
+
+        self.assertEqual(outbox.enqueue_mass_html_mail(emails), 1200)
+
+    def test_sends_queued_mail(self):
+        outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+
+        sent, failed = outbox.send_queued_mail()
+
+        self.assertEqual((sent, failed), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.email])
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        self.assertEqual(OutgoingEmail.objects.get().status, OUTBOX_SENT)
+
+    def test_sent_mail_is_never_resent(self):
+        outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+        outbox.send_queued_mail()
+        outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+
+        outbox.send_queued_mail()
+
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_failed_mail_is_retried_with_backoff(self):
+        outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+
+        with mock.patch(
+            "django.core.mail.EmailMultiAlternatives.send", side_effect=OSError
+        ):
+            sent, failed = outbox.send_queued_mail()
+
+        self.assertEqual((sent, failed), (0, 1))
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.status, OUTBOX_QUEUED)
+        self.assertEqual(email.attempts, 1)
+        self.assertGreater(email.next_attempt_at, timezone.now())
+        # Not due yet, so nothing is sent
+        self.assertEqual(outbox.send_queued_mail(), (0, 0))
+
+    @override_settings(OUTBOX_MAX_ATTEMPTS=1)
+    def test_gives_up_after_max_attempts(self):
+        outbox.enqueue_mass_html_mail([("key", build_email(self.email))])
+
+        with mock.patch(
+            "django.core.mail.EmailMultiAlternatives.send", side_effect=OSError
+        ):
+            outbox.send_queued_mail()
+
+        self.assertEqual(OutgoingEmail.objects.get().status, OUTBOX_FAILED)
+
+    def test_command_drains_outbox_in_batches(self):
+        outbox.enqueue_mass_html_mail(
+            (str(i), build_email(self.email)) for i in range(5)
+        )
+
+        call_command("sendqueuedmail", "--batch-size", "2")
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertFalse(OutgoingEmail.objects.exclude(status=OUTBOX_SENT).exists())
+
+    def test_stale_claims_are_reclaimed(self):
+        outbox.enqueue_mass_html_mail(
+            [("stale", build_email(self.email)), ("fresh", build_email(self.email2))]
+        )
+        now = timezone.now()
+        # Claimed by workers that died mid-batch, one long ago and one just now.
+        OutgoingEmail.objects.filter(idempotency_key="stale").update(
+            status=OUTBOX_SENDING, claimed_at=now - timezone.timedelta(minutes=16)
+        )
+        OutgoingEmail.objects.filter(idempotency_key="fresh").update(
+            status=OUTBOX_SENDING, claimed_at=now
+        )
+
+        sent, failed = outbox.send_queued_mail()
+
+        self.assertEqual((sent, failed), (1, 0))
+        self.assertEqual(mail.outbox[0].to, [self.email])
+        self.assertEqual(
+            OutgoingEmail.objects.get(idempotency_key="fresh").status, OUTBOX_SENDING
+        )
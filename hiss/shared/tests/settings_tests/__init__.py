@@ -0,0 +1 @@
+from .deployment import *
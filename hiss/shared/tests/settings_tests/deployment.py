@@ -0,0 +1,35 @@
+import importlib
+import os
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from application.models import Wave
+from shared import test_case
+
+
+def deployment_settings():
+    with mock.patch.dict(os.environ, {"SECRET_KEY": "deployment"}):
+        return importlib.import_module("hiss.settings.deployment")
+
+
+class DeploymentSettingsTestCase(test_case.SharedTestCase):
+    def test_sends_real_email(self):
+        settings = deployment_settings()
+
+        self.assertFalse(settings.DEBUG)
+        self.assertEqual(settings.SECRET_KEY, "deployment")
+        self.assertEqual(
+            settings.EMAIL_BACKEND, "anymail.backends.mailgun.EmailBackend"
+        )
+
+    def test_cache_table_is_created(self):
+        settings = deployment_settings()
+
+        with override_settings(CACHES=settings.CACHES):
+            call_command("createcachetable")
+            Wave.objects.clear_schedule_cache()
+
+            self.create_active_wave()
+            self.assertEqual(Wave.objects.active_wave(), self.wave1)
@@ -0,0 +1 @@
+from .staged_storage import *
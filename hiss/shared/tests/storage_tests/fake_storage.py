@@ -0,0 +1,43 @@
+import threading
+
+from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
+
+
+class FakeRemoteStorage(FileSystemStorage):
+    """
+    Stands in for Dropbox in tests: files are kept in `FakeRemoteStorage.location`, and the next `failures` saves
+    raise `ConnectionError`.
+    """
+
+    directory = None
+    failures = 0
+    saves = 0
+    _lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__(
+            location=FakeRemoteStorage.directory, base_url="https://remote.example/"
+        )
+
+    @classmethod
+    def reset(cls, directory: str, failures: int = 0) -> None:
+        cls.directory = directory
+        cls.failures = failures
+        cls.saves = 0
+
+    def _save(self, name, content):
+        with FakeRemoteStorage._lock:
+            FakeRemoteStorage.saves += 1
+            if FakeRemoteStorage.failures:
+                FakeRemoteStorage.failures -= 1
+                raise ConnectionError("The fake remote storage is down")
+        return super()._save(name, content)
+
+
+def staged_storage_settings() -> override_settings:
+    return override_settings(
+        DEFAULT_FILE_STORAGE="shared.storage.StagedStorage",
+        STAGED_STORAGE_REMOTE="shared.tests.storage_tests.fake_storage.FakeRemoteStorage",
+        STAGED_UPLOAD_RETRY_BASE_SECONDS=0,
+    )
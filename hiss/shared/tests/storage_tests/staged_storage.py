@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse_lazy
+
+from application.models import Application
+from shared import retry_queue, test_case
+from shared.models import StagedFile
+from shared.storage import StagedStorage, upload_staged
+from shared.tests.storage_tests.fake_storage import (
+    FakeRemoteStorage,
+    staged_storage_settings,
+)
+
+
+class StagedStorageTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.remote_directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.remote_directory)
+        FakeRemoteStorage.reset(self.remote_directory)
+        settings = staged_storage_settings()
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.storage = default_storage
+
+    def test_saves_to_database(self):
+        name = self.storage.save("resume.pdf", ContentFile(b"resume"))
+
+        self.assertTrue(self.storage.is_staged(name))
+        self.assertFalse(os.listdir(self.remote_directory))
+        with self.storage.open(name) as file:
+            self.assertEqual(file.read(), b"resume")
+        self.assertEqual(self.storage.size(name), 6)
+        self.assertEqual(FakeRemoteStorage.saves, 0)
+
+    def test_staged_names_are_unique(self):
+        first = self.storage.save("resume.pdf", ContentFile(b"first"))
+        second = self.storage.save("resume.pdf", ContentFile(b"second"))
+
+        self.assertNotEqual(first, second)
+        with self.storage.open(second) as file:
+            self.assertEqual(file.read(), b"second")
+
+    def test_upload_moves_files_to_remote(self):
+        names = [
+            self.storage.save("resume%s.pdf" % i, ContentFile(b"resume"))
+            for i in range(5)
+        ]
+
+        self.assertEqual(upload_staged(self.storage, workers=2, batch_size=10), (5, 0))
+
+        self.assertFalse(StagedFile.objects.exists())
+        for name in names:
+            self.assertTrue(os.path.exists(os.path.join(self.remote_directory, name)))
+            with self.storage.open(name) as file:
+                self.assertEqual(file.read(), b"resume")
+        self.assertEqual(
+            self.storage.url(names[0]), "https://remote.example/%s" % names[0]
+        )
+
+    def test_failed_uploads_stay_staged_and_are_retried(self):
+        name = self.storage.save("resume.pdf", ContentFile(b"resume"))
+        FakeRemoteStorage.failures = 1
+
+        with self.assertLogs("shared.storage", "WARNING"):
+            self.assertEqual(upload_staged(self.storage), (0, 1))
+        staged = StagedFile.objects.get(name=name)
+        self.assertEqual(staged.status, retry_queue.QUEUED)
+        self.assertEqual(staged.attempts, 1)
+        with self.storage.open(name) as file:
+            self.assertEqual(file.read(), b"resume")
+
+        self.assertEqual(upload_staged(self.storage), (1, 0))
+        self.assertFalse(self.storage.is_staged(name))
+
+    @override_settings(STAGED_UPLOAD_MAX_ATTEMPTS=1)
+    def test_gives_up_after_max_attempts(self):
+        name = self.storage.save("resume.pdf", ContentFile(b"resume"))
+        FakeRemoteStorage.failures = 1
+
+        with self.assertLogs("shared.storage", "WARNING"):
+            self.assertEqual(upload_staged(self.storage), (0, 1))
+
+        self.assertEqual(StagedFile.objects.get(name=name).status, retry_queue.FAILED)
+        self.assertEqual(upload_staged(self.storage), (0, 0))
+        self.assertTrue(self.storage.is_staged(name))
+
+    def test_staff_can_download_staged_files(self):
+        name = self.storage.save("resume.pdf", ContentFile(b"resume"))
+        url = self.storage.url(name)
+
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        self.client.force_login(self.admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"resume")
+
+    def test_application_resume_is_staged(self):
+        self.create_active_wave()
+        self.client.force_login(self.user)
+        fields = {
+            **self.application_fields,
+            "resume": self.resume,
+            "school": self.first_school.pk,
+        }
+        del fields["user"]
+
+        self.client.post(reverse_lazy("application:create"), fields)
+
+        application = Application.objects.get(user=self.user)
+        self.assertIsInstance(application.resume.storage, StagedStorage)
+        self.assertTrue(application.resume.storage.is_staged(application.resume.name))
+        self.assertEqual(FakeRemoteStorage.saves, 0)
+
+        call_command("uploadstaged", stdout=StringIO())
+
+        self.assertFalse(application.resume.storage.is_staged(application.resume.name))
+        self.assertEqual(FakeRemoteStorage.saves, 1)
@@ -0,0 +1,36 @@
+import io
+import zipfile
+
+from django.test import SimpleTestCase
+
+from shared.zip_stream import stream_zip
+
+
+class StreamZipTestCase(SimpleTestCase):
+    def test_archive_contains_entries(self):
+        entries = [("a.txt", b"first"), ("b/c.txt", b"second" * 1000)]
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(stream_zip(entries))))
+
+        self.assertEqual(archive.namelist(), ["a.txt", "b/c.txt"])
+        self.assertEqual(archive.read("a.txt"), b"first")
+        self.assertEqual(archive.read("b/c.txt"), b"second" * 1000)
+        self.assertIsNone(archive.testzip())
+
+    def test_empty_archive_is_valid(self):
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(stream_zip([]))))
+
+        self.assertEqual(archive.namelist(), [])
+
+    def test_entries_are_consumed_lazily(self):
+        consumed = []
+
+        def entries():
+            for i in range(3):
+                consumed.append(i)
+                yield "%s.txt" % i, b"x" * 100
+
+        chunks = stream_zip(entries())
+        next(chunks)
+
+        self.assertEqual(consumed, [0])
@@ -0,0 +1,42 @@
+import zipfile
+from typing import Iterable, Iterator, List, Tuple
+
+
+class _ChunkBuffer:
+    """
+    A write-only, unseekable file that hands whatever has been written to it back through `drain()`. `zipfile`
+    writes archives to unseekable files as a single forward pass, so an archive can be streamed out as it's built.
+    """
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_zip(
+    entries: Iterable[Tuple[str, bytes]], compression: int = zipfile.ZIP_DEFLATED
+) -> Iterator[bytes]:
+    """
+    Builds a ZIP archive of the given (name, content) entries, yielding it in chunks as each entry is added. Only
+    the entry being written (and the archive's directory, a few dozen bytes per entry) is held in memory, so `entries`
+    can be a generator over any number of files.
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, mode="w", compression=compression) as archive:
+        for name, content in entries:
+            archive.writestr(name, content)
+            data = buffer.drain()
+            if data:
+                yield data
+    yield buffer.drain()
@@ -1 +1,2 @@
 from .status import *
+from .snapshot import *
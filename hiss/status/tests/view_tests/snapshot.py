@@ -0,0 +1,189 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+
+from application import decisions, snapshots, stats
+from application.models import (
+    Application,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_PENDING,
+)
+from shared import test_case
+from user.models import User
+
+
+def application_queries(queries: CaptureQueriesContext) -> int:
+    return sum(
+        'FROM "application_application"' in query["sql"]
+        for query in queries.captured_queries
+    )
+
+
+class StatusSnapshotTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.application = Application.objects.create(
+            **self.application_fields, wave=self.wave1
+        )
+        self.client.force_login(self.user)
+
+    def get_status(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse_lazy("status"))
+        return response, application_queries(queries)
+
+    def test_loads_application_once(self):
+        response, queries = self.get_status()
+        self.assertTrue(response.context["PENDING"])
+        self.assertEqual(queries, 1)
+
+        # Only the session and the user are loaded once the snapshot is cached.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse_lazy("status"))
+        self.assertTrue(response.context["PENDING"])
+
+    def test_saving_application_invalidates_snapshot(self):
+        self.get_status()
+
+        self.application.status = STATUS_CHECKED_IN
+        self.application.save()
+
+        response, queries = self.get_status()
+        self.assertTrue(response.context["CHECKED_IN"])
+        self.assertEqual(queries, 1)
+
+    def test_bulk_status_change_invalidates_snapshot(self):
+        self.get_status()
+
+        stats.update_status(Application.objects.all(), STATUS_CHECKED_IN)
+
+        response, _ = self.get_status()
+        self.assertTrue(response.context["CHECKED_IN"])
+
+    def test_deleting_application_invalidates_snapshot(self):
+        self.get_status()
+
+        self.application.delete()
+
+        response, _ = self.get_status()
+        self.assertTrue(response.context["NOT_APPLIED"])
+
+    def test_refreshes_skip_shared_cache(self):
+        self.get_status()
+
+        # The shared cache is a database table in deployment, so refreshes are served from this process's copy.
+        with mock.patch.object(snapshots.cache, "get") as cache_get:
+            response, queries = self.get_status()
+        self.assertTrue(response.context["PENDING"])
+        self.assertEqual(queries, 0)
+        cache_get.assert_not_called()
+
+    def test_local_copy_expires(self):
+        self.get_status()
+        # A change made by another process only reaches the shared cache.
+        Application.objects.filter(pk=self.application.pk).update(
+            status=STATUS_CHECKED_IN
+        )
+        cache.clear()
+
+        self.assertTrue(self.get_status()[0].context["PENDING"])
+        with mock.patch("time.monotonic", return_value=time.monotonic() + 60):
+            response, queries = self.get_status()
+        self.assertTrue(response.context["CHECKED_IN"])
+        self.assertEqual(queries, 1)
+
+    def test_own_change_skips_other_processes_copies(self):
+        Application.objects.filter(pk=self.application.pk).update(
+            status=STATUS_ADMITTED
+        )
+        cache.clear()
+        self.get_status()
+
+        self.client.post(
+            reverse_lazy("application:confirm", args=[self.application.pk])
+        )
+        # Another process may still hold a copy from before the change.
+        snapshots._local_set(
+            self.user.id, snapshots.StatusSnapshot(self.application.pk, STATUS_ADMITTED)
+        )
+
+        response, _ = self.get_status()
+        self.assertTrue(response.context["CONFIRMED"])
+        # Refreshes are served from the local copy again once the old copies have expired.
+        with mock.patch("time.time", return_value=time.time() + 60):
+            with mock.patch.object(snapshots.cache, "get") as cache_get:
+                response, _ = self.get_status()
+        cache_get.assert_not_called()
+        self.assertTrue(response.context["CONFIRMED"])
+
+    def test_concurrent_reads_of_local_copies(self):
+        # Checks that this process's copies stay consistent when many threads read and replace them at once. The
+        # snapshots are already in the shared cache, so the threads don't need the (per-thread) test database.
+        users = {self.user.id: self.application.pk}
+        for i in range(30):
+            user = User.objects.create_user(
+                "hacker%s@dummy.com" % i, self.password, is_active=True
+            )
+            users[user.id] = Application.objects.create(
+                **{**self.application_fields, "user": user}, wave=self.wave1
+            ).pk
+        for user_id in users:
+            snapshots.status_snapshot(user_id)
+        snapshots.clear_local_snapshots()
+        start = threading.Barrier(8)
+
+        def refresh(worker: int) -> list:
+            start.wait()
+            return [
+                snapshots.status_snapshot(user_id, use_local=(i + worker) % 3 != 0)
+                for i in range(20)
+                for user_id in users
+            ]
+
+        with mock.patch.object(
+            Application.objects, "filter", side_effect=AssertionError
+        ):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(refresh, range(8)))
+        expected = [users[user_id] for _ in range(20) for user_id in users]
+        for snapshot_list in results:
+            self.assertEqual([snapshot.pk for snapshot in snapshot_list], expected)
+
+    def test_repeated_refreshes_during_decision_release(self):
+        # Counts the application queries made while applicants refresh (one at a time) around a release: each
+        # applicant should cause at most one per release, no matter how often they refresh. See
+        # test_concurrent_reads_of_local_copies for concurrent refreshes.
+        users = [self.user] + [
+            User.objects.create_user(
+                "hacker%s@dummy.com" % i, self.password, is_active=True
+            )
+            for i in range(30)
+        ]
+        for user in users[1:]:
+            Application.objects.create(
+                **{**self.application_fields, "user": user}, wave=self.wave1
+            )
+
+        def refresh_all(expected_status: str) -> int:
+            total = 0
+            for _ in range(3):
+                for user in users:
+                    self.client.force_login(user)
+                    response, queries = self.get_status()
+                    self.assertEqual(
+                        response.context["application"].status, expected_status
+                    )
+                    total += queries
+            return total
+
+        self.assertEqual(refresh_all(STATUS_PENDING), len(users))
+        decisions.admit(Application.objects.all())
+        self.assertEqual(refresh_all(STATUS_ADMITTED), len(users))
@@ -2,19 +2,25 @@ from django.contrib.auth import mixins
 from django.views import generic
 
 from application import models as application_models
-from application.models import Wave, Application
-from user.models import User
+from application.models import Wave
+from application.snapshots import request_status_snapshot
 
 
 class StatusView(mixins.LoginRequiredMixin, generic.TemplateView):
+    """
+    Shows the user where their application stands. The application comes from the user's cached status snapshot
+    (see `application.snapshots`) and the waves from the cached wave schedule, so that this page (which everyone
+    refreshes when decisions are released) usually doesn't query the database beyond the session.
+    """
+
     template_name = "status/status.html"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        user: User = self.request.user
+        app = request_status_snapshot(self.request)
 
         active_wave = Wave.objects.active_wave()
-        if not active_wave and not user.application_set.exists():
+        if not active_wave and app.pk is None:
             next_wave = Wave.objects.next_wave()
             if not next_wave:
                 context["NO_MORE_WAVES"] = True
@@ -24,10 +30,9 @@ class StatusView(mixins.LoginRequiredMixin, generic.TemplateView):
         else:
             if active_wave:
                 context["active_wave_end"] = active_wave.end
-            if not user.application_set.exists():
+            if app.pk is None:
                 context["NOT_APPLIED"] = True
                 return context
-            app: Application = user.application_set.first()
             app_status = app.status
             if app_status == application_models.STATUS_PENDING:
                 context["PENDING"] = True
@@ -1,38 +1,43 @@
-import csv
-
 from django.contrib import admin
 
 # Register your models here.
-from django.db.models import QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.db.models import Count, QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
 from django import forms
 
 from application.admin import approve, reject
+from application.models import Application
+from shared.admin_functions import EXPORT_CHUNK_SIZE, stream_csv
 from team.models import Team
+from user.models import User
 
 
 def approve_team(_model_admin, _request: HttpRequest, queryset: QuerySet) -> None:
-    for team in queryset:
-        applications = [member.application_set.first() for member in team.members.all()]
-        approve(None, None, applications)
+    """
+    Approves every member of the selected `Team`s in a single decision (see `application.admin.approve`), which
+    also marks the teams as admitted.
+    """
+    approve(None, None, Application.objects.filter(user__team__in=queryset))
 
 
 def reject_team(_model_admin, _request: HttpRequest, queryset: QuerySet) -> None:
-    for team in queryset:
-        applications = [member.application_set.first() for member in team.members.all()]
-        reject(None, None, applications)
-
-
-def export_team_emails(_model_admin, _request: HttpRequest, queryset: QuerySet) -> None:
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="emails.csv"'
+    """
+    Rejects every member of the selected `Team`s in a single decision (see `application.admin.reject`), which also
+    marks the teams as not admitted.
+    """
+    reject(None, None, Application.objects.filter(user__team__in=queryset))
 
-    writer = csv.writer(response)
-    for team in queryset:
-        for member in team.members.all():
-            writer.writerow([member.email])
 
-    return response
+def export_team_emails(
+    _model_admin, _request: HttpRequest, queryset: QuerySet
+) -> StreamingHttpResponse:
+    rows = (
+        User.objects.filter(team__in=queryset)
+        .order_by("team_id")
+        .values_list("email")
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    return stream_csv("emails.csv", rows)
 
 
 class TeamAdminForm(forms.ModelForm):
@@ -43,7 +48,16 @@ class TeamAdminForm(forms.ModelForm):
 
 class TeamAdmin(admin.ModelAdmin):
     form = TeamAdminForm
-    list_display = ("name", "admitted")
+    list_display = ("name", "num_members", "admitted")
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return super().get_queryset(request).annotate(num_members=Count("members"))
+
+    def num_members(self, obj: Team) -> int:
+        return obj.num_members
+
+    num_members.short_description = "Members"
+    num_members.admin_order_field = "num_members"
     actions = [approve_team, reject_team, export_team_emails]
 
 
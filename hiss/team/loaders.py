@@ -0,0 +1,98 @@
+"""
+Loading teams together with their members and the members' applications, and keeping `Team.admitted` in step with
+those applications. `prefetch_members` loads any number of teams' members and applications in two queries, so that
+walking a team's roster (in views or in the admin) doesn't run a query per member.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.db.models import Prefetch
+from django.db.models.query import prefetch_related_objects
+
+from application.models import (
+    Application,
+    STATUS_ADMITTED,
+    STATUS_CHECKED_IN,
+    STATUS_CONFIRMED,
+    STATUS_DECLINED,
+    STATUS_EXPIRED,
+    STATUS_REJECTED,
+)
+from team.models import Team
+from user.models import User
+
+ADMITTED_STATUSES = {
+    STATUS_ADMITTED,
+    STATUS_CONFIRMED,
+    STATUS_DECLINED,
+    STATUS_EXPIRED,
+    STATUS_CHECKED_IN,
+}
+"""Statuses of applications that were admitted, whatever their hackers did afterwards."""
+
+
+def prefetch_members(teams: Iterable[Team]) -> List[Team]:
+    """
+    Loads the members of the given teams, and the members' applications, in two queries (regardless of the number
+    of teams). Afterwards, `team.members.all()` and `member.application_set.all()` don't hit the database.
+    """
+    teams = list(teams)
+    prefetch_related_objects(
+        teams,
+        Prefetch(
+            "members",
+            queryset=User.objects.order_by("date_joined", "pk").prefetch_related(
+                "application_set"
+            ),
+        ),
+    )
+    return teams
+
+
+def member_applications(team: Team) -> List[Application]:
+    """
+    Returns the applications of a team's members, in the order they joined the site. Runs no queries on a team
+    loaded with `prefetch_members`.
+    """
+    return [
+        application
+        for member in team.members.all()
+        for application in member.application_set.all()
+    ]
+
+
+def team_admitted(statuses: Iterable[Optional[str]]) -> Optional[bool]:
+    """
+    Decides a team's `admitted` from its members' application statuses (None for a member without an application):
+    True once every member has been admitted, False once every member has been rejected, and None otherwise.
+    """
+    statuses = set(statuses)
+    if statuses and statuses <= ADMITTED_STATUSES:
+        return True
+    if statuses == {STATUS_REJECTED}:
+        return False
+    return None
+
+
+def update_admitted(team_ids: Iterable) -> None:
+    """
+    Recomputes `Team.admitted` for the given teams from their members' current application statuses, with one query
+    to read the statuses and at most one `UPDATE` per outcome. Call it in the same transaction as the status changes.
+    """
+    team_ids = set(team_ids) - {None}
+    if not team_ids:
+        return
+    statuses: Dict = defaultdict(set)
+    for team_id, status in User.objects.filter(team_id__in=team_ids).values_list(
+        "team_id", "application__status"
+    ):
+        statuses[team_id].add(status)
+
+    team_ids_by_outcome: Dict[Optional[bool], Set] = defaultdict(set)
+    for team_id in team_ids:
+        team_ids_by_outcome[team_admitted(statuses[team_id])].add(team_id)
+    for admitted, ids in team_ids_by_outcome.items():
+        Team.objects.filter(pk__in=ids).exclude(admitted=admitted).update(
+            admitted=admitted
+        )
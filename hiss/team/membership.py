@@ -0,0 +1,72 @@
+"""
+Joining and leaving teams. Membership changes run in a transaction that first locks the team's row (with
+`SELECT ... FOR UPDATE`), so concurrent joins and leaves on the same team are serialized. Otherwise, two hackers
+joining at once could both see room on the team and push it over `MAX_MEMBERS_PER_TEAM`. And a hacker could join a
+team while its last member is leaving, then be deleted with it (users cascade with their team).
+
+The user's team is changed with a queryset `update()`, which doesn't send `post_save`, so the `updated_at` of their
+applications (which the Discord roster polls for changes) is bumped here instead.
+"""
+
+from typing import Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from application.models import Application
+from team.loaders import update_admitted
+from team.models import Team
+from user.models import User
+
+
+class MembershipError(Exception):
+    """
+    Raised when a user can't join a team. The message is shown to the user.
+    """
+
+
+def _lock_team(team_id) -> Optional[Team]:
+    return Team.objects.select_for_update().filter(pk=team_id).first()
+
+
+def _touch_applications(user: User) -> None:
+    Application.objects.filter(user=user).update(updated_at=timezone.now())
+
+
+def join_team(user: User, team_id) -> Team:
+    """
+    Adds `user` to the team with the given id and returns the team. Raises `MembershipError` if there's no such
+    team, the team is at capacity, or the user is already on a team.
+    """
+    with transaction.atomic():
+        team = _lock_team(team_id)
+        if team is None:
+            raise MembershipError("No such team exists.")
+        if team.members.count() >= settings.MAX_MEMBERS_PER_TEAM:
+            raise MembershipError("This team is already at capacity.")
+        # Only updated if the user isn't on a team, in case they're joining another one at the same time.
+        if not User.objects.filter(pk=user.pk, team=None).update(team=team):
+            raise MembershipError(
+                "You cannot be on more than one team at a time. Please leave your existing team and try again."
+            )
+        _touch_applications(user)
+        update_admitted([team.pk])
+    user.team = team
+    return team
+
+
+def leave_team(user: User) -> None:
+    """
+    Removes `user` from their team, and deletes the team if that leaves it without members.
+    """
+    with transaction.atomic():
+        team = _lock_team(user.team_id)
+        User.objects.filter(pk=user.pk).update(team=None)
+        _touch_applications(user)
+        if team is not None:
+            if not team.members.exists():
+                team.delete()
+            else:
+                update_admitted([team.pk])
+    user.team = None
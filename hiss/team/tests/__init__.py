@@ -1 +1,2 @@
 from .view_tests import *
+from .admin_tests import *
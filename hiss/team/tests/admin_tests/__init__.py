@@ -0,0 +1 @@
+from .admission import *
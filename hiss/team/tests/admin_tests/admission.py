@@ -0,0 +1,88 @@
+from django.contrib import admin
+from django.urls import reverse_lazy
+
+from application.admin import approve
+from application.models import (
+    Application,
+    STATUS_ADMITTED,
+    STATUS_PENDING,
+    STATUS_REJECTED,
+)
+from shared import test_case
+from team.loaders import member_applications, prefetch_members, team_admitted
+from team.models import Team
+from user.models import User
+
+
+class TeamAdmissionTestCase(test_case.SharedTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_active_wave()
+        self.teams = [Team.objects.create(name=f"Team {i}") for i in range(3)]
+        for i, team in enumerate(self.teams):
+            for j in range(3):
+                user = User.objects.create_user(
+                    f"hacker{i}-{j}@dummy.com", self.password, team=team
+                )
+                Application.objects.create(
+                    **{**self.application_fields, "user": user, "last_name": f"Doe{j}"},
+                    wave=self.wave1,
+                )
+
+    def post_action(self, action: str, teams):
+        self.client.force_login(self.admin)
+        return self.client.post(
+            reverse_lazy("admin:team_team_changelist"),
+            {"action": action, admin.ACTION_CHECKBOX_NAME: [t.pk for t in teams]},
+            follow=True,
+        )
+
+    def test_prefetch_members_uses_two_queries(self):
+        teams = list(Team.objects.order_by("name"))
+
+        with self.assertNumQueries(2):
+            prefetch_members(teams)
+            applications = [member_applications(team) for team in teams]
+
+        self.assertEqual([len(apps) for apps in applications], [3, 3, 3])
+        self.assertEqual(
+            [app.last_name for app in applications[0]], ["Doe0", "Doe1", "Doe2"]
+        )
+
+    def test_approve_team_admits_members_and_team(self):
+        self.post_action("approve_team", self.teams[:2])
+
+        for team in self.teams[:2]:
+            team.refresh_from_db()
+            self.assertTrue(team.admitted)
+        self.teams[2].refresh_from_db()
+        self.assertIsNone(self.teams[2].admitted)
+        self.assertEqual(Application.objects.filter(status=STATUS_ADMITTED).count(), 6)
+
+    def test_reject_team_rejects_members_and_team(self):
+        self.post_action("reject_team", self.teams[:1])
+
+        self.teams[0].refresh_from_db()
+        self.assertFalse(self.teams[0].admitted)
+        self.assertEqual(Application.objects.filter(status=STATUS_REJECTED).count(), 3)
+
+    def test_team_decision_query_count_is_independent_of_team_count(self):
+        # The decision itself (see application.tests.decision_tests), reading the teams' statuses, one UPDATE per
+        # outcome, and queueing the emails.
+        with self.assertNumQueries(11):
+            approve(None, None, Application.objects.filter(user__team__in=self.teams))
+
+    def test_admitting_one_member_leaves_team_undecided(self):
+        member = self.teams[0].members.first()
+
+        approve(None, None, Application.objects.filter(user=member))
+
+        self.teams[0].refresh_from_db()
+        self.assertIsNone(self.teams[0].admitted)
+
+    def test_team_admitted_from_statuses(self):
+        self.assertTrue(team_admitted([STATUS_ADMITTED, STATUS_ADMITTED]))
+        self.assertFalse(team_admitted([STATUS_REJECTED]))
+        self.assertIsNone(team_admitted([STATUS_ADMITTED, STATUS_PENDING]))
+        self.assertIsNone(team_admitted([STATUS_ADMITTED, None]))
+        self.assertIsNone(team_admitted([]))
@@ -2,3 +2,4 @@ from .create import *
 from .join import *
 from .detail import *
 from .leave import *
+from .concurrency import *
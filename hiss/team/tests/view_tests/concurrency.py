@@ -0,0 +1,100 @@
+import threading
+import unittest
+
+from django.conf import settings
+from django.db import connection
+from django.test import TransactionTestCase
+
+from team.membership import MembershipError, join_team, leave_team
+from team.models import Team
+from user.models import User
+
+NUM_USERS = 20
+
+
+@unittest.skipUnless(
+    connection.features.has_select_for_update,
+    "Needs a database that locks rows (SQLite serializes writers instead, so it would pass regardless)",
+)
+class ConcurrentMembershipTestCase(TransactionTestCase):
+    """
+    Many users changing the membership of the same team at once, each in their own thread (and so over their own
+    database connection). Runs against PostgreSQL, as in CI.
+    """
+
+    def setUp(self):
+        self.team = Team.objects.create(name="Popular Team")
+        self.users = [
+            User.objects.create_user(f"member{i}@dummy.com", "password")
+            for i in range(NUM_USERS)
+        ]
+
+    def run_concurrently(self, function, users):
+        """
+        Calls `function` with each user in its own thread, all starting at once, and returns how many calls
+        succeeded. Concurrent changes should wait on the team's lock, so any error other than `MembershipError`
+        (e.g. a deadlock) fails the test.
+        """
+        barrier = threading.Barrier(len(users))
+        succeeded = []
+        errors = []
+
+        def run(user):
+            barrier.wait()
+            try:
+                function(user)
+                succeeded.append(user)
+            except MembershipError:
+                pass
+            except Exception as error:  # pylint: disable=W0703
+                errors.append(error)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=[user]) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        return len(succeeded)
+
+    def test_concurrent_joins_respect_capacity(self):
+        joined = self.run_concurrently(
+            lambda user: join_team(user, self.team.pk), self.users
+        )
+
+        self.assertEqual(joined, settings.MAX_MEMBERS_PER_TEAM)
+        self.assertEqual(self.team.members.count(), settings.MAX_MEMBERS_PER_TEAM)
+
+    def test_concurrent_leaves_delete_team_once_empty(self):
+        members = self.users[: settings.MAX_MEMBERS_PER_TEAM]
+        User.objects.filter(pk__in=[user.pk for user in members]).update(team=self.team)
+        for user in members:
+            user.team = self.team
+
+        left = self.run_concurrently(leave_team, members)
+
+        self.assertEqual(left, len(members))
+        self.assertFalse(Team.objects.filter(pk=self.team.pk).exists())
+        self.assertEqual(User.objects.filter(team=None).count(), NUM_USERS)
+
+    def test_joins_racing_last_leave_never_lose_users(self):
+        leaver, *joiners = self.users[:5]
+        User.objects.filter(pk=leaver.pk).update(team=self.team)
+        leaver.team = self.team
+
+        def join_or_leave(user):
+            if user == leaver:
+                leave_team(user)
+            else:
+                join_team(user, self.team.pk)
+
+        joined = self.run_concurrently(join_or_leave, [leaver] + joiners) - 1
+
+        # Users cascade with their team, so a join that slipped in before the team was deleted would delete them.
+        self.assertEqual(User.objects.count(), NUM_USERS)
+        if Team.objects.filter(pk=self.team.pk).exists():
+            self.assertEqual(self.team.members.count(), joined)
+        else:
+            self.assertEqual(joined, 0)
@@ -3,6 +3,7 @@ from django.urls import reverse_lazy
 from application.models import Application
 from shared import test_case
 from team.models import Team
+from user.models import User
 
 
 class DetailTeamViewTestCase(test_case.SharedTestCase):
@@ -63,3 +64,25 @@ class DetailTeamViewTestCase(test_case.SharedTestCase):
         response = self.client.get(reverse_lazy("team:detail", args=[team.pk]))
 
         self.assertEqual(response.status_code, 200)
+
+    def test_member_list_query_count_is_independent_of_team_size(self):
+        team: Team = Team.objects.create(**self.team_fields)
+        self.client.force_login(self.user)
+        self.create_active_wave()
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+        self.user.team = team
+        self.user.save()
+        for i in range(3):
+            user = User.objects.create_user(
+                f"member{i}@dummy.com", self.password, team=team
+            )
+            Application.objects.create(
+                **{**self.application_fields, "user": user}, wave=self.wave1
+            )
+        url = reverse_lazy("team:detail", args=[team.pk])
+        self.client.get(url)
+
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+
+        self.assertEqual(len(response.context["member_applications"]), 4)
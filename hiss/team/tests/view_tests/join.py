@@ -1,4 +1,8 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.urls import reverse_lazy
+from django.utils import timezone
 
 from application.models import Application
 from shared import test_case
@@ -69,3 +73,41 @@ class JoinTeamViewTestCase(test_case.SharedTestCase):
         self.user.refresh_from_db()
 
         self.assertEqual(self.user.team, team)
+
+    def test_bumps_application_updated_at(self):
+        self.create_active_wave()
+        self.client.force_login(self.user)
+        team: Team = Team.objects.create(**self.team_fields)
+        app = Application.objects.create(**self.application_fields, wave=self.wave1)
+        Application.objects.filter(pk=app.pk).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.client.post(reverse_lazy("team:join"), data={"id": team.pk})
+        app.refresh_from_db()
+
+        self.assertGreater(app.updated_at, timezone.now() - timedelta(minutes=1))
+
+    def test_shows_error_if_team_full(self):
+        self.create_active_wave()
+        self.client.force_login(self.user)
+        team: Team = Team.objects.create(**self.team_fields)
+        for i in range(settings.MAX_MEMBERS_PER_TEAM):
+            User.objects.create_user(f"member{i}@dummy.com", "A", team=team)
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+
+        response = self.client.post(reverse_lazy("team:join"), data={"id": team.pk})
+
+        self.assertContains(response, "This team is already at capacity.")
+        self.assertEqual(team.members.count(), settings.MAX_MEMBERS_PER_TEAM)
+
+    def test_joining_admitted_team_makes_it_undecided(self):
+        self.create_active_wave()
+        self.client.force_login(self.user)
+        team: Team = Team.objects.create(**self.team_fields, admitted=True)
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+
+        self.client.post(reverse_lazy("team:join"), data={"id": team.pk})
+        team.refresh_from_db()
+
+        self.assertIsNone(team.admitted)
@@ -1,4 +1,7 @@
+from datetime import timedelta
+
 from django.urls import reverse_lazy
+from django.utils import timezone
 
 from application.models import Application
 from shared import test_case
@@ -54,6 +57,22 @@ class LeaveTeamViewTestCase(test_case.SharedTestCase):
 
         self.assertIsNone(self.user.team)
 
+    def test_bumps_application_updated_at(self):
+        self.client.force_login(self.user)
+        self.create_active_wave()
+        app = Application.objects.create(**self.application_fields, wave=self.wave1)
+        team: Team = Team.objects.create(**self.team_fields)
+        self.user.team = team
+        self.user.save()
+        Application.objects.filter(pk=app.pk).update(
+            updated_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.client.post(reverse_lazy("team:leave"))
+        app.refresh_from_db()
+
+        self.assertGreater(app.updated_at, timezone.now() - timedelta(minutes=1))
+
     def test_deletes_team_with_no_members(self):
         self.client.force_login(self.user)
         self.create_active_wave()
@@ -65,3 +84,19 @@ class LeaveTeamViewTestCase(test_case.SharedTestCase):
         self.client.post(reverse_lazy("team:leave"))
 
         self.assertFalse(Team.objects.filter(id=team.pk).exists())
+
+    def test_keeps_team_with_other_members(self):
+        self.client.force_login(self.user)
+        self.create_active_wave()
+        Application.objects.create(**self.application_fields, wave=self.wave1)
+        team: Team = Team.objects.create(**self.team_fields)
+        self.user.team = team
+        self.user.save()
+        self.user2.team = team
+        self.user2.save()
+
+        self.client.post(reverse_lazy("team:leave"))
+        self.user2.refresh_from_db()
+
+        self.assertTrue(Team.objects.filter(id=team.pk).exists())
+        self.assertEqual(self.user2.team, team)
@@ -1,6 +1,3 @@
-from typing import Optional
-
-from django.conf import settings
 from django.http import HttpRequest
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
@@ -9,6 +6,8 @@ from django.views import generic
 from shared import mixins as shared_mixins
 
 from team.forms import CreateTeamForm, JoinTeamForm
+from team.loaders import member_applications, prefetch_members
+from team.membership import MembershipError, join_team, leave_team
 from team.models import Team
 from user.models import User
 from application.models import Application
@@ -63,22 +62,11 @@ class JoinTeamView(shared_mixins.UserHasNoTeamMixin, generic.FormView):
         return self.request.user.team.get_absolute_url()
 
     def form_valid(self, form: JoinTeamForm):
-        team: Optional[Team] = Team.objects.filter(id=form.cleaned_data["id"]).first()
-        if not team:
-            form.add_error(None, "No such team exists.")
-            return self.form_invalid(form)
-        if team.members.count() == settings.MAX_MEMBERS_PER_TEAM:
-            form.add_error(None, "This team is already at capacity.")
-            return self.form_invalid(form)
-        if self.request.user.team is not None:
-            form.add_error(
-                None,
-                "You cannot be on more than one team at a time. Please leave your existing team and try "
-                "again.",
-            )
+        try:
+            join_team(self.request.user, form.cleaned_data["id"])
+        except MembershipError as error:
+            form.add_error(None, str(error))
             return self.form_invalid(form)
-        self.request.user.team = team
-        self.request.user.save()
         return super().form_valid(form)
 
 
@@ -104,20 +92,18 @@ class DetailTeamView(shared_mixins.UserHasTeamMixin, generic.DetailView):
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        team: Team = self.get_object()
-        member_applications = [
-            member.application_set.first() for member in team.members.all()
-        ]
-        context_data["member_applications"] = member_applications
+        (team,) = prefetch_members([self.object])
+        context_data["member_applications"] = member_applications(team)
         return context_data
 
     def get(self, request, *args, **kwargs):
-        team: Team = self.get_object()
-        if self.request.user.team != team:
+        self.object: Team = self.get_object()
+        if self.request.user.team_id != self.object.pk:
             return redirect(
-                reverse_lazy("team:detail", args=[self.request.user.team.pk])
+                reverse_lazy("team:detail", args=[self.request.user.team_id])
             )
-        return super().get(request, *args, **kwargs)
+        context = self.get_context_data(object=self.object)
+        return self.render_to_response(context)
 
 
 class LeaveTeamView(shared_mixins.LoginRequiredAndAppliedMixin, generic.base.View):
@@ -126,11 +112,5 @@ class LeaveTeamView(shared_mixins.LoginRequiredAndAppliedMixin, generic.base.Vie
     """
 
     def post(self, request: HttpRequest, *_args, **_kwargs):
-        team: Team = request.user.team
-        request.user.team = None
-        request.user.save()
-
-        team.refresh_from_db()
-        if team.members.count() == 0:
-            team.delete()
+        leave_team(request.user)
         return redirect(reverse_lazy("status"))
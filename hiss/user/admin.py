@@ -1,11 +1,10 @@
-import csv
-
 from django.contrib import admin
 from django.contrib.auth.models import Group
 from django.db import transaction
 from django.db.models.query import QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest
 
+from shared.admin_functions import EXPORT_CHUNK_SIZE, stream_csv
 from user.forms import GroupAdminForm
 from user.models import User
 
@@ -14,14 +13,8 @@ def export_user_emails(_modeladmin, _request: HttpRequest, queryset: QuerySet):
     """
     Exports the emails related to the selected `User`s to a CSV file
     """
-    response = HttpResponse(content_type="text/csv")
-    response["Content-Disposition"] = 'attachment; filename="emails.csv"'
-
-    writer = csv.writer(response)
-    for instance in queryset:
-        writer.writerow([instance.email])
-
-    return response
+    rows = queryset.values_list("email").iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    return stream_csv("emails.csv", rows)
 
 def fix_email_casing(_modeladmin, _request: HttpRequest, queryset: QuerySet) -> None:
     """
@@ -0,0 +1,53 @@
+# Generated by Django 2.2.13 on 2026-10-18 06:55
+
+from django.db import migrations
+from django.db.models import Count, F
+from django.db.models.functions import Upper
+
+# Django 2.2 can't express indexes on expressions, so this one is created by hand. Both PostgreSQL and SQLite support
+# it; `UPPER(email)` matches what PostgreSQL's `email__iexact` lookups compare.
+FORWARD = "CREATE UNIQUE INDEX user_user_email_upper ON user_user (UPPER(email))"
+BACKWARD = "DROP INDEX IF EXISTS user_user_email_upper"
+
+
+def rename_duplicate_emails(apps, schema_editor):
+    """
+    Of the users whose emails only differ in case, the one who logged in most recently (or, failing that, signed up
+    first) keeps the email. The others get "+duplicate<pk>" added to theirs, so they can be told apart and merged by
+    hand if need be.
+    """
+    User = apps.get_model("user", "User")
+    duplicates = (
+        User.objects.annotate(upper_email=Upper("email"))
+        .values_list("upper_email", flat=True)
+        .annotate(count=Count("pk"))
+        .filter(count__gt=1)
+        .order_by()
+    )
+    for upper_email in list(duplicates):
+        users = User.objects.annotate(upper_email=Upper("email")).filter(upper_email=upper_email)
+        ordered = users.order_by(F("last_login").desc(nulls_last=True), "date_joined", "pk")
+        for user in list(ordered)[1:]:
+            local, _, domain = user.email.rpartition("@")
+            user.email = "%s+duplicate%s@%s" % (local, user.pk, domain)
+            user.save(update_fields=["email"])
+
+
+def run_for_vendors(statement):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor in ("postgresql", "sqlite"):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_emails, migrations.RunPython.noop),
+        migrations.RunPython(run_for_vendors(FORWARD), run_for_vendors(BACKWARD)),
+    ]
@@ -45,7 +45,7 @@ class User(auth_models.AbstractUser):
 
     objects = EmailUserManager()
 
-    # Set email to the primary lookup field
+    # Set email to the primary lookup field. Emails are also unique regardless of case (see migration 0002).
     email = models.EmailField(unique=True, null=False, blank=False)
     is_active = models.BooleanField(
         "active",
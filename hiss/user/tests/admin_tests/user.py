@@ -17,3 +17,16 @@ class UserAdminTestCase(test_case.SharedTestCase):
             follow=True,
         )
         self.assertEqual(response.status_code, 200)
+
+    def test_export_user_emails_streams_selected_emails(self):
+        self.client.force_login(self.admin)
+        change_url = reverse_lazy("admin:user_user_changelist")
+        response = self.client.post(
+            change_url,
+            {
+                "action": "export_user_emails",
+                admin.ACTION_CHECKBOX_NAME: [self.user.pk, self.user2.pk],
+            },
+        )
+        content = b"".join(response.streaming_content).decode()
+        self.assertCountEqual(content.split(), [self.email, self.email2])
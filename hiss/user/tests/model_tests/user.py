@@ -1,3 +1,4 @@
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
 from user.models import User
@@ -15,3 +16,9 @@ class UserTestCase(TestCase):
     def test_user_is_inactive_by_default(self):
         User.objects.create_user(self.email, self.password)
         self.assertFalse(User.objects.get(email=self.email).is_active)
+
+    def test_email_is_unique_regardless_of_case(self):
+        User.objects.create_user(self.email, self.password)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(self.email.upper(), self.password)
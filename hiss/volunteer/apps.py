@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class VolunteerConfig(AppConfig):
     name = "volunteer"
+
+    def ready(self):
+        # Registers the signal receivers that keep the authentication cache up to date.
+        from volunteer import authentication  # noqa: F401 pylint: disable=W0611,C0415
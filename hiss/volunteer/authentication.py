@@ -0,0 +1,126 @@
+"""
+Cached authentication for the volunteer API. Scanners make many small requests, and looking up the request's token
+and the user's groups would otherwise cost two queries per request. Both are kept in each process's memory for
+`settings.VOLUNTEER_AUTH_CACHE_TTL` seconds, and entries are dropped as soon as the token, the user, or their groups
+change in this process.
+"""
+
+import copy
+import threading
+import time
+from typing import Dict, FrozenSet, Hashable, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+class LocalTTLCache:
+    """
+    A minimal thread-safe, process-local cache whose entries expire after `settings.VOLUNTEER_AUTH_CACHE_TTL`
+    seconds.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Hashable, Tuple[float, object]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[object]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + settings.VOLUNTEER_AUTH_CACHE_TTL,
+                value,
+            )
+
+    def delete_where(self, predicate) -> None:
+        with self._lock:
+            for key in [k for k, (_, v) in self._entries.items() if predicate(k, v)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_tokens = LocalTTLCache()
+_groups = LocalTTLCache()
+
+
+def clear_auth_cache() -> None:
+    _tokens.clear()
+    _groups.clear()
+
+
+def group_names(user) -> FrozenSet[str]:
+    """
+    Returns the names of the groups `user` belongs to.
+    """
+    if not user.is_authenticated:
+        return frozenset()
+    names = _groups.get(user.pk)
+    if names is None:
+        names = frozenset(user.groups.values_list("name", flat=True))
+        _groups.set(user.pk, names)
+    return names
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Django Rest Framework's `TokenAuthentication`, except that tokens (and their users) are cached in memory.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = _tokens.get(key)
+        if cached is None:
+            cached = super().authenticate_credentials(key)
+            _tokens.set(key, cached)
+        user, token = cached
+        # Each request gets its own copy, so changes to `request.user` don't leak into the cache.
+        return copy.copy(user), token
+
+
+def _forget_user(user_pk) -> None:
+    _tokens.delete_where(lambda _key, value: value[0].pk == user_pk)
+    _groups.delete_where(lambda key, _value: key == user_pk)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token(instance: Token, **_kwargs) -> None:
+    _tokens.delete_where(lambda key, _value: key == instance.key)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_user(instance, **_kwargs) -> None:
+    _forget_user(instance.pk)
+
+
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+def invalidate_user_groups(instance, action: str, reverse: bool, pk_set, **_kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        _forget_user(instance.pk)
+    elif pk_set is None:
+        # A group was cleared of all of its users.
+        _groups.clear()
+    else:
+        for user_pk in pk_set:
+            _forget_user(user_pk)
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def invalidate_groups(**_kwargs) -> None:
+    _groups.clear()
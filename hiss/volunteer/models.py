@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 from application.models import DietaryRestriction
 
@@ -17,6 +18,8 @@ MEAL_CHOICES = [
     (BREAKFAST_2, "Breakfast (Day 2)"),
     (LUNCH_2, "Lunch (Day 2)"),
 ]
+# The names used for meals in the volunteer app's user summary, for meals whose name isn't just their slugified label.
+MEAL_SUMMARY_NAMES = {BREAKFAST_2: "breakfast_2", LUNCH_2: "lunch_2"}
 
 
 class Event(models.Model):
@@ -28,7 +31,10 @@ class Event(models.Model):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(default=timezone.now)
+    # Generated by the scanner that recorded the event, so that events which are synced more than once (see
+    # `volunteer.sync`) are only recorded once.
+    client_id = models.UUIDField(null=True, blank=True, unique=True, editable=False)
 
     class Meta:
         abstract = True
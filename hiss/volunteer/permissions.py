@@ -1,17 +1,15 @@
-from django.contrib.auth.models import Group
 from rest_framework import permissions
 
+from volunteer.authentication import group_names
+
 
 class IsVolunteer(permissions.BasePermission):
     """
-    Ensures that the provided user is a volunteer by asserting that they are a member of a Group named "volunteer"
+    Ensures that the provided user is a volunteer by asserting that they are a member of a Group named "volunteer".
+    Group memberships are cached (see `volunteer.authentication.group_names`).
     """
 
     group_name = "volunteer"
 
     def has_permission(self, request, view):
-        try:
-            request.user.groups.get(name=self.group_name)
-            return True
-        except Group.DoesNotExist:
-            return False
+        return self.group_name in group_names(request.user)
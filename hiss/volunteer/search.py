@@ -0,0 +1,50 @@
+"""
+Hacker search for the volunteer app. Every `Application` keeps a normalized `search_document` ("<first name> <last
+name> <email>"), so a search is a handful of `LIKE` filters against a single column (backed by a trigram GIN index on
+PostgreSQL) instead of concatenating names for every row.
+"""
+
+from typing import Dict, List
+
+from django.db.models import Case, F, IntegerField, Value, When
+
+from application.models import Application, normalize_search_text
+
+SEARCH_RESULT_LIMIT = 25
+"""The default number of results returned by a search."""
+
+MAX_SEARCH_RESULT_LIMIT = 100
+"""The largest number of results a single search may ask for."""
+
+RANK_NAME_PREFIX = 0
+RANK_EMAIL_PREFIX = 1
+RANK_WORD_PREFIX = 2
+RANK_SUBSTRING = 3
+
+
+def search_applications(query: str, limit: int = SEARCH_RESULT_LIMIT) -> List[Dict]:
+    """
+    Finds the applications whose name or email contains every word of `query`, ignoring case and accents. Results
+    are ranked: matches on the start of the full name come first, followed by matches on the start of the email,
+    matches on the start of any word, and finally matches anywhere.
+    """
+    terms = normalize_search_text(query).split()
+    if not terms:
+        return []
+    phrase = " ".join(terms)
+
+    applications = Application.objects.all()
+    for term in terms:
+        applications = applications.filter(search_document__contains=term)
+    rank = Case(
+        When(search_document__startswith=phrase, then=Value(RANK_NAME_PREFIX)),
+        When(user__email__istartswith=query.strip(), then=Value(RANK_EMAIL_PREFIX)),
+        When(search_document__contains=" " + terms[0], then=Value(RANK_WORD_PREFIX)),
+        default=Value(RANK_SUBSTRING),
+        output_field=IntegerField(),
+    )
+    return list(
+        applications.annotate(rank=rank)
+        .order_by("rank", "last_name", "first_name")
+        .values("first_name", "last_name", email=F("user__email"))[:limit]
+    )
@@ -0,0 +1,189 @@
+"""
+Batched syncing of scan events recorded by volunteer scanners. Scanners queue check-ins, meals, and workshop
+attendance locally (the venue's Wi-Fi is unreliable) and flush them in a single request. Every event carries an id
+generated by the scanner, so flushing the same events more than once records them only once.
+"""
+
+import uuid
+from typing import Dict, List, Optional
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from application import stats
+from application.badges import verify_badge_token
+from application.models import Application, DietaryRestriction, STATUS_CHECKED_IN
+from volunteer.models import FoodEvent, WorkshopEvent, MEAL_CHOICES
+
+MAX_SYNC_BATCH_SIZE = 500
+"""The largest number of events accepted in a single sync."""
+
+EVENT_CHECKIN = "checkin"
+EVENT_FOOD = "food"
+EVENT_WORKSHOP = "workshop"
+EVENT_TYPES = {EVENT_CHECKIN, EVENT_FOOD, EVENT_WORKSHOP}
+
+RESULT_OK = "ok"
+RESULT_DUPLICATE = "duplicate"
+RESULT_INVALID = "invalid"
+RESULT_NOT_FOUND = "not_found"
+RESULT_NOT_CHECKED_IN = "not_checked_in"
+
+MEALS = {meal for meal, _label in MEAL_CHOICES}
+
+
+class ScanEvent:
+    """
+    A single validated event from a sync request.
+    """
+
+    def __init__(self, data: Dict):
+        self.id = uuid.UUID(str(data["id"]))
+        self.type = data["type"]
+        badge = data.get("badge")
+        # Events identify the hacker by their badge token or, failing that, their email.
+        self.hacker = verify_badge_token(badge) if badge else data.get("email")
+        self.meal = data.get("meal")
+        self.restrictions = [int(pk) for pk in data.get("restrictions") or []]
+        timestamp = data.get("timestamp")
+        self.timestamp = parse_datetime(timestamp) if timestamp else timezone.now()
+        if self.timestamp is None:
+            raise ValueError("Invalid timestamp")
+        if timezone.is_naive(self.timestamp):
+            self.timestamp = timezone.make_aware(self.timestamp)
+        if self.type not in EVENT_TYPES or not self.hacker:
+            raise ValueError("Invalid event")
+        if self.type == EVENT_FOOD and self.meal not in MEALS:
+            raise ValueError("Invalid meal")
+
+
+def _parse(data) -> Optional[ScanEvent]:
+    try:
+        return ScanEvent(data)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
+def _event_id(data) -> Optional[str]:
+    return data.get("id") if isinstance(data, dict) else None
+
+
+def sync_events(events: List[Dict]) -> List[Dict]:
+    """
+    Records a batch of scan events and returns a result for each one, in order. Each result has the event's "id" and
+    a "result" of "ok", "duplicate" (the event was already synced), "invalid" (the event is malformed, has an invalid
+    badge, or refers to an unknown dietary restriction), "not_found" (no application exists for the hacker), or
+    "not_checked_in" (a meal or workshop for a hacker that hasn't checked in).
+
+    Events identify the hacker by their "badge" token (see `shared.badge_tokens`) or their "email". All of the
+    hackers in the batch are resolved with a single query, check-ins are applied with one update, and meals and
+    workshops are inserted with `bulk_create`.
+    """
+    parsed = [_parse(data) for data in events]
+    results: List[Optional[str]] = [
+        None if event else RESULT_INVALID for event in parsed
+    ]
+
+    seen = set()
+    for i, event in enumerate(parsed):
+        if event is None:
+            continue
+        if event.id in seen:
+            results[i] = RESULT_DUPLICATE
+        seen.add(event.id)
+
+    with transaction.atomic():
+        already_synced = set(
+            FoodEvent.objects.filter(client_id__in=seen).values_list(
+                "client_id", flat=True
+            )
+        ) | set(
+            WorkshopEvent.objects.filter(client_id__in=seen).values_list(
+                "client_id", flat=True
+            )
+        )
+        hackers = {event.hacker for event in parsed if event}
+        emails = {hacker for hacker in hackers if isinstance(hacker, str)}
+        application_pks, user_ids, statuses = {}, {}, {}
+        for pk, email, user_id, application_status in Application.objects.filter(
+            Q(user__email__in=emails) | Q(pk__in=hackers - emails)
+        ).values_list("pk", "user__email", "user_id", "status"):
+            application_pks[pk] = application_pks[email] = pk
+            user_ids[pk] = user_id
+            statuses[pk] = application_status
+        restriction_pks = {pk for event in parsed if event for pk in event.restrictions}
+        known_restrictions = set(
+            DietaryRestriction.objects.filter(pk__in=restriction_pks).values_list(
+                "pk", flat=True
+            )
+        )
+
+        checked_in_pks = set()
+        food_events, workshop_events = [], []
+        restrictions_by_event = {}
+        for i, event in sorted(
+            ((i, event) for i, event in enumerate(parsed) if results[i] is None),
+            key=lambda pair: pair[1].timestamp,
+        ):
+            pk = application_pks.get(event.hacker)
+            if event.id in already_synced:
+                results[i] = RESULT_DUPLICATE
+            elif pk is None:
+                results[i] = RESULT_NOT_FOUND
+            elif event.type == EVENT_CHECKIN:
+                statuses[pk] = STATUS_CHECKED_IN
+                checked_in_pks.add(pk)
+                results[i] = RESULT_OK
+            elif statuses[pk] != STATUS_CHECKED_IN:
+                results[i] = RESULT_NOT_CHECKED_IN
+            elif event.type == EVENT_FOOD:
+                if not known_restrictions.issuperset(event.restrictions):
+                    results[i] = RESULT_INVALID
+                    continue
+                food_events.append(
+                    FoodEvent(
+                        user_id=user_ids[pk],
+                        meal=event.meal,
+                        timestamp=event.timestamp,
+                        client_id=event.id,
+                    )
+                )
+                restrictions_by_event[event.id] = event.restrictions
+                results[i] = RESULT_OK
+            else:
+                workshop_events.append(
+                    WorkshopEvent(
+                        user_id=user_ids[pk],
+                        timestamp=event.timestamp,
+                        client_id=event.id,
+                    )
+                )
+                results[i] = RESULT_OK
+
+        if checked_in_pks:
+            stats.update_status(
+                Application.objects.filter(pk__in=checked_in_pks), STATUS_CHECKED_IN
+            )
+        # Conflicts are ignored in case another request synced the same events concurrently.
+        FoodEvent.objects.bulk_create(food_events, ignore_conflicts=True)
+        WorkshopEvent.objects.bulk_create(workshop_events, ignore_conflicts=True)
+        if restrictions_by_event:
+            Through = FoodEvent.restrictions.through
+            food_event_pks = FoodEvent.objects.filter(
+                client_id__in=restrictions_by_event
+            ).values_list("client_id", "pk")
+            Through.objects.bulk_create(
+                [
+                    Through(foodevent_id=pk, dietaryrestriction_id=restriction)
+                    for client_id, pk in food_event_pks
+                    for restriction in restrictions_by_event[client_id]
+                ],
+                ignore_conflicts=True,
+            )
+
+    return [
+        {"id": _event_id(data), "result": result}
+        for data, result in zip(events, results)
+    ]
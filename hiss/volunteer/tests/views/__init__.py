@@ -5,3 +5,5 @@ from .create_workshop_event import *
 from .search import *
 from .user_summary import *
 from .list_dietary_restrictions import *
+from .sync_events import *
+from .cached_authentication import *
@@ -0,0 +1,48 @@
+from django.urls import reverse_lazy
+from rest_framework.authtoken.models import Token
+
+from volunteer.tests.test_case import TokenAuthTestCase
+
+
+class CachedAuthenticationTestCase(TokenAuthTestCase):
+    def get_restrictions(self, token):
+        return self.client.get(
+            reverse_lazy("volunteer:list-dietary-restrictions"),
+            HTTP_AUTHORIZATION=token,
+        )
+
+    def test_warm_cache_needs_no_auth_queries(self):
+        token = self.get_volunteer_token()
+        self.get_restrictions(token)
+
+        # Only the dietary restrictions themselves are queried.
+        with self.assertNumQueries(1):
+            response = self.get_restrictions(token)
+        self.assertEqual(response.status_code, 200)
+
+    def test_deleted_token_is_rejected(self):
+        token = self.get_volunteer_token()
+        self.assertEqual(self.get_restrictions(token).status_code, 200)
+
+        Token.objects.filter(user=self.volunteer).delete()
+
+        self.assertEqual(self.get_restrictions(token).status_code, 401)
+
+    def test_removing_volunteer_group_revokes_access(self):
+        token = self.get_volunteer_token()
+        self.assertEqual(self.get_restrictions(token).status_code, 200)
+
+        self.volunteer.groups.remove(self.volunteer_group)
+        self.assertEqual(self.get_restrictions(token).status_code, 403)
+
+        self.volunteer_group.user_set.add(self.volunteer)
+        self.assertEqual(self.get_restrictions(token).status_code, 200)
+
+    def test_deactivated_user_is_rejected(self):
+        token = self.get_volunteer_token()
+        self.assertEqual(self.get_restrictions(token).status_code, 200)
+
+        self.volunteer.is_active = False
+        self.volunteer.save()
+
+        self.assertEqual(self.get_restrictions(token).status_code, 401)
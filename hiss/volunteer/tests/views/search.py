@@ -3,6 +3,7 @@ import json
 from django.urls import reverse
 
 from application.models import Application
+from user.models import User
 from volunteer.tests.test_case import TokenAuthTestCase
 
 
@@ -56,3 +57,83 @@ class UserSearchViewTestCase(TokenAuthTestCase):
         )
         json_data = json.loads(response.content)
         self.assertEqual(len(json_data["results"]), 1)
+
+    def search(self, query, **params):
+        token = self.get_volunteer_token()
+        response = self.client.get(
+            reverse("volunteer:search"),
+            {"q": query, **params},
+            HTTP_AUTHORIZATION=token,
+        )
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)["results"]
+
+    def create_named_application(self, first_name, last_name, email):
+        user = User.objects.create_user(email=email, password=self.password)
+        return Application.objects.create(
+            **{
+                **self.application_fields,
+                "user": user,
+                "first_name": first_name,
+                "last_name": last_name,
+            },
+            wave=self.wave1,
+        )
+
+    def test_matches_full_name(self):
+        self.create_active_wave()
+        self.create_application()
+        results = self.search(f"{self.first_name} {self.last_name}")
+        self.assertEqual(
+            results,
+            [
+                {
+                    "first_name": self.first_name,
+                    "last_name": self.last_name,
+                    "email": self.email,
+                }
+            ],
+        )
+
+    def test_ignores_accents(self):
+        self.create_active_wave()
+        self.create_named_application("Jos\u00e9", "N\u00fa\u00f1ez", "jose@email.com")
+        results = self.search("jose nunez")
+        self.assertEqual([r["email"] for r in results], ["jose@email.com"])
+
+    def test_matches_email_prefix(self):
+        self.create_active_wave()
+        self.create_application()
+        results = self.search(self.email[:5].upper())
+        self.assertEqual([r["email"] for r in results], [self.email])
+
+    def test_ranks_prefix_matches_first(self):
+        self.create_active_wave()
+        self.create_named_application("Ann", "Zed", "zed@email.com")
+        self.create_named_application("Joanna", "Abel", "abel@email.com")
+        self.create_named_application("Bob", "Annis", "bob@email.com")
+        self.create_named_application("Carl", "Bright", "annie@email.com")
+        results = self.search("ann")
+        self.assertEqual(
+            [r["email"] for r in results],
+            ["zed@email.com", "annie@email.com", "bob@email.com", "abel@email.com"],
+        )
+
+    def test_limits_results(self):
+        self.create_active_wave()
+        for i in range(5):
+            self.create_named_application("Sam", "Smith", f"sam{i}@email.com")
+        self.assertEqual(len(self.search("sam", limit=3)), 3)
+        self.assertEqual(len(self.search("sam")), 5)
+
+    def test_empty_query_returns_no_results(self):
+        self.create_active_wave()
+        self.create_application()
+        self.assertEqual(self.search(" "), [])
+
+    def test_tracks_email_changes(self):
+        self.create_active_wave()
+        self.create_application()
+        self.user.email = "renamed@email.com"
+        self.user.save()
+        self.assertEqual(self.search("renamed")[0]["email"], "renamed@email.com")
@@ -0,0 +1,142 @@
+import uuid
+
+from django.urls import reverse_lazy
+from django.utils import timezone
+
+from application.badges import badge_token
+from application.models import STATUS_CHECKED_IN, Application, DietaryRestriction
+from volunteer.models import FoodEvent, WorkshopEvent, BREAKFAST
+from volunteer.tests.test_case import TokenAuthTestCase
+
+
+class SyncEventsViewTestCase(TokenAuthTestCase):
+    def setUp(self):
+        super().setUp()
+        self.dietary_restriction = DietaryRestriction.objects.create(name="dummy")
+        self.create_active_wave()
+        self.application = Application.objects.create(
+            **self.application_fields, wave=self.wave1
+        )
+
+    def event(self, event_type, email=None, **fields):
+        return {
+            "id": str(uuid.uuid4()),
+            "type": event_type,
+            "email": email or self.email,
+            **fields,
+        }
+
+    def sync(self, events, token=None):
+        return self.client.post(
+            reverse_lazy("volunteer:sync"),
+            data={"events": events},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=token or self.get_volunteer_token(),
+        )
+
+    def results(self, events):
+        response = self.sync(events)
+        self.assertEqual(response.status_code, 200)
+        return [result["result"] for result in response.json()["results"]]
+
+    def test_post_fails_for_regular_user(self):
+        response = self.sync(
+            [self.event("checkin")], token=self.get_token(self.email, self.password)
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_post_fails_without_events(self):
+        response = self.client.post(
+            reverse_lazy("volunteer:sync"),
+            data={},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=self.get_volunteer_token(),
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_records_checkin_then_meal_and_workshop(self):
+        timestamp = timezone.now() - timezone.timedelta(hours=2)
+        events = [
+            self.event(
+                "food",
+                meal=BREAKFAST,
+                restrictions=[self.dietary_restriction.pk],
+                timestamp=timestamp.isoformat(),
+            ),
+            self.event(
+                "checkin",
+                timestamp=(timestamp - timezone.timedelta(minutes=5)).isoformat(),
+            ),
+            self.event("workshop"),
+        ]
+
+        self.assertEqual(self.results(events), ["ok", "ok", "ok"])
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, STATUS_CHECKED_IN)
+        food_event = FoodEvent.objects.get(user=self.user)
+        self.assertEqual(food_event.timestamp, timestamp)
+        self.assertEqual(str(food_event.client_id), events[0]["id"])
+        self.assertEqual(
+            list(food_event.restrictions.all()), [self.dietary_restriction]
+        )
+        self.assertTrue(WorkshopEvent.objects.filter(user=self.user).exists())
+
+    def test_resyncing_records_events_once(self):
+        events = [self.event("checkin"), self.event("food", meal=BREAKFAST)]
+        self.assertEqual(self.results(events), ["ok", "ok"])
+        self.assertEqual(
+            self.results(events + events[1:]), ["ok", "duplicate", "duplicate"]
+        )
+        self.assertEqual(FoodEvent.objects.filter(user=self.user).count(), 1)
+
+    def test_reports_invalid_and_unknown_events(self):
+        events = [
+            self.event("workshop"),
+            self.event("workshop", email="nobody@email.com"),
+            self.event("food", meal="not a meal"),
+            {"type": "checkin", "email": self.email},
+            self.event("checkin"),
+            self.event("food", meal=BREAKFAST, restrictions=[12345]),
+        ]
+        self.assertEqual(
+            self.results(events),
+            ["not_checked_in", "not_found", "invalid", "invalid", "ok", "invalid"],
+        )
+        self.assertFalse(FoodEvent.objects.exists())
+
+    def test_resolves_batch_in_constant_queries(self):
+        token = self.get_volunteer_token()
+        self.application.status = STATUS_CHECKED_IN
+        self.application.save()
+        events = [
+            self.event(
+                "food", meal=BREAKFAST, restrictions=[self.dietary_restriction.pk]
+            )
+            for _ in range(20)
+        ] + [self.event("workshop") for _ in range(20)]
+
+        # Two queries authenticate the volunteer, then: existing food and workshop ids, applications,
+        # restrictions, savepoint, two inserts, food event ids, restriction rows, and releasing the savepoint.
+        with self.assertNumQueries(12):
+            response = self.sync(events, token=token)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(FoodEvent.objects.count(), 20)
+        self.assertEqual(WorkshopEvent.objects.count(), 20)
+
+    def test_identifies_hackers_by_badge(self):
+        events = [
+            {
+                "id": str(uuid.uuid4()),
+                "type": "checkin",
+                "badge": badge_token(self.application.pk),
+            },
+            {
+                "id": str(uuid.uuid4()),
+                "type": "workshop",
+                "badge": badge_token(uuid.uuid4()),
+            },
+            {"id": str(uuid.uuid4()), "type": "workshop", "badge": "GARBLED"},
+        ]
+        self.assertEqual(self.results(events), ["ok", "not_found", "invalid"])
+        self.application.refresh_from_db()
+        self.assertEqual(self.application.status, STATUS_CHECKED_IN)
@@ -1,5 +1,6 @@
 from django.urls import reverse_lazy
 
+from application.badges import badge_token
 from application.models import Application, STATUS_CHECKED_IN
 from volunteer.tests.test_case import TokenAuthTestCase
 
@@ -52,3 +53,36 @@ class CheckinUserViewTestCase(TokenAuthTestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(app.status, STATUS_CHECKED_IN)
+
+    def test_post_succeeds_with_badge(self):
+        self.create_active_wave()
+        app = Application.objects.create(**self.application_fields, wave=self.wave1)
+        volunteer_token = self.get_volunteer_token()
+
+        response = self.client.post(
+            reverse_lazy("volunteer:user-checkin"),
+            data={"badge": badge_token(app.pk)},
+            HTTP_AUTHORIZATION=volunteer_token,
+        )
+        app.refresh_from_db()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(app.status, STATUS_CHECKED_IN)
+
+    def test_post_fails_with_forged_badge(self):
+        self.create_active_wave()
+        app = Application.objects.create(**self.application_fields, wave=self.wave1)
+        volunteer_token = self.get_volunteer_token()
+        token = badge_token(app.pk)
+        # The last character also holds padding bits, so change one in the middle of the signature.
+        forged = token[:-2] + ("A" if token[-2] != "A" else "B") + token[-1]
+
+        response = self.client.post(
+            reverse_lazy("volunteer:user-checkin"),
+            data={"badge": forged},
+            HTTP_AUTHORIZATION=volunteer_token,
+        )
+        app.refresh_from_db()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertNotEqual(app.status, STATUS_CHECKED_IN)
@@ -1,7 +1,8 @@
 from django.urls import reverse_lazy
 from django.utils.http import urlencode
 
-from application.models import Application
+from application.models import Application, DietaryRestriction, STATUS_CHECKED_IN
+from volunteer.models import FoodEvent, WorkshopEvent, BREAKFAST, LUNCH_2
 from volunteer.tests.test_case import TokenAuthTestCase
 
 
@@ -53,7 +54,7 @@ class UserSummaryViewTestCase(TokenAuthTestCase):
                 "num_workshops": 0,
                 "checked_in": False,
                 "status": app.status,
-                "restrictions": [r.name for r in app.dietary_restrictions.all()],
+                "restrictions": [],
             },
         )
 
@@ -80,6 +81,45 @@ class UserSummaryViewTestCase(TokenAuthTestCase):
                 "num_workshops": 0,
                 "checked_in": False,
                 "status": app.status,
-                "restrictions": [r.name for r in app.dietary_restrictions.all()],
+                "restrictions": [],
+            },
+        )
+
+    def test_counts_events_and_restrictions(self):
+        self.create_active_wave()
+        Application.objects.create(
+            **self.application_fields, wave=self.wave1, status=STATUS_CHECKED_IN
+        )
+        vegan = DietaryRestriction.objects.create(name="Vegan")
+        DietaryRestriction.objects.create(name="Kosher")
+        for meal in [BREAKFAST, BREAKFAST, LUNCH_2]:
+            FoodEvent.objects.create(user=self.user, meal=meal).restrictions.set(
+                [vegan]
+            )
+        FoodEvent.objects.create(user=self.user2, meal=BREAKFAST)
+        WorkshopEvent.objects.create(user=self.user)
+        volunteer_token = self.get_volunteer_token()
+
+        with self.assertNumQueries(4):
+            # Two queries authenticate the volunteer's token and check their groups.
+            response = self.client.get(
+                f"{reverse_lazy('volunteer:summary')}?{urlencode(self.data_dict)}",
+                HTTP_AUTHORIZATION=volunteer_token,
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertJSONEqual(
+            response.content,
+            {
+                "num_breakfast": 2,
+                "num_lunch": 0,
+                "num_dinner": 0,
+                "num_midnight_snack": 0,
+                "num_breakfast_2": 0,
+                "num_lunch_2": 1,
+                "num_workshops": 1,
+                "checked_in": True,
+                "status": STATUS_CHECKED_IN,
+                "restrictions": ["Vegan"],
             },
         )
@@ -13,6 +13,7 @@ urlpatterns = [
     ),
     path("food", views.CreateFoodEventView.as_view(), name="food"),
     path("workshops", views.CreateWorkshopEventView.as_view(), name="workshops"),
+    path("sync", views.SyncEventsView.as_view(), name="sync"),
     path("search", views.SearchView.as_view(), name="search"),
     path("summary", views.UserSummaryView.as_view(), name="summary"),
 ]
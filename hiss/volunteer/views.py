@@ -1,31 +1,56 @@
-from django.contrib.auth import get_user_model
-from django.db.models import Value, F
-from django.db.models.functions import Concat
+from typing import Dict, Optional
+
+from django.db.models import Count, Q
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
-from rest_framework import status, response, permissions, authentication
+from django.utils.text import slugify
+from rest_framework import status, response, permissions
 from rest_framework.authtoken import views
 from rest_framework.request import Request
 
+from application.badges import verify_badge_token
 from application.models import Application, STATUS_CHECKED_IN, DietaryRestriction
-from volunteer.models import (
-    FoodEvent,
-    WorkshopEvent,
-    BREAKFAST,
-    LUNCH,
-    DINNER,
-    MIDNIGHT_SNACK,
-    BREAKFAST_2,
-    LUNCH_2,
-)
+from shared.badge_tokens import InvalidBadgeToken
+from volunteer.authentication import CachedTokenAuthentication
+from volunteer.models import FoodEvent, WorkshopEvent, MEAL_CHOICES, MEAL_SUMMARY_NAMES
 from volunteer.permissions import IsVolunteer
+from volunteer.search import (
+    MAX_SEARCH_RESULT_LIMIT,
+    SEARCH_RESULT_LIMIT,
+    search_applications,
+)
 from volunteer.serializers import EmailAuthTokenSerializer
+from volunteer.sync import MAX_SYNC_BATCH_SIZE, sync_events
 
 USER_NOT_CHECKED_IN_MSG = (
     "This hacker has not been checked in. Please find an organizer immediately."
 )
 
 
+def meal_summary_key(meal: str, label: str) -> str:
+    """
+    Returns the key under which a meal's count is reported by `UserSummaryView` (e.g. "num_midnight_snack").
+    """
+    return "num_" + MEAL_SUMMARY_NAMES.get(meal, slugify(label).replace("-", "_"))
+
+
+def hacker_lookup(params) -> Optional[Dict]:
+    """
+    Returns the lookup for the application identified by a request's parameters: its "badge" token (a primary key
+    lookup), or else the hacker's "email". Returns None if neither is given, or if the badge token isn't valid.
+    """
+    badge = params.get("badge", None)
+    if badge:
+        try:
+            return {"pk": verify_badge_token(badge)}
+        except InvalidBadgeToken:
+            return None
+    user_email = params.get("email", None)
+    if user_email:
+        return {"user__email": user_email}
+    return None
+
+
 class EmailObtainAuthToken(views.ObtainAuthToken):
     """
     Given a request containing a user's "email" and "password", this view responds with the user's Token (which can
@@ -42,22 +67,21 @@ class CheckinHackerView(views.APIView):
     permission_classes = [
         permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
     ]
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def post(self, request: Request, format: str = None):
         """
         Sets a specific user's Application status as STATUS_CHECKED_IN (indicating that a user has successfully
-        checked into the event). If the request is malformed (i.e. missing the user's email), returns a Django Rest
-        Framework Response with a 400 status code. if successful, returns a response with status 200.
+        checked into the event). The hacker is identified by their "badge" token or their "email" (see
+        `hacker_lookup`). If the request is malformed (i.e. missing both, or with an invalid badge), returns a Django
+        Rest Framework Response with a 400 status code. if successful, returns a response with status 200.
         """
-        user_email = request.data.get("email", None)
-        if not user_email:
-            # The hacker's email was not provided in the request body, we can't do anything.
+        lookup = hacker_lookup(request.data)
+        if not lookup:
+            # The hacker wasn't identified in the request body, we can't do anything.
             return response.Response(status=status.HTTP_400_BAD_REQUEST)
         # Return 404 if no application exists for the provided user.
-        application: Application = get_object_or_404(
-            Application, user__email=user_email
-        )
+        application: Application = get_object_or_404(Application, **lookup)
         application.status = STATUS_CHECKED_IN
         application.save()
         return response.Response(status=status.HTTP_200_OK)
@@ -71,7 +95,7 @@ class ListDietaryRestrictionsView(views.APIView):
     permission_classes = [
         permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
     ]
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def get(self, request: Request):
         return JsonResponse(
@@ -88,25 +112,23 @@ class CreateFoodEventView(views.APIView):
     permission_classes = [
         permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
     ]
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def post(self, request: Request, format: str = None):
         """
         Creates a new FoodEvent (indicating that a user has taken food for this meal). If the request is malformed (
-        i.e. missing the user's email, meal type, or restrictions), returns a Django Rest Framework Response with a
-        400 status code. if successful, returns a response with status 200.
+        i.e. missing the user's badge or email, meal type, or restrictions), returns a Django Rest Framework Response
+        with a 400 status code. if successful, returns a response with status 200.
         """
-        user_email = request.data.get("email", None)
+        lookup = hacker_lookup(request.data)
         meal = request.data.get("meal", None)
         restrictions = request.data.get("restrictions", None)
 
         # Ensure that all required parameters are present
-        if not (user_email and meal and restrictions):
+        if not (lookup and meal and restrictions):
             return response.Response(status=status.HTTP_400_BAD_REQUEST)
 
-        application: Application = get_object_or_404(
-            Application, user__email=user_email
-        )
+        application: Application = get_object_or_404(Application, **lookup)
 
         # Ensure that user has checked in
         if not application.status == STATUS_CHECKED_IN:
@@ -115,7 +137,7 @@ class CreateFoodEventView(views.APIView):
                 status=status.HTTP_412_PRECONDITION_FAILED,
             )
 
-        food_event = FoodEvent.objects.create(user=application.user, meal=meal)
+        food_event = FoodEvent.objects.create(user_id=application.user_id, meal=meal)
         food_event.restrictions.set(restrictions)
         food_event.save()
         return response.Response(status=status.HTTP_200_OK)
@@ -125,23 +147,21 @@ class CreateWorkshopEventView(views.APIView):
     permission_classes = [
         permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
     ]
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def post(self, request: Request, format: str = None):
         """
         Creates a new WorkshopEvent (indicating that a user has attended a workshop). If the request is malformed (
-        i.e. missing the user's email), returns a Django Rest Framework Response with a 400 status code. if
+        i.e. missing the user's badge or email), returns a Django Rest Framework Response with a 400 status code. if
         successful, returns a response with status 200.
         """
-        user_email = request.data.get("email", None)
+        lookup = hacker_lookup(request.data)
 
         # Ensure that all required parameters are present
-        if not user_email:
+        if not lookup:
             return response.Response(status=status.HTTP_400_BAD_REQUEST)
 
-        application: Application = get_object_or_404(
-            Application, user__email=user_email
-        )
+        application: Application = get_object_or_404(Application, **lookup)
 
         # Ensure that user has checked in
         if not application.status == STATUS_CHECKED_IN:
@@ -150,69 +170,99 @@ class CreateWorkshopEventView(views.APIView):
                 status=status.HTTP_412_PRECONDITION_FAILED,
             )
 
-        WorkshopEvent.objects.create(user=application.user)
+        WorkshopEvent.objects.create(user_id=application.user_id)
         return response.Response(status=status.HTTP_200_OK)
 
 
+class SyncEventsView(views.APIView):
+    permission_classes = [
+        permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
+    ]
+    authentication_classes = [CachedTokenAuthentication]
+
+    def post(self, request: Request, format: str = None):
+        """
+        Records a batch of scan events queued by a scanner (see `volunteer.sync.sync_events`). The request body must
+        contain a list of "events", each with a scanner-generated "id", a "type" ("checkin", "food", or "workshop"),
+        the hacker's "email", an optional ISO 8601 "timestamp", and, for meals, the "meal" and "restrictions". If the
+        request is malformed, returns a Django Rest Framework Response with a 400 status code. Otherwise, returns a
+        response with status 200 containing the result of every event.
+        """
+        events = (
+            request.data.get("events", None) if isinstance(request.data, dict) else None
+        )
+        if not isinstance(events, list) or len(events) > MAX_SYNC_BATCH_SIZE:
+            return response.Response(status=status.HTTP_400_BAD_REQUEST)
+        return response.Response(
+            {"results": sync_events(events)}, status=status.HTTP_200_OK
+        )
+
+
 class SearchView(views.APIView):
     permission_classes = [
         permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
     ]
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def get(self, request: Request, *args, **kwargs):
         """
-        Performs a simple regex search for a matching application based on the user's first and last name. Creates a
-        new temporary column called "full_name" which is just "<FIRST_NAME> <LAST_NAME>", and then regex-searches the
-        query against the column, and returns all matches.
+        Searches for applications by the hacker's name or email (see `volunteer.search.search_applications`) and
+        returns the ranked matches. The number of results can be set with the "limit" parameter, up to
+        `MAX_SEARCH_RESULT_LIMIT`.
         """
-        query = request.GET.get("q")
-        matches = list(
-            Application.objects.annotate(
-                full_name=Concat("first_name", Value(" "), "last_name")
-            )
-            .filter(full_name__icontains=query)
-            .values("first_name", "last_name", email=F("user__email"))
-        )
-        return JsonResponse({"results": matches})
+        query = request.GET.get("q", "")
+        try:
+            limit = int(request.GET.get("limit", SEARCH_RESULT_LIMIT))
+        except ValueError:
+            return response.Response(status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, MAX_SEARCH_RESULT_LIMIT))
+        return JsonResponse({"results": search_applications(query, limit)})
 
 
 class UserSummaryView(views.APIView):
     permission_classes = [
         permissions.IsAuthenticated & (IsVolunteer | permissions.IsAdminUser)
     ]
-    authentication_classes = [authentication.TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
 
     def get(self, request: Request, *args, **kwargs):
         """
-        Compiles a summary about a specific user, given their email, and returns that summary as JSON. If the request
-        is malformed (i.e. missing the user's email), returns a Django Rest Framework Response with a 400 status
-        code. if successful, returns a response with status 200.
+        Compiles a summary about a specific user, given their badge or email, and returns that summary as JSON. If the
+        request is malformed (i.e. missing the user's badge or email), returns a Django Rest Framework Response with a
+        400 status code. if successful, returns a response with status 200.
+
+        The application and all of the event counts are fetched with a single aggregate query, and the dietary
+        restrictions recorded at the food line with one more.
         """
-        user_email = request.GET.get("email")
+        lookup = hacker_lookup(request.GET)
+        if not lookup:
+            return response.Response(status=status.HTTP_400_BAD_REQUEST)
 
-        user = get_object_or_404(get_user_model(), email=user_email)
+        meal_counts = {
+            meal_summary_key(meal, label): Count(
+                "user__foodevent",
+                filter=Q(user__foodevent__meal=meal),
+                distinct=True,
+            )
+            for meal, label in MEAL_CHOICES
+        }
         application: Application = get_object_or_404(
-            Application, user__email=user_email
+            Application.objects.annotate(
+                **meal_counts,
+                num_workshops=Count("user__workshopevent", distinct=True),
+            ),
+            **lookup,
         )
-
-        food_events = FoodEvent.objects.filter(user=user)
-        workshop_events = WorkshopEvent.objects.filter(user=user)
-        checked_in = application.status == STATUS_CHECKED_IN
+        restrictions = DietaryRestriction.objects.filter(
+            foodevent__user_id=application.user_id
+        ).distinct()
 
         return JsonResponse(
             {
-                "num_breakfast": food_events.filter(meal=BREAKFAST).count(),
-                "num_lunch": food_events.filter(meal=LUNCH).count(),
-                "num_dinner": food_events.filter(meal=DINNER).count(),
-                "num_midnight_snack": food_events.filter(meal=MIDNIGHT_SNACK).count(),
-                "num_breakfast_2": food_events.filter(meal=BREAKFAST_2).count(),
-                "num_lunch_2": food_events.filter(meal=LUNCH_2).count(),
-                "num_workshops": workshop_events.count(),
-                "checked_in": checked_in,
+                **{key: getattr(application, key) for key in meal_counts},
+                "num_workshops": application.num_workshops,
+                "checked_in": application.status == STATUS_CHECKED_IN,
                 "status": application.status,
-                "restrictions": [
-                    r.name for r in application.dietary_restrictions.all()
-                ],
+                "restrictions": [r.name for r in restrictions],
             }
         )